@@ -209,8 +209,8 @@ _db_var: contextvars.ContextVar[Database | None] = contextvars.ContextVar(
     default=None,
 )
 
-# LLM is safe at module level — creates a fresh httpx.AsyncClient per
-# request, no shared connection pool.
+# LLM is safe at module level — its pooled httpx.AsyncClient is kept per
+# event loop, so each worker gets its own connections.
 # Default: Ollama (no API key). Override with CHIRP_LLM=anthropic:claude-sonnet-4-20250514
 _LLM_PROVIDER = os.environ.get("CHIRP_LLM", "ollama:llama3")
 _IS_OLLAMA = _LLM_PROVIDER.startswith("ollama:")
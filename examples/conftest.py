@@ -1,14 +1,20 @@
 """Shared pytest configuration for chirp examples.
 
-Provides the ``example_app`` fixture that loads a fresh App instance
-from the ``app.py`` file in the same directory as the test.  Each call
+Provides the ``example_app`` fixture that loads an App instance from the
+``app.py`` file in the same directory as the test.  By default each call
 re-executes app.py in an isolated module namespace, so every test starts
 with clean state (e.g. the todo list is empty).
+
+Examples whose only per-test state is in-memory can opt out of the rebuild
+by defining a module-level ``reset_state()``: the module is then loaded once
+per session and ``reset_state()`` runs before each test instead, so route,
+tool, and template setup is not repeated.
 """
 
 import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
 
 import pytest
 
@@ -18,14 +24,32 @@ if str(_root) not in sys.path:
     sys.path.insert(0, str(_root))
 
 
-@pytest.fixture
-def example_app(request: pytest.FixtureRequest):
-    """Load a fresh App from the sibling app.py next to the test file."""
-    app_path = Path(request.path).parent / "app.py"
+def _load_example(app_path: Path) -> ModuleType:
+    """Execute *app_path* in a fresh module namespace."""
     module_name = f"example_{app_path.parent.name}"
     spec = importlib.util.spec_from_file_location(module_name, app_path)
     assert spec is not None
     assert spec.loader is not None
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def _example_modules() -> dict[Path, ModuleType]:
+    """Session cache of loaded example modules that define ``reset_state()``."""
+    return {}
+
+
+@pytest.fixture
+def example_app(request: pytest.FixtureRequest, _example_modules: dict[Path, ModuleType]):
+    """Return the App from the sibling app.py next to the test file."""
+    app_path = Path(request.path).parent / "app.py"
+    module = _example_modules.get(app_path)
+    if module is not None:
+        module.reset_state()
+        return module.app
+    module = _load_example(app_path)
+    if callable(getattr(module, "reset_state", None)):
+        _example_modules[app_path] = module
     return module.app
@@ -7,14 +7,6 @@ from chirp.testing import TestClient
 _FORM_CT = {"Content-Type": "application/x-www-form-urlencoded"}
 
 
-def _extract_cookie(response, name: str = "chirp_session") -> str | None:
-    """Extract a Set-Cookie value from response headers."""
-    for hname, hvalue in response.headers:
-        if hname.lower() == "set-cookie" and hvalue.startswith(f"{name}="):
-            return hvalue.split(";")[0].partition("=")[2]
-    return None
-
-
 def _extract_csrf_token(response) -> str:
     """Extract the CSRF token from a hidden input in the response body."""
     text = response.text
@@ -60,9 +52,8 @@ class TestProductionApp:
             assert response.status == 403
 
     async def test_contact_post_with_csrf_redirects(self, example_app) -> None:
-        async with TestClient(example_app) as client:
+        async with TestClient(example_app, persist_cookies=True) as client:
             page = await client.get("/")
-            cookie = _extract_cookie(page)
             token = _extract_csrf_token(page)
             body = urlencode(
                 {
@@ -75,15 +66,14 @@ class TestProductionApp:
             response = await client.post(
                 "/contact",
                 body=body,
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
+                headers=_FORM_CT,
             )
             assert response.status == 302
             assert "/thank-you" in response.header("location", "")
 
     async def test_thank_you_shows_name(self, example_app) -> None:
-        async with TestClient(example_app) as client:
+        async with TestClient(example_app, persist_cookies=True) as client:
             page = await client.get("/")
-            cookie = _extract_cookie(page)
             token = _extract_csrf_token(page)
             body = urlencode(
                 {
@@ -93,16 +83,12 @@ class TestProductionApp:
                     "message": "Hi",
                 }
             ).encode()
-            post_resp = await client.post(
+            await client.post(
                 "/contact",
                 body=body,
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
-            )
-            new_cookie = _extract_cookie(post_resp) or cookie
-            response = await client.get(
-                "/thank-you",
-                headers={"Cookie": f"chirp_session={new_cookie}"},
+                headers=_FORM_CT,
             )
+            response = await client.get("/thank-you")
             assert response.status == 200
             assert "Thank you" in response.text
             assert "Bob" in response.text
@@ -5,14 +5,6 @@ from chirp.testing import TestClient
 _FORM_CT = {"Content-Type": "application/x-www-form-urlencoded"}
 
 
-def _extract_cookie(response, name: str = "chirp_session") -> str | None:
-    """Extract a Set-Cookie value from response headers."""
-    for hname, hvalue in response.headers:
-        if hname == "set-cookie" and hvalue.startswith(f"{name}="):
-            return hvalue.split(";")[0].partition("=")[2]
-    return None
-
-
 def _extract_csrf_token(response) -> str:
     """Extract the CSRF token from a hidden input in the response body."""
     text = response.text
@@ -71,10 +63,9 @@ class TestValidation:
 
     async def test_empty_fields_required(self, example_app) -> None:
         """All empty fields produce 'required' errors."""
-        async with TestClient(example_app) as client:
+        async with TestClient(example_app, persist_cookies=True) as client:
             # Get CSRF token first
             page = await client.get("/signup")
-            cookie = _extract_cookie(page)
             token = _extract_csrf_token(page)
 
             response = await client.post(
@@ -86,57 +77,53 @@ class TestValidation:
                     confirm="",
                     csrf_token=token,
                 ),
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
+                headers=_FORM_CT,
             )
             assert response.status == 422
             assert "required" in response.text.lower()
 
     async def test_username_too_short(self, example_app) -> None:
-        async with TestClient(example_app) as client:
+        async with TestClient(example_app, persist_cookies=True) as client:
             page = await client.get("/signup")
-            cookie = _extract_cookie(page)
             token = _extract_csrf_token(page)
 
             response = await client.post(
                 "/signup",
                 body=_build_signup_body(username="ab", csrf_token=token),
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
+                headers=_FORM_CT,
             )
             assert response.status == 422
             assert "at least 3" in response.text.lower()
 
     async def test_invalid_email(self, example_app) -> None:
-        async with TestClient(example_app) as client:
+        async with TestClient(example_app, persist_cookies=True) as client:
             page = await client.get("/signup")
-            cookie = _extract_cookie(page)
             token = _extract_csrf_token(page)
 
             response = await client.post(
                 "/signup",
                 body=_build_signup_body(email="not-an-email", csrf_token=token),
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
+                headers=_FORM_CT,
             )
             assert response.status == 422
             assert "valid email" in response.text.lower()
 
     async def test_password_too_short(self, example_app) -> None:
-        async with TestClient(example_app) as client:
+        async with TestClient(example_app, persist_cookies=True) as client:
             page = await client.get("/signup")
-            cookie = _extract_cookie(page)
             token = _extract_csrf_token(page)
 
             response = await client.post(
                 "/signup",
                 body=_build_signup_body(password="short", confirm="short", csrf_token=token),
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
+                headers=_FORM_CT,
             )
             assert response.status == 422
             assert "at least 8" in response.text.lower()
 
     async def test_passwords_dont_match(self, example_app) -> None:
-        async with TestClient(example_app) as client:
+        async with TestClient(example_app, persist_cookies=True) as client:
             page = await client.get("/signup")
-            cookie = _extract_cookie(page)
             token = _extract_csrf_token(page)
 
             response = await client.post(
@@ -146,21 +133,20 @@ class TestValidation:
                     confirm="different123",
                     csrf_token=token,
                 ),
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
+                headers=_FORM_CT,
             )
             assert response.status == 422
             assert "do not match" in response.text.lower()
 
     async def test_invalid_username_chars(self, example_app) -> None:
-        async with TestClient(example_app) as client:
+        async with TestClient(example_app, persist_cookies=True) as client:
             page = await client.get("/signup")
-            cookie = _extract_cookie(page)
             token = _extract_csrf_token(page)
 
             response = await client.post(
                 "/signup",
                 body=_build_signup_body(username="bad user!", csrf_token=token),
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
+                headers=_FORM_CT,
             )
             assert response.status == 422
             assert "underscores" in response.text.lower()
@@ -171,14 +157,13 @@ class TestCSRF:
 
     async def test_missing_csrf_token_rejected(self, example_app) -> None:
         """POST without CSRF token gets 403."""
-        async with TestClient(example_app) as client:
-            page = await client.get("/signup")
-            cookie = _extract_cookie(page)
+        async with TestClient(example_app, persist_cookies=True) as client:
+            await client.get("/signup")
 
             response = await client.post(
                 "/signup",
                 body=b"username=test&email=t%40t.com&password=12345678&confirm_password=12345678",
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
+                headers=_FORM_CT,
             )
             assert response.status == 403
 
@@ -187,63 +172,55 @@ class TestRegistrationFlow:
     """Full registration → welcome page flow."""
 
     async def test_successful_signup_redirects(self, example_app) -> None:
-        async with TestClient(example_app) as client:
+        async with TestClient(example_app, persist_cookies=True) as client:
             page = await client.get("/signup")
-            cookie = _extract_cookie(page)
             token = _extract_csrf_token(page)
 
             response = await client.post(
                 "/signup",
                 body=_build_signup_body(csrf_token=token),
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
+                headers=_FORM_CT,
             )
             assert response.status == 302
             assert "/welcome" in response.header("location", "")
 
     async def test_welcome_page_shows_username(self, example_app) -> None:
-        async with TestClient(example_app) as client:
+        async with TestClient(example_app, persist_cookies=True) as client:
             # Register
             page = await client.get("/signup")
-            cookie = _extract_cookie(page)
             token = _extract_csrf_token(page)
 
-            r1 = await client.post(
+            await client.post(
                 "/signup",
                 body=_build_signup_body(username="janedoe", csrf_token=token),
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
+                headers=_FORM_CT,
             )
-            new_cookie = _extract_cookie(r1) or cookie
 
             # Visit welcome page
-            r2 = await client.get(
-                "/welcome",
-                headers={"Cookie": f"chirp_session={new_cookie}"},
-            )
+            r2 = await client.get("/welcome")
             assert r2.status == 200
             assert "janedoe" in r2.text
 
     async def test_duplicate_username_rejected(self, example_app) -> None:
-        async with TestClient(example_app) as client:
+        async with TestClient(example_app, persist_cookies=True) as client:
             # Register first user
             page = await client.get("/signup")
-            cookie = _extract_cookie(page)
             token = _extract_csrf_token(page)
 
             await client.post(
                 "/signup",
                 body=_build_signup_body(username="taken_user", csrf_token=token),
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie}"},
+                headers=_FORM_CT,
             )
 
             # Get a fresh page + token for second attempt
             page2 = await client.get("/signup")
-            cookie2 = _extract_cookie(page2)
             token2 = _extract_csrf_token(page2)
 
             response = await client.post(
                 "/signup",
                 body=_build_signup_body(username="taken_user", csrf_token=token2),
-                headers={**_FORM_CT, "Cookie": f"chirp_session={cookie2}"},
+                headers=_FORM_CT,
             )
             assert response.status == 422
             assert "already taken" in response.text.lower()
@@ -17,10 +17,25 @@ Try the MCP endpoint with curl:
         -d '{"jsonrpc":"2.0","method":"tools/call","id":2,"params":{"name":"add_note","arguments":{"text":"Hello from an agent!","tag":"mcp"}}}'
 """
 
+import itertools
+import json
+import queue
 import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 
-from chirp import App, AppConfig, EventStream, Fragment, Request, Template
+from chirp import (
+    App,
+    AppConfig,
+    EventStream,
+    Fragment,
+    Request,
+    Response,
+    SSEEvent,
+    Template,
+)
+from chirp.tools import ToolCallEvent
 
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
@@ -31,9 +46,102 @@ app = App(config=config)
 # In-memory storage — thread-safe for free-threading
 # ---------------------------------------------------------------------------
 
-_notes: list[dict] = []
-_lock = threading.Lock()
-_next_id = 1
+
+@dataclass(frozen=True, slots=True)
+class Note:
+    id: int
+    text: str
+    tag: str | None = None
+
+    def to_dict(self) -> dict:
+        """Plain-dict form for MCP tool results."""
+        return {"id": self.id, "text": self.text, "tag": self.tag}
+
+
+# text, tag, lowercased UTF-8 text, trigrams, and the slot the Note lands in
+type _PendingNote = tuple[str, str | None, bytes, set[str], list[Note]]
+
+
+class _NoteStore:
+    """All note state, held together so it can be replaced in one step.
+
+    Each tool call binds the current store once, so ``reset_state()``
+    swapping in a fresh store never mixes two stores mid-operation.
+    """
+
+    __slots__ = (
+        "json",
+        "lock",
+        "lower",
+        "next_id",
+        "notes",
+        "pending",
+        "snapshot",
+        "trigrams",
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # Prepared writes waiting to be published, each with a slot that
+        # receives its Note. Whoever holds ``lock`` next publishes everything
+        # queued, so concurrent writers share one snapshot/JSON rebuild
+        # instead of each paying for their own.
+        self.pending: queue.SimpleQueue[_PendingNote] = queue.SimpleQueue()
+        # Ids are allocated as notes are published, under ``lock``, so the
+        # notes list (and every listing and search built from it) stays in
+        # id order however concurrent writers interleave.
+        self.next_id = itertools.count(1).__next__
+        self.notes: list[Note] = []
+        # Published read views, rebound (never mutated) on every write. Readers
+        # take the current binding without locking; ``list_notes`` hands MCP
+        # clients the pre-serialized JSON so repeated reads skip ``json.dumps``.
+        self.snapshot: tuple[Note, ...] = ()
+        self.json = "[]"
+        # Lowercased UTF-8 note text, parallel to ``notes`` — computed once per
+        # write so searches never re-lowercase the corpus. Substring tests on
+        # UTF-8 bytes agree with tests on the decoded text and skip the
+        # str kind/width handling.
+        self.lower: list[bytes] = []
+        # Inverted trigram index: 3-char lowercase substring → positions in ``notes``.
+        self.trigrams: dict[str, set[int]] = {}
+
+
+_store = _NoteStore()
+
+
+def reset_state() -> None:
+    """Drop all notes and cached views (used by the example test suite)."""
+    global _store
+    _store = _NoteStore()
+
+
+def _publish_pending(store: _NoteStore) -> None:
+    """Apply every queued write, then rebuild the read views once. Caller holds the lock."""
+    published = False
+    while True:
+        try:
+            text, tag, lower, grams, slot = store.pending.get_nowait()
+        except queue.Empty:
+            break
+        note = Note(id=store.next_id(), text=text, tag=tag)
+        slot.append(note)
+        position = len(store.notes)
+        store.notes.append(note)
+        store.lower.append(lower)
+        for gram in grams:
+            store.trigrams.setdefault(gram, set()).add(position)
+        published = True
+    if published:
+        store.snapshot = tuple(store.notes)
+        # Compact and raw UTF-8, like every other tool result the MCP handler encodes
+        store.json = json.dumps(
+            [n.to_dict() for n in store.notes], separators=(",", ":"), ensure_ascii=False
+        )
+
+
+def _trigrams_of(text: str) -> set[str]:
+    """Return every 3-character substring of *text*."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
 
 
 # ---------------------------------------------------------------------------
@@ -43,25 +151,41 @@ _next_id = 1
 
 @app.tool("add_note", description="Add a note with an optional tag.")
 def add_note(text: str, tag: str | None = None) -> dict:
-    global _next_id
-    with _lock:
-        note = {"id": _next_id, "text": text, "tag": tag}
-        _next_id += 1
-        _notes.append(note)
-        return note
+    store = _store
+    # Everything that only depends on this note happens outside the lock.
+    lower = text.lower()
+    slot: list[Note] = []
+    store.pending.put((text, tag, lower.encode("utf-8"), _trigrams_of(lower), slot))
+    # Once we hold the lock our note is published — either an earlier holder
+    # already drained it, or we do now — so callers still read their writes.
+    with store.lock:
+        _publish_pending(store)
+    return slot[0].to_dict()
 
 
 @app.tool("list_notes", description="List all notes.")
-def list_notes() -> list[dict]:
-    with _lock:
-        return list(_notes)
+def list_notes() -> str:
+    return _store.json
 
 
 @app.tool("search_notes", description="Search notes by text substring.")
 def search_notes(query: str) -> list[dict]:
-    with _lock:
+    store = _store
+    with store.lock:
         q = query.lower()
-        return [n for n in _notes if q in n["text"].lower()]
+        q_bytes = q.encode("utf-8")
+        grams = _trigrams_of(q)
+        if not grams:
+            # Too short to index — fall back to a scan.
+            return [
+                n.to_dict()
+                for n, lower in zip(store.notes, store.lower, strict=True)
+                if q_bytes in lower
+            ]
+        postings = sorted((store.trigrams.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        # Trigram hits are necessary, not sufficient — verify each candidate.
+        return [store.notes[i].to_dict() for i in sorted(candidates) if q_bytes in store.lower[i]]
 
 
 # ---------------------------------------------------------------------------
@@ -69,15 +193,18 @@ def search_notes(query: str) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
+# Per-type argument formatters. MCP arguments are decoded JSON, so exact
+# type lookup covers them — strings are quoted, everything else is bare.
+_ARG_FORMATS = {str: '{}="{}"'.format}
+_format_bare = "{}={}".format
+
+
 @app.template_filter("format_args")
 def format_args(args: dict) -> str:
     """Format tool call arguments for display."""
     if not args:
         return "\u2014"
-    parts = []
-    for k, v in args.items():
-        parts.append(f'{k}="{v}"' if isinstance(v, str) else f"{k}={v}")
-    return ", ".join(parts)
+    return ", ".join(_ARG_FORMATS.get(type(v), _format_bare)(k, v) for k, v in args.items())
 
 
 # ---------------------------------------------------------------------------
@@ -85,21 +212,53 @@ def format_args(args: dict) -> str:
 # ---------------------------------------------------------------------------
 
 
+# The page with no notes never changes — render it once, on first use.
+_empty_index: Response | None = None
+
+
 @app.route("/")
 def index():
     """Full page — notes list and activity feed."""
-    return Template("notes.html", notes=list_notes())
+    global _empty_index
+    notes = _store.snapshot
+    if notes:
+        return Template("notes.html", notes=notes)
+    if _empty_index is None:
+        html = app.render(Template("notes.html", notes=()))
+        _empty_index = Response(body=html, render_intent="full_page")
+    return _empty_index
 
 
 @app.route("/notes", methods=["POST"])
 async def post_note(request: Request):
     """Add a note via form submission — returns the notes list fragment."""
-    form = await request.form()
-    text = (form.get("text") or "").strip()
-    tag = (form.get("tag") or "").strip() or None
+    text, tag = await request.form_fields("text", "tag")
     if text:
-        add_note(text, tag=tag)
-    return Fragment("notes.html", "note_list", notes=list_notes())
+        add_note(text, tag=tag or None)
+    return Fragment("notes.html", "note_list", notes=_store.snapshot)
+
+
+# Rendered activity rows keyed by call_id. Every /feed subscriber receives
+# the same event, so the first one to see it renders the row and the rest
+# reuse the frame. Bounded to the most recent events.
+_activity_frames: OrderedDict[str, SSEEvent] = OrderedDict()
+_activity_frames_lock = threading.Lock()
+_ACTIVITY_FRAMES_MAX = 64
+
+
+def _activity_frame(event: ToolCallEvent) -> SSEEvent:
+    """Return the SSE frame for *event*, rendering it at most once."""
+    with _activity_frames_lock:
+        frame = _activity_frames.get(event.call_id)
+    if frame is not None:
+        return frame
+    html = app.render(Fragment("notes.html", "activity_row", event=event)).strip()
+    frame = SSEEvent(data=html, event="fragment")
+    with _activity_frames_lock:
+        _activity_frames[event.call_id] = frame
+        while len(_activity_frames) > _ACTIVITY_FRAMES_MAX:
+            _activity_frames.popitem(last=False)
+    return frame
 
 
 @app.route("/feed", referenced=True)
@@ -108,7 +267,7 @@ def feed():
 
     async def generate():
         async for event in app.tool_events.subscribe():
-            yield Fragment("notes.html", "activity_row", event=event)
+            yield _activity_frame(event)
 
     return EventStream(generate())
 
@@ -113,6 +113,23 @@ class TestToolCalls:
             assert len(notes) == 1
             assert notes[0]["text"] == "Buy milk"
 
+    async def test_list_encodes_notes_like_add_note(self, example_app) -> None:
+        async with TestClient(example_app) as client:
+            response = await client.post(
+                "/mcp",
+                json=_mcp(
+                    "tools/call",
+                    params={"name": "add_note", "arguments": {"text": "Café ✓", "tag": "x"}},
+                ),
+            )
+            added = json.loads(response.text)["result"]["content"][0]["text"]
+            response = await client.post(
+                "/mcp",
+                json=_mcp("tools/call", params={"name": "list_notes", "arguments": {}}),
+            )
+            listed = json.loads(response.text)["result"]["content"][0]["text"]
+            assert listed == f"[{added}]"
+
     async def test_add_with_tag(self, example_app) -> None:
         async with TestClient(example_app) as client:
             response = await client.post(
@@ -160,6 +177,32 @@ class TestToolCalls:
             assert len(results) == 1
             assert results[0]["text"] == "Buy milk"
 
+    async def test_search_is_case_insensitive_for_short_and_long_queries(self, example_app) -> None:
+        async with TestClient(example_app) as client:
+            for text in ("Buy Milk", "Read book", "milkshake recipe"):
+                await client.post(
+                    "/mcp",
+                    json=_mcp(
+                        "tools/call",
+                        params={"name": "add_note", "arguments": {"text": text}},
+                    ),
+                )
+
+            for query, expected in (
+                ("MILK", {"Buy Milk", "milkshake recipe"}),
+                ("ok", {"Read book"}),
+            ):
+                response = await client.post(
+                    "/mcp",
+                    json=_mcp(
+                        "tools/call",
+                        params={"name": "search_notes", "arguments": {"query": query}},
+                    ),
+                )
+                body = json.loads(response.text)
+                results = json.loads(body["result"]["content"][0]["text"])
+                assert {n["text"] for n in results} == expected
+
     async def test_unknown_tool_returns_error(self, example_app) -> None:
         async with TestClient(example_app) as client:
             response = await client.post(
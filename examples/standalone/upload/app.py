@@ -20,14 +20,31 @@ Run:
     python app.py
 """
 
+import asyncio
+import contextlib
+import hashlib
+import itertools
 import os
 import threading
-import time
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
 from pathlib import Path
-
-from chirp import App, AppConfig, Redirect, Request, Template, ValidationError
+from typing import Any
+
+from chirp import (
+    App,
+    AppConfig,
+    HTTPError,
+    Redirect,
+    Request,
+    Response,
+    Template,
+    ValidationError,
+)
+from chirp.http.forms import UploadFile
 from chirp.middleware.csrf import CSRFConfig, CSRFMiddleware, csrf_field
+from chirp.middleware.protocol import AnyResponse, Next
 from chirp.middleware.sessions import SessionConfig, SessionMiddleware
 from chirp.middleware.static import StaticFiles
 from chirp.validation import max_length, required, validate
@@ -40,6 +57,9 @@ UPLOADS_DIR.mkdir(exist_ok=True)
 
 _ALLOWED_TYPES = frozenset({"image/jpeg", "image/png", "image/gif", "image/webp"})
 _MAX_FILE_SIZE = 5 * 1024 * 1024  # 5 MB
+# Whole-body cap: the file plus generous room for the text fields and framing.
+_MAX_UPLOAD_BODY = _MAX_FILE_SIZE + 64 * 1024
+_TOO_LARGE = "File must be smaller than 5 MB"
 
 # ---------------------------------------------------------------------------
 # App setup
@@ -50,6 +70,42 @@ app = App(config=config)
 
 _secret = os.environ.get("SESSION_SECRET_KEY", "dev-only-not-for-production")
 
+
+async def upload_size_guard(request: Request, next: Next) -> AnyResponse:
+    """Cap the upload body at ``_MAX_UPLOAD_BODY`` before the form is parsed.
+
+    Registered first so it runs before ``CSRFMiddleware``, which reads and
+    parses the whole form to find the token — by the time the handler runs,
+    the body has already been buffered. A declared ``Content-Length`` over
+    the cap is answered with 413 before any body is read. Otherwise the body
+    is counted as it arrives (a chunked body declares no length) and the
+    request fails with 413 as soon as it passes the cap.
+    """
+    if request.method == "POST" and request.path == "/upload":
+        length = request.content_length
+        if length is not None and length > _MAX_UPLOAD_BODY:
+            return Response(_TOO_LARGE).with_status(413)
+        # Downstream reads (CSRF's form parse included) go through the cap
+        request = replace(request, _receive=_capped_receive(request._receive))
+    return await next(request)
+
+
+def _capped_receive(receive: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Any]]:
+    """Wrap an ASGI *receive* to raise 413 once the body passes the cap."""
+    received = 0
+
+    async def capped() -> Any:
+        nonlocal received
+        message = await receive()
+        received += len(message.get("body", b""))
+        if received > _MAX_UPLOAD_BODY:
+            raise HTTPError(413, _TOO_LARGE)
+        return message
+
+    return capped
+
+
+app.add_middleware(upload_size_guard)
 app.add_middleware(SessionMiddleware(SessionConfig(secret_key=_secret)))
 app.add_middleware(CSRFMiddleware(CSRFConfig()))
 app.add_middleware(StaticFiles(directory=str(UPLOADS_DIR), prefix="/uploads"))
@@ -75,47 +131,127 @@ class Photo:
 # In-memory storage
 # ---------------------------------------------------------------------------
 
-_photos: list[Photo] = []
-_lock = threading.Lock()
-_next_id = 1
-
-
-def _get_photos() -> list[Photo]:
-    with _lock:
-        return list(reversed(_photos))
+# Photos by id, in upload order (O(1) lookup, add and delete). The gallery's
+# newest-first tuple is built on the first read after a change, so writers
+# only drop it. Readers take the last published tuple without locking.
+_photos: dict[int, Photo] = {}
+_photos_view: tuple[Photo, ...] | None = ()
+# Photos using each stored file (identical uploads share one), counting
+# uploads still waiting on the file's first write.
+_file_refs: dict[str, int] = {}
+# Disk work in flight per stored file: its first write, or its deletion.
+# Claimers wait on it, so no photo links a partial or vanishing file.
+_file_ops: dict[str, Future[None]] = {}
+_write_lock = threading.Lock()
+_next_id = itertools.count(1).__next__
+
+
+def _get_photos() -> tuple[Photo, ...]:
+    global _photos_view
+    view = _photos_view
+    if view is None:
+        with _write_lock:
+            view = _photos_view
+            if view is None:
+                view = _photos_view = tuple(reversed(_photos.values()))
+    return view
 
 
 def _get_photo(photo_id: int) -> Photo | None:
-    with _lock:
-        for p in _photos:
-            if p.id == photo_id:
-                return p
-        return None
+    return _photos.get(photo_id)
 
 
 def _add_photo(title: str, description: str, filename: str, content_type: str, size: int) -> Photo:
-    global _next_id
-    with _lock:
-        photo = Photo(
-            id=_next_id,
-            title=title,
-            description=description,
-            filename=filename,
-            content_type=content_type,
-            size=size,
-        )
-        _next_id += 1
-        _photos.append(photo)
-        return photo
+    global _photos_view
+    # count.__next__ is a single atomic C call — the id needs no lock.
+    photo = Photo(
+        id=_next_id(),
+        title=title,
+        description=description,
+        filename=filename,
+        content_type=content_type,
+        size=size,
+    )
+    with _write_lock:
+        _photos[photo.id] = photo
+        _photos_view = None
+    return photo
 
 
 def _delete_photo(photo_id: int) -> Photo | None:
-    with _lock:
-        for i, p in enumerate(_photos):
-            if p.id == photo_id:
-                _photos.pop(i)
-                return p
-        return None
+    global _photos_view
+    with _write_lock:
+        photo = _photos.pop(photo_id, None)
+        if photo is not None:
+            _photos_view = None
+    return photo
+
+
+async def _store_file(upload: UploadFile, filename: str) -> None:
+    """Count one more photo using *filename*, once the file is fully written.
+
+    The first claimer writes the file; identical uploads wait for that write
+    and share it. If the write fails, the partial file is removed and every
+    claimer waiting on it fails too.
+    """
+    while True:
+        with _write_lock:
+            op = _file_ops.get(filename)
+            refs = _file_refs.get(filename, 0)
+            if refs or op is None:
+                _file_refs[filename] = refs + 1
+                if not refs:
+                    op = _file_ops[filename] = Future()
+                break
+        # The file is being deleted (or a failed write cleaned up); claim afresh
+        with contextlib.suppress(Exception):
+            await asyncio.wrap_future(op)
+    if refs:
+        if op is not None:
+            try:
+                await asyncio.wrap_future(op)  # shared file still being written
+            except asyncio.CancelledError:
+                # Hand the claim back once the write lands; a failed write
+                # has already dropped every claim
+                def give_back(written: Future[None]) -> None:
+                    if written.exception() is None:
+                        _release_file(filename)
+
+                op.add_done_callback(give_back)
+                raise
+        return
+    try:
+        await upload.save(UPLOADS_DIR / filename)
+    except BaseException as exc:
+        with _write_lock:
+            del _file_refs[filename]
+        _unlink_file(filename, op)
+        op.set_exception(exc if isinstance(exc, Exception) else OSError("upload interrupted"))
+        raise
+    with _write_lock:
+        del _file_ops[filename]
+    op.set_result(None)
+
+
+def _release_file(filename: str) -> None:
+    """Drop one use of *filename*, deleting the file along with its last user."""
+    with _write_lock:
+        refs = _file_refs.pop(filename) - 1
+        if refs:
+            _file_refs[filename] = refs
+            return
+        op = _file_ops[filename] = Future()
+    _unlink_file(filename, op)
+    op.set_result(None)
+
+
+def _unlink_file(filename: str, op: Future[None]) -> None:
+    """Delete *filename* outside the lock; *op* keeps new claimers waiting."""
+    try:
+        (UPLOADS_DIR / filename).unlink(missing_ok=True)
+    finally:
+        with _write_lock:
+            del _file_ops[filename]
 
 
 # ---------------------------------------------------------------------------
@@ -123,12 +259,9 @@ def _delete_photo(photo_id: int) -> Photo | None:
 # ---------------------------------------------------------------------------
 
 
-def _unique_filename(original: str) -> str:
-    """Generate a unique filename to avoid collisions."""
-    stem = Path(original).stem
-    suffix = Path(original).suffix
-    timestamp = int(time.time() * 1000)
-    return f"{stem}_{timestamp}{suffix}"
+def _content_filename(content: bytes, original: str) -> str:
+    """Name a file by its SHA-256 so identical uploads share one file on disk."""
+    return hashlib.sha256(content).hexdigest() + Path(original).suffix
 
 
 # No custom filesize filter needed — Kida ships ``filesizeformat`` built-in.
@@ -149,6 +282,7 @@ def gallery():
 @app.route("/upload", methods=["POST"])
 async def upload_photo(request: Request):
     """Handle photo upload with validation."""
+    photos = _get_photos()
     form = await request.form()
 
     form_values = {
@@ -165,16 +299,20 @@ async def upload_photo(request: Request):
         },
     )
 
-    errors = dict(result.errors) if not result else {}
-
     # Validate file
     upload = form.files.get("photo")
+    photo_error = None
     if upload is None or not upload.filename:
-        errors["photo"] = ["Please select a photo to upload"]
+        photo_error = "Please select a photo to upload"
     elif upload.content_type not in _ALLOWED_TYPES:
-        errors["photo"] = ["Only JPEG, PNG, GIF, and WebP images are allowed"]
+        photo_error = "Only JPEG, PNG, GIF, and WebP images are allowed"
     elif upload.size > _MAX_FILE_SIZE:
-        errors["photo"] = ["File must be smaller than 5 MB"]
+        photo_error = _TOO_LARGE
+
+    # The template only reads errors — copy the validator's dict only to add to it.
+    errors = result.errors
+    if photo_error is not None:
+        errors = errors | {"photo": [photo_error]}
 
     if errors:
         return ValidationError(
@@ -182,13 +320,13 @@ async def upload_photo(request: Request):
             "upload_form",
             errors=errors,
             form=form_values,
-            photos=_get_photos(),
+            photos=photos,
         )
 
     # Save to disk
     assert upload is not None
-    filename = _unique_filename(upload.filename)
-    await upload.save(UPLOADS_DIR / filename)
+    filename = _content_filename(await upload.read(), upload.filename)
+    await _store_file(upload, filename)
 
     # Store metadata
     _add_photo(
@@ -216,9 +354,7 @@ def delete_photo_route(photo_id: int):
     """Delete a photo and its file."""
     photo = _delete_photo(photo_id)
     if photo is not None:
-        file_path = UPLOADS_DIR / photo.filename
-        if file_path.exists():
-            file_path.unlink()
+        _release_file(photo.filename)
     return Redirect("/")
 
 
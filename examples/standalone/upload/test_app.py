@@ -1,11 +1,14 @@
 """Tests for the upload example — multipart file uploads, validation, gallery."""
 
+import asyncio
+import re
 from pathlib import Path
 
 import pytest
 
 from chirp.testing import TestClient
 
+_CSRF_RE = re.compile(rb'name="_csrf_token" value="([^"]*)"')
 _FORM_CT = {"Content-Type": "application/x-www-form-urlencoded"}
 
 UPLOADS_DIR = Path(__file__).parent / "uploads"
@@ -29,13 +32,20 @@ def _extract_cookie(response, name: str = "chirp_session") -> str | None:
 
 
 def _extract_csrf_token(response) -> str:
-    text = response.text
-    marker = 'name="_csrf_token" value="'
-    start = text.find(marker)
-    assert start != -1, "CSRF token not found"
-    start += len(marker)
-    end = text.find('"', start)
-    return text[start:end]
+    match = _CSRF_RE.search(response.body_bytes)
+    assert match is not None, "CSRF token not found"
+    return match.group(1).decode()
+
+
+# Static multipart framing, built once; only field values vary per call.
+_BOUNDARY = b"----TestBoundary123"
+_DELIM = b"--" + _BOUNDARY + b"\r\n"
+_MULTIPART_CT = f"multipart/form-data; boundary={_BOUNDARY.decode()}"
+_CSRF_PART = _DELIM + b'Content-Disposition: form-data; name="_csrf_token"\r\n\r\n'
+_TITLE_PART = b"\r\n" + _DELIM + b'Content-Disposition: form-data; name="title"\r\n\r\n'
+_DESC_PART = b"\r\n" + _DELIM + b'Content-Disposition: form-data; name="description"\r\n\r\n'
+_FILE_PART = b"\r\n" + _DELIM + b'Content-Disposition: form-data; name="photo"; filename="%s"\r\n'
+_CLOSE = b"\r\n--" + _BOUNDARY + b"--\r\n"
 
 
 def _build_multipart_body(
@@ -48,39 +58,22 @@ def _build_multipart_body(
     include_file: bool = True,
 ) -> tuple[bytes, str]:
     """Build a multipart/form-data body. Returns (body, content_type)."""
-    boundary = "----TestBoundary123"
-    parts: list[bytes] = []
-
-    # CSRF token
-    parts.append(f"--{boundary}\r\n".encode())
-    parts.append(b'Content-Disposition: form-data; name="_csrf_token"\r\n\r\n')
-    parts.append(f"{csrf_token}\r\n".encode())
-
-    # Title
-    parts.append(f"--{boundary}\r\n".encode())
-    parts.append(b'Content-Disposition: form-data; name="title"\r\n\r\n')
-    parts.append(f"{title}\r\n".encode())
-
-    # Description
-    parts.append(f"--{boundary}\r\n".encode())
-    parts.append(b'Content-Disposition: form-data; name="description"\r\n\r\n')
-    parts.append(f"{description}\r\n".encode())
-
-    # File
+    parts = [
+        _CSRF_PART,
+        csrf_token.encode(),
+        _TITLE_PART,
+        title.encode(),
+        _DESC_PART,
+        description.encode(),
+    ]
     if include_file:
-        parts.append(f"--{boundary}\r\n".encode())
-        parts.append(
-            f'Content-Disposition: form-data; name="photo"; filename="{filename}"\r\n'.encode()
+        parts += (
+            _FILE_PART % filename.encode(),
+            b"Content-Type: %s\r\n\r\n" % file_content_type.encode(),
+            file_content,
         )
-        parts.append(f"Content-Type: {file_content_type}\r\n\r\n".encode())
-        parts.append(file_content)
-        parts.append(b"\r\n")
-
-    parts.append(f"--{boundary}--\r\n".encode())
-
-    body = b"".join(parts)
-    content_type = f"multipart/form-data; boundary={boundary}"
-    return body, content_type
+    parts.append(_CLOSE)
+    return b"".join(parts), _MULTIPART_CT
 
 
 class TestGalleryPage:
@@ -152,6 +145,23 @@ class TestUploadValidation:
             assert response.status == 422
             assert "JPEG" in response.text or "allowed" in response.text.lower()
 
+    async def test_oversized_body_rejected_before_parsing(self, example_app) -> None:
+        async with TestClient(example_app) as client:
+            body, ct = _build_multipart_body()
+            response = await client.post(
+                "/upload",
+                body=body,
+                headers={"Content-Type": ct, "Content-Length": str(6 * 1024 * 1024)},
+            )
+            assert response.status == 413
+
+    async def test_oversized_body_without_length_rejected(self, example_app) -> None:
+        async with TestClient(example_app) as client:
+            body, ct = _build_multipart_body(file_content=b"\x00" * (6 * 1024 * 1024))
+            response = await client.post("/upload", body=body, headers={"Content-Type": ct})
+            assert response.status == 413
+            assert not [f for f in UPLOADS_DIR.iterdir() if f.name != ".gitkeep"]
+
 
 class TestUploadSuccess:
     """POST /upload — successful upload flow."""
@@ -207,6 +217,93 @@ class TestUploadSuccess:
             files = [f for f in UPLOADS_DIR.iterdir() if f.is_file() and f.name != ".gitkeep"]
             assert len(files) >= 1
 
+    async def test_duplicate_upload_shares_one_file(self, example_app) -> None:
+        async with TestClient(example_app) as client:
+            page = await client.get("/")
+            cookie = _extract_cookie(page)
+            token = _extract_csrf_token(page)
+            headers = {"Cookie": f"chirp_session={cookie}"}
+
+            for title in ("First", "Second"):
+                body, ct = _build_multipart_body(title=title, csrf_token=token)
+                await client.post("/upload", body=body, headers={**headers, "Content-Type": ct})
+
+            files = [f for f in UPLOADS_DIR.iterdir() if f.is_file() and f.name != ".gitkeep"]
+            assert len(files) == 1
+            gallery = await client.get("/")
+            assert "First" in gallery.text
+            assert "Second" in gallery.text
+
+            # Deleting one photo keeps the file the other still uses
+            await client.post(
+                "/photos/1/delete",
+                body=f"_csrf_token={token}".encode(),
+                headers={**headers, **_FORM_CT},
+            )
+            assert files[0].exists()
+
+            # ...and deleting the last one removes it
+            await client.post(
+                "/photos/2/delete",
+                body=f"_csrf_token={token}".encode(),
+                headers={**headers, **_FORM_CT},
+            )
+            assert not files[0].exists()
+
+
+class _SlowUpload:
+    """Stands in for ``UploadFile``: writes part of the file, then waits."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.started = asyncio.Event()
+        self.finish = asyncio.Event()
+
+    async def save(self, path: Path) -> None:
+        path.write_bytes(b"part")
+        self.started.set()
+        await self.finish.wait()
+        if self.fail:
+            raise OSError("disk full")
+        path.write_bytes(b"part-and-rest")
+
+
+class TestSharedFileWrites:
+    """Identical uploads share a file only once its write has finished."""
+
+    async def test_identical_upload_waits_for_first_write(self, example_module) -> None:
+        first = _SlowUpload()
+        writing = asyncio.create_task(example_module._store_file(first, "x.png"))
+        await first.started.wait()
+        sharing = asyncio.create_task(example_module._store_file(_SlowUpload(), "x.png"))
+        await asyncio.sleep(0.01)
+        assert not sharing.done()
+
+        first.finish.set()
+        await asyncio.gather(writing, sharing)
+        assert (UPLOADS_DIR / "x.png").read_bytes() == b"part-and-rest"
+        assert example_module._file_refs == {"x.png": 2}
+
+        example_module._release_file("x.png")
+        assert (UPLOADS_DIR / "x.png").exists()
+        example_module._release_file("x.png")
+        assert not (UPLOADS_DIR / "x.png").exists()
+        assert not example_module._file_ops
+
+    async def test_failed_write_fails_every_claimer(self, example_module) -> None:
+        first = _SlowUpload(fail=True)
+        writing = asyncio.create_task(example_module._store_file(first, "x.png"))
+        await first.started.wait()
+        sharing = asyncio.create_task(example_module._store_file(_SlowUpload(), "x.png"))
+        await asyncio.sleep(0.01)
+
+        first.finish.set()
+        results = await asyncio.gather(writing, sharing, return_exceptions=True)
+        assert [type(result) for result in results] == [OSError, OSError]
+        assert not (UPLOADS_DIR / "x.png").exists()
+        assert not example_module._file_refs
+        assert not example_module._file_ops
+
 
 class TestPhotoDetail:
     """GET /photos/{id} — single photo view."""
@@ -238,3 +335,34 @@ class TestPhotoDetail:
         async with TestClient(example_app) as client:
             response = await client.get("/photos/999")
             assert response.status == 404
+
+
+class TestPhotoDelete:
+    """POST /photos/{id}/delete — removes a photo."""
+
+    async def test_delete_removes_photo(self, example_app) -> None:
+        async with TestClient(example_app) as client:
+            page = await client.get("/")
+            cookie = _extract_cookie(page)
+            token = _extract_csrf_token(page)
+            headers = {"Cookie": f"chirp_session={cookie}"}
+
+            body, ct = _build_multipart_body(title="Doomed", csrf_token=token)
+            await client.post("/upload", body=body, headers={**headers, "Content-Type": ct})
+
+            response = await client.post(
+                "/photos/1/delete",
+                body=f"_csrf_token={token}".encode(),
+                headers={**headers, **_FORM_CT},
+            )
+            assert response.status == 302
+            assert (await client.get("/photos/1")).status == 404
+            assert "Doomed" not in (await client.get("/")).text
+
+            # Deleting again is a harmless no-op
+            response = await client.post(
+                "/photos/1/delete",
+                body=f"_csrf_token={token}".encode(),
+                headers={**headers, **_FORM_CT},
+            )
+            assert response.status == 302
@@ -17,6 +17,7 @@ Run:
 """
 
 import os
+from collections import ChainMap
 from pathlib import Path
 
 from chirp import App, AppConfig, Page, Redirect, Request, Template, ValidationError
@@ -30,7 +31,9 @@ app = App(config=config)
 
 _secret = os.environ.get("SESSION_SECRET_KEY", "dev-only-not-for-production")
 
-app.add_middleware(SessionMiddleware(SessionConfig(secret_key=_secret)))
+# Keep recently issued wizard sessions decoded — each step reads back the
+# cookie the previous step just set.
+app.add_middleware(SessionMiddleware(SessionConfig(secret_key=_secret, cache_size=256)))
 
 # ---------------------------------------------------------------------------
 # Session keys
@@ -40,6 +43,28 @@ _SESSION_KEY = "wizard_data"
 
 _US_ZIP = matches(r"^\d{5}(-\d{4})?$", message="Must be a valid US zip code (e.g. 90210)")
 
+# Validation rules per step — built once at import; validate() only reads them.
+_STEP1_RULES = {
+    "first_name": [required, max_length(50)],
+    "last_name": [required, max_length(50)],
+    "email": [required, email],
+    "phone": [max_length(20)],
+}
+
+_STEP2_RULES = {
+    "address": [required, max_length(200)],
+    "city": [required, max_length(100)],
+    "state": [required, min_length(2), max_length(2)],
+    "zip_code": [required, _US_ZIP],
+}
+
+
+def reset_state() -> None:
+    """Nothing to reset — wizard progress lives in the signed session cookie.
+
+    Defining this lets the example test suite load the app once and reuse it.
+    """
+
 
 def _get_wizard_data() -> dict:
     """Get the wizard form data from the session."""
@@ -90,22 +115,15 @@ async def step1_submit(request: Request):
         "phone": form.get("phone", ""),
     }
 
-    result = validate(
-        form,
-        {
-            "first_name": [required, max_length(50)],
-            "last_name": [required, max_length(50)],
-            "email": [required, email],
-            "phone": [max_length(20)],
-        },
-    )
+    result = validate(form, _STEP1_RULES)
 
     if not result:
+        # Read-only overlay of the submitted values on the saved ones — no merge copy.
         return ValidationError(
             "step1.html",
             "step_form",
             errors=result.errors,
-            form={**data, **form_values},
+            form=ChainMap(form_values, data),
             step=1,
         )
 
@@ -143,22 +161,14 @@ async def step2_submit(request: Request):
         "zip_code": form.get("zip_code", ""),
     }
 
-    result = validate(
-        form,
-        {
-            "address": [required, max_length(200)],
-            "city": [required, max_length(100)],
-            "state": [required, min_length(2), max_length(2)],
-            "zip_code": [required, _US_ZIP],
-        },
-    )
+    result = validate(form, _STEP2_RULES)
 
     if not result:
         return ValidationError(
             "step2.html",
             "step_form",
             errors=result.errors,
-            form={**data, **form_values},
+            form=ChainMap(form_values, data),
             step=2,
         )
 
@@ -29,6 +29,8 @@ AI streaming (``pip install chirp[ai]``)::
         ...
 """
 
+import sys
+
 # Declare free-threading support (PEP 703)
 _Py_mod_gil = 0
 
@@ -225,14 +227,25 @@ def __getattr__(name: str) -> object:
 
     Keeps ``import chirp`` fast while providing a clean top-level API.
     New names only need a single entry in ``_LAZY_IMPORTS`` above.
+
+    Resolved names are stored in the module namespace, so each one goes
+    through here only once — later lookups are plain module attribute hits.
+    Deprecated names are not cached, so every access still warns.
     """
     entry = _LAZY_IMPORTS.get(name)
     if entry is not None:
         module_path, attr = entry
-        import importlib
+        # Most targets are already imported by the time an app resolves them.
+        # Only a miss (or a module another thread is still initializing)
+        # takes importlib's locked path.
+        mod = sys.modules.get(module_path)
+        if mod is None or not hasattr(mod, attr):
+            import importlib
 
-        mod = importlib.import_module(module_path)
-        return getattr(mod, attr)
+            mod = importlib.import_module(module_path)
+        value = getattr(mod, attr)
+        globals()[name] = value
+        return value
 
     deprecated = _DEPRECATED_IMPORTS.get(name)
     if deprecated is not None:
@@ -1,24 +1,30 @@
 """Typed ASGI definitions.
 
 Replaces the standard Scope = MutableMapping[str, Any] with typed
-dataclasses for internal use. Users never see these.
+records for internal use. Users never see these.
 """
 
-from collections.abc import Awaitable, Callable, MutableMapping
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Awaitable, Callable, MutableMapping, Sequence
+from operator import itemgetter
+from typing import Any, NamedTuple
 
 # Raw ASGI types (matching the spec)
 type Scope = MutableMapping[str, Any]
 type Receive = Callable[[], Awaitable[MutableMapping[str, Any]]]
 type Send = Callable[[MutableMapping[str, Any]], Awaitable[None]]
 
+# Keys every HTTP scope must carry — fetched with one C-level call
+_REQUIRED_KEYS = itemgetter("type", "asgi", "method", "path")
 
-@dataclass(frozen=True, slots=True)
-class HTTPScope:
+
+class HTTPScope(NamedTuple):
     """Typed HTTP scope parsed from raw ASGI scope dict.
 
-    Internal only -- users interact with Request, not this.
+    Internal only -- users interact with Request, not this. A NamedTuple
+    rather than a frozen dataclass: construction is a single
+    ``tuple.__new__`` instead of one ``object.__setattr__`` per field.
+    Fields cannot be reassigned, but ``asgi`` and ``headers`` are the
+    server's own objects (``headers`` is often a list), shared, not copied.
     """
 
     type: str
@@ -29,25 +35,31 @@ class HTTPScope:
     raw_path: bytes
     query_string: bytes
     root_path: str
-    headers: tuple[tuple[bytes, bytes], ...]
+    headers: Sequence[tuple[bytes, bytes]]
     server: tuple[str, int] | None
     client: tuple[str, int] | None
 
     @classmethod
     def from_scope(cls, scope: Scope) -> HTTPScope:
-        """Parse raw ASGI scope into typed object."""
-        server = scope.get("server")
-        client = scope.get("client")
+        """Parse raw ASGI scope into typed object.
+
+        ``headers`` is kept as the server delivered it (list or tuple) rather
+        than copied; the scope is not mutated after it reaches the app.
+        """
+        scope_type, asgi, method, path = _REQUIRED_KEYS(scope)
+        get = scope.get
+        server = get("server")
+        client = get("client")
         return cls(
-            type=scope["type"],
-            asgi=scope["asgi"],
-            http_version=scope.get("http_version", "1.1"),
-            method=scope["method"],
-            path=scope["path"],
-            raw_path=scope.get("raw_path", b""),
-            query_string=scope.get("query_string", b""),
-            root_path=scope.get("root_path", ""),
-            headers=tuple(scope.get("headers", ())),
-            server=tuple(server) if server else None,
-            client=tuple(client) if client else None,
+            scope_type,
+            asgi,
+            get("http_version", "1.1"),
+            method,
+            path,
+            get("raw_path", b""),
+            get("query_string", b""),
+            get("root_path", ""),
+            get("headers", ()),
+            tuple(server) if server else None,
+            tuple(client) if client else None,
         )
@@ -15,10 +15,25 @@ Usage::
 """
 
 import asyncio
-import inspect
+from inspect import CO_ITERABLE_COROUTINE
+from types import CoroutineType, GeneratorType
 from typing import Any
 
 
+def _is_awaitable(obj: object) -> bool:
+    """Cheap ``inspect.isawaitable`` for sync handler results.
+
+    Sync handlers almost always return strings, templates, or responses, so
+    the common answer is ``False``. Check the concrete coroutine type first,
+    then probe the type for ``__await__`` — no ``Awaitable`` ABC dispatch.
+    Generators are awaitable only when ``@types.coroutine`` flagged their code.
+    """
+    cls = type(obj)
+    if type(obj) is GeneratorType:
+        return bool(obj.gi_code.co_flags & CO_ITERABLE_COROUTINE)
+    return cls is CoroutineType or hasattr(cls, "__await__")
+
+
 async def invoke(
     handler: Any,
     *args: Any,
@@ -35,18 +50,21 @@ async def invoke(
     event loop thread instead of ``asyncio.to_thread`` — useful for lightweight
     handlers where the thread-dispatch overhead exceeds the work itself.
     """
-    handler_is_async = is_async if is_async is not None else inspect.iscoroutinefunction(handler)
+    if is_async is None:
+        from inspect import iscoroutinefunction
+
+        is_async = iscoroutinefunction(handler)
 
-    if handler_is_async:
+    if is_async:
         return await handler(*args, **kwargs)
 
     if inline_sync:
         result = handler(*args, **kwargs)
-        if inspect.isawaitable(result):
+        if _is_awaitable(result):
             return await result
         return result
 
     result = await asyncio.to_thread(handler, *args, **kwargs)
-    if inspect.isawaitable(result):
+    if _is_awaitable(result):
         return await result
     return result
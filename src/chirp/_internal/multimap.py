@@ -5,10 +5,9 @@ multi-valued mapping without coupling to the concrete type.
 """
 
 from collections.abc import Iterator
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 
-@runtime_checkable
 class MultiValueMapping(Protocol):
     """A read-only string mapping where keys can have multiple values.
 
@@ -18,6 +17,10 @@ class MultiValueMapping(Protocol):
     Structurally compatible with ``Mapping[str, str]`` plus ``get_list``.
     Defined with explicit dunder methods because Python 3.14 Protocols
     cannot inherit from non-Protocol ABCs like ``Mapping``.
+
+    For type checking only — not ``runtime_checkable``, since a protocol
+    ``isinstance`` probes every member with ``hasattr``. Code that must branch
+    at runtime should test the concrete ``Headers``/``QueryParams``/``FormData``.
     """
 
     def __getitem__(self, key: str) -> str: ...
@@ -18,6 +18,10 @@ Basic usage::
     # Structured output (frozen dataclass)
     summary = await llm.generate(Summary, prompt="Summarize: ...")
 
+    # Structured streaming (instances fill in as the JSON arrives)
+    async for partial in llm.stream_structured(Summary, prompt="Summarize: ..."):
+        ...
+
 Requires ``httpx``::
 
     pip install chirp[ai]
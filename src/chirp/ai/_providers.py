@@ -16,16 +16,52 @@ Provider string format: ``provider:model``
     - ``ollama:llama3.2`` (uses OLLAMA_BASE env, default http://localhost:11434)
     - ``lmstudio:model-id`` (uses LMSTUDIO_BASE env, default http://localhost:1234)
     - ``localai:model-id`` (uses LOCALAI_BASE env, default http://localhost:8080)
+
+Connections are pooled: each event loop keeps one ``httpx.AsyncClient``
+per base URL, so calls to the same provider reuse TCP and TLS sessions.
+The pool is per loop because httpx connections are bound to the loop that
+opened them and every worker runs its own loop. A chirp app closes the
+worker loop's clients at worker (and lifespan) shutdown; code running its
+own loop calls ``aclose_clients()`` or uses ``async with LLM(...)``. Hosted (``https``) APIs
+are spoken to over HTTP/2 when ``h2`` is installed, so concurrent streams
+multiplex over one TLS connection; local plain-HTTP servers stay on 1.1.
+Responses are compressed on the wire: httpx advertises every decoder it
+has in ``Accept-Encoding`` (gzip and deflate always, ``br`` via the
+``brotli`` package in the ``ai`` extra) and decodes streams incrementally.
+
+Request bodies are encoded and streamed SSE events decoded with ``orjson``
+when it is installed (``pip install chirp[json]``) and stdlib ``json``
+otherwise.
 """
 
+import asyncio
 import json
 import os
-from collections.abc import AsyncIterator
+import threading
+from collections.abc import AsyncIterator, Callable, Sequence
 from dataclasses import dataclass
+from functools import cache
 from typing import Any
 
 from chirp.ai.errors import ProviderError, ProviderNotInstalledError
 
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # catch the stdlib error either way.
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Chat messages are shared, never mutated: callers pass tuples and helpers
+# that add a turn build a new tuple. Both encoders write a sequence as an
+# array, so the body needs no list copy.
+type Messages = Sequence[dict[str, str]]
+
 
 @dataclass(frozen=True, slots=True)
 class ProviderConfig:
@@ -115,18 +151,171 @@ def _get_httpx() -> Any:
         raise ProviderNotInstalledError(msg) from None
 
 
-async def _iter_sse_events(response: Any) -> AsyncIterator[dict[str, Any]]:
-    """Parse SSE events from response stream. Yields parsed JSON event dicts."""
-    async for line in response.aiter_lines():
-        if not line.startswith("data: "):
-            continue
-        payload = line[6:]
-        if payload.strip() == "[DONE]":
-            break
+@cache
+def _h2_available() -> bool:
+    """Whether httpx can speak HTTP/2 (the optional ``h2`` package)."""
+    import importlib.util
+
+    return importlib.util.find_spec("h2") is not None
+
+
+# event loop -> base_url -> httpx.AsyncClient. Open connections reference
+# their loop, so an entry lives until aclose_clients() removes it, or until
+# its loop has closed and another loop starts using the pool.
+_clients: dict[asyncio.AbstractEventLoop, dict[str, Any]] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(config: ProviderConfig) -> Any:
+    """Return the pooled ``httpx.AsyncClient`` for *config* on the running loop."""
+    httpx = _get_httpx()
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        per_loop = _clients.get(loop)
+        if per_loop is None:
+            # Loops that ended without aclose_clients() (e.g. repeated
+            # asyncio.run() in a script) can no longer close their clients;
+            # dropping them lets the loop and its sockets be freed
+            for stale in [other for other in _clients if other.is_closed()]:
+                del _clients[stale]
+            per_loop = _clients[loop] = {}
+        client = per_loop.get(config.base_url)
+        if client is None or client.is_closed:
+            client = per_loop[config.base_url] = httpx.AsyncClient(
+                base_url=config.base_url,
+                timeout=httpx.Timeout(120.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                http2=config.base_url.startswith("https://") and _h2_available(),
+            )
+    return client
+
+
+async def aclose_clients(base_url: str | None = None) -> None:
+    """Close pooled clients on the running loop (all, or just *base_url*'s).
+
+    Must run on each loop that used the pool before that loop ends — the
+    app does this at worker and lifespan shutdown. Closed clients are
+    replaced on next use, so this is safe to call while other ``LLM``
+    instances share the pool.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        if base_url is None:
+            closing = list(_clients.pop(loop, {}).values())
+        else:
+            per_loop = _clients.get(loop, {})
+            client = per_loop.pop(base_url, None)
+            closing = [client] if client is not None else []
+            if not per_loop:
+                _clients.pop(loop, None)
+    for client in closing:
+        await client.aclose()
+
+
+_CONTINUE_PROMPT = (
+    "Your previous reply was cut off. Continue exactly where it stopped, "
+    "without repeating any of it."
+)
+
+
+async def _resilient_stream(
+    config: ProviderConfig,
+    path: str,
+    body: dict[str, Any],
+    headers: dict[str, str],
+    *,
+    provider: str,
+    text_of: Callable[[dict[str, Any]], str],
+    resume: Callable[[Messages, str], Messages],
+    max_resumes: int,
+) -> AsyncIterator[str]:
+    """POST a streaming request and yield text, optionally resuming after a drop.
+
+    When the connection breaks mid-stream (``RemoteProtocolError`` or
+    ``ReadError``) and ``max_resumes`` allows it, the request is reissued —
+    with ``resume`` folding the text received so far into the messages —
+    so the caller sees one unbroken stream. Each resume is a new, billed
+    request. HTTP error statuses are never retried.
+    """
+    httpx = _get_httpx()
+    messages = body["messages"]
+    received: list[str] = []
+    resumes = 0
+    # Trailing whitespace the caller already has, which a continuation
+    # (an Anthropic prefill is sent stripped) may repeat
+    overlap = 0
+    while True:
         try:
-            yield json.loads(payload)
-        except json.JSONDecodeError:
+            async with _get_client(config).stream(
+                "POST", path, content=_json_dumps(body), headers=headers
+            ) as response:
+                if response.status_code != 200:
+                    error = await response.aread()
+                    raise ProviderError(provider, response.status_code, error.decode())
+                async for event in _iter_sse_events(response):
+                    text = text_of(event)
+                    if overlap and text:
+                        cut = min(len(text) - len(text.lstrip()), overlap)
+                        text = text[cut:]
+                        overlap = 0 if text else overlap - cut
+                    if text:
+                        received.append(text)
+                        yield text
+            return
+        except httpx.RemoteProtocolError, httpx.ReadError:
+            if resumes >= max_resumes:
+                raise
+            resumes += 1
+            if received:
+                so_far = "".join(received)
+                overlap = len(so_far) - len(so_far.rstrip())
+                body = {**body, "messages": resume(messages, so_far)}
+
+
+_DATA_PREFIX = b"data: "
+_DONE = object()
+
+
+def _data_event(line: bytes) -> Any:
+    """Decode one SSE line: the event, ``_DONE`` at the end marker, else ``None``."""
+    # Blank separators, ": ping" heartbeats and event: lines all fail the
+    # prefix check; only data lines are sliced.
+    if not line.startswith(_DATA_PREFIX):
+        return None
+    payload = line[6:]  # the line ending is JSON whitespace
+    # Events are JSON objects, so only the [DONE] sentinel opens with "[".
+    if payload[:1] == b"[" and payload.rstrip() == b"[DONE]":
+        return _DONE
+    try:
+        return _json_loads(payload)
+    except json.JSONDecodeError:
+        return None
+
+
+async def _iter_sse_events(response: Any) -> AsyncIterator[dict[str, Any]]:
+    """Parse SSE events from response stream. Yields parsed JSON event dicts.
+
+    Frames on raw bytes — lines are never decoded to ``str`` and the
+    ``data:`` payload goes to the JSON decoder as bytes. Lines may end in
+    LF, CRLF or a bare CR, as the SSE spec allows; a CRLF split across
+    chunks only adds a blank line. A last line without its newline is
+    still parsed, as ``aiter_lines`` would have yielded it.
+    """
+    tail = b""
+    async for chunk in response.aiter_bytes():
+        if not chunk:
             continue
+        lines = (tail + chunk if tail else chunk).splitlines(keepends=True)
+        tail = b"" if lines[-1].endswith((b"\n", b"\r")) else lines.pop()
+        for line in lines:
+            event = _data_event(line)
+            if event is _DONE:
+                return
+            if event is not None:
+                yield event
+    event = _data_event(tail)
+    if event is not None and event is not _DONE:
+        yield event
 
 
 # =============================================================================
@@ -136,15 +325,13 @@ async def _iter_sse_events(response: Any) -> AsyncIterator[dict[str, Any]]:
 
 async def anthropic_generate(
     config: ProviderConfig,
-    messages: list[dict[str, str]],
+    messages: Messages,
     *,
     max_tokens: int = 4096,
     temperature: float = 0.0,
     system: str | None = None,
 ) -> str:
     """Generate a complete response from Anthropic's Messages API."""
-    httpx = _get_httpx()
-
     body: dict[str, Any] = {
         "model": config.model,
         "messages": messages,
@@ -154,17 +341,15 @@ async def anthropic_generate(
     if system:
         body["system"] = system
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{config.base_url}/v1/messages",
-            json=body,
-            headers={
-                "x-api-key": config.api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
-            timeout=120.0,
-        )
+    response = await _get_client(config).post(
+        "/v1/messages",
+        content=_json_dumps(body),
+        headers={
+            "x-api-key": config.api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json",
+        },
+    )
 
     if response.status_code != 200:
         raise ProviderError("anthropic", response.status_code, response.text)
@@ -175,15 +360,18 @@ async def anthropic_generate(
 
 async def anthropic_stream(
     config: ProviderConfig,
-    messages: list[dict[str, str]],
+    messages: Messages,
     *,
     max_tokens: int = 4096,
     temperature: float = 0.0,
     system: str | None = None,
+    max_resumes: int = 0,
 ) -> AsyncIterator[str]:
-    """Stream text tokens from Anthropic's Messages API."""
-    httpx = _get_httpx()
+    """Stream text tokens from Anthropic's Messages API.
 
+    ``max_resumes`` reconnects are allowed if the connection drops
+    mid-response (see ``_resilient_stream``); none by default.
+    """
     body: dict[str, Any] = {
         "model": config.model,
         "messages": messages,
@@ -194,30 +382,33 @@ async def anthropic_stream(
     if system:
         body["system"] = system
 
-    async with (
-        httpx.AsyncClient() as client,
-        client.stream(
-            "POST",
-            f"{config.base_url}/v1/messages",
-            json=body,
-            headers={
-                "x-api-key": config.api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
-            timeout=120.0,
-        ) as response,
+    async for text in _resilient_stream(
+        config,
+        "/v1/messages",
+        body,
+        {
+            "x-api-key": config.api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json",
+        },
+        provider="anthropic",
+        text_of=_anthropic_text,
+        resume=_anthropic_resume,
+        max_resumes=max_resumes,
     ):
-        if response.status_code != 200:
-            text = await response.aread()
-            raise ProviderError("anthropic", response.status_code, text.decode())
+        yield text
 
-        async for event in _iter_sse_events(response):
-            if event.get("type") == "content_block_delta":
-                delta = event.get("delta", {})
-                text = delta.get("text", "")
-                if text:
-                    yield text
+
+def _anthropic_text(event: dict[str, Any]) -> str:
+    if event.get("type") == "content_block_delta":
+        return event.get("delta", {}).get("text", "")
+    return ""
+
+
+def _anthropic_resume(messages: Messages, received: str) -> Messages:
+    # A trailing assistant turn is a prefill: the model continues it as-is.
+    # The API rejects a prefill ending in whitespace.
+    return (*messages, {"role": "assistant", "content": received.rstrip()})
 
 
 # =============================================================================
@@ -225,33 +416,37 @@ async def anthropic_stream(
 # =============================================================================
 
 
+def _with_system(messages: Messages, system: str | None) -> Messages:
+    """Chat Completions carry the system prompt as the first message."""
+    if not system:
+        return messages
+    return ({"role": "system", "content": system}, *messages)
+
+
 async def openai_generate(
     config: ProviderConfig,
-    messages: list[dict[str, str]],
+    messages: Messages,
     *,
     max_tokens: int = 4096,
     temperature: float = 0.0,
+    system: str | None = None,
 ) -> str:
     """Generate a complete response from OpenAI's Chat Completions API."""
-    httpx = _get_httpx()
-
     body: dict[str, Any] = {
         "model": config.model,
-        "messages": messages,
+        "messages": _with_system(messages, system),
         "max_tokens": max_tokens,
         "temperature": temperature,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{config.base_url}/v1/chat/completions",
-            json=body,
-            headers={
-                "Authorization": f"Bearer {config.api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=120.0,
-        )
+    response = await _get_client(config).post(
+        "/v1/chat/completions",
+        content=_json_dumps(body),
+        headers={
+            "Authorization": f"Bearer {config.api_key}",
+            "Content-Type": "application/json",
+        },
+    )
 
     if response.status_code != 200:
         raise ProviderError("openai", response.status_code, response.text)
@@ -262,43 +457,52 @@ async def openai_generate(
 
 async def openai_stream(
     config: ProviderConfig,
-    messages: list[dict[str, str]],
+    messages: Messages,
     *,
     max_tokens: int = 4096,
     temperature: float = 0.0,
+    system: str | None = None,
+    max_resumes: int = 0,
 ) -> AsyncIterator[str]:
-    """Stream text tokens from OpenAI's Chat Completions API."""
-    httpx = _get_httpx()
+    """Stream text tokens from OpenAI's Chat Completions API.
 
+    ``max_resumes`` reconnects are allowed if the connection drops
+    mid-response (see ``_resilient_stream``); none by default.
+    """
     body: dict[str, Any] = {
         "model": config.model,
-        "messages": messages,
+        "messages": _with_system(messages, system),
         "max_tokens": max_tokens,
         "temperature": temperature,
         "stream": True,
     }
 
-    async with (
-        httpx.AsyncClient() as client,
-        client.stream(
-            "POST",
-            f"{config.base_url}/v1/chat/completions",
-            json=body,
-            headers={
-                "Authorization": f"Bearer {config.api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=120.0,
-        ) as response,
+    async for text in _resilient_stream(
+        config,
+        "/v1/chat/completions",
+        body,
+        {
+            "Authorization": f"Bearer {config.api_key}",
+            "Content-Type": "application/json",
+        },
+        provider="openai",
+        text_of=_openai_text,
+        resume=_openai_resume,
+        max_resumes=max_resumes,
     ):
-        if response.status_code != 200:
-            text = await response.aread()
-            raise ProviderError("openai", response.status_code, text.decode())
-
-        async for event in _iter_sse_events(response):
-            choices = event.get("choices", [])
-            if choices:
-                delta = choices[0].get("delta", {})
-                content = delta.get("content", "")
-                if content:
-                    yield content
+        yield text
+
+
+def _openai_text(event: dict[str, Any]) -> str:
+    choices = event.get("choices", [])
+    if choices:
+        return choices[0].get("delta", {}).get("content", "") or ""
+    return ""
+
+
+def _openai_resume(messages: Messages, received: str) -> Messages:
+    return (
+        *messages,
+        {"role": "assistant", "content": received},
+        {"role": "user", "content": _CONTINUE_PROMPT},
+    )
@@ -7,6 +7,7 @@ both produce frozen dataclasses from external data.
 
 import dataclasses
 import json
+from functools import lru_cache
 from typing import Any
 
 from chirp.ai.errors import StructuredOutputError
@@ -19,7 +20,21 @@ _TYPE_MAP: dict[type, str] = {
     bool: "boolean",
 }
 
+# Schema fragments for the supported annotations — one dict probe per field.
+# Shared between schemas (which are cached and must not be mutated); plain
+# dicts rather than MappingProxyType so json.dumps can serialize them.
+_SCHEMA_TABLE: dict[Any, dict[str, Any]] = {
+    **{py_type: {"type": name} for py_type, name in _TYPE_MAP.items()},
+    **{
+        list[py_type]: {"type": "array", "items": {"type": name}}
+        for py_type, name in _TYPE_MAP.items()
+    },
+    list: {"type": "array"},
+}
+_FALLBACK_SCHEMA: dict[str, Any] = {"type": "string"}
+
 
+@lru_cache(maxsize=256)
 def dataclass_to_schema[T](cls: type[T]) -> dict[str, Any]:
     """Generate a JSON schema from a frozen dataclass.
 
@@ -27,6 +42,8 @@ def dataclass_to_schema[T](cls: type[T]) -> dict[str, Any]:
     the dataclass fields.
 
     Supports: str, int, float, bool, list[str], list[int], list[float].
+
+    Cached per class — the returned dict is shared, do not mutate it.
     """
     if not dataclasses.is_dataclass(cls):
         msg = f"{cls.__name__} is not a dataclass — structured output requires frozen dataclasses"
@@ -49,22 +66,24 @@ def dataclass_to_schema[T](cls: type[T]) -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=256)
+def schema_json(cls: type) -> str:
+    """Return ``dataclass_to_schema(cls)`` serialized as JSON, cached per class."""
+    return json.dumps(dataclass_to_schema(cls), indent=2)
+
+
 def _type_to_schema(annotation: Any) -> dict[str, Any]:
     """Convert a Python type annotation to a JSON schema fragment."""
-    # Handle basic types
-    if annotation in _TYPE_MAP:
-        return {"type": _TYPE_MAP[annotation]}
-
-    # Handle list[X] (generic alias)
-    origin = getattr(annotation, "__origin__", None)
-    if origin is list:
-        args = getattr(annotation, "__args__", ())
-        if args and args[0] in _TYPE_MAP:
-            return {"type": "array", "items": {"type": _TYPE_MAP[args[0]]}}
-        return {"type": "array"}
+    schema = _SCHEMA_TABLE.get(annotation)
+    if schema is not None:
+        return schema
+
+    # Other list[X] generics
+    if getattr(annotation, "__origin__", None) is list:
+        return _SCHEMA_TABLE[list]
 
     # Fallback
-    return {"type": "string"}
+    return _FALLBACK_SCHEMA
 
 
 def parse_structured[T](cls: type[T], text: str) -> T:
@@ -84,8 +103,7 @@ def parse_structured[T](cls: type[T], text: str) -> T:
         msg = f"Expected JSON object, got {type(data).__name__}"
         raise StructuredOutputError(msg)
 
-    field_names = {f.name for f in dataclasses.fields(cls)}
-    filtered = {k: v for k, v in data.items() if k in field_names}
+    filtered = {k: data[k] for k in data.keys() & _field_names(cls)}
 
     try:
         return cls(**filtered)
@@ -94,25 +112,35 @@ def parse_structured[T](cls: type[T], text: str) -> T:
         raise StructuredOutputError(msg) from exc
 
 
+@lru_cache(maxsize=256)
+def _field_names(cls: type) -> frozenset[str]:
+    """Field names of dataclass *cls*, cached per class."""
+    return frozenset(f.name for f in dataclasses.fields(cls))
+
+
 def _extract_json(text: str) -> str:
-    """Extract JSON from LLM text, handling markdown code fences."""
+    """Extract JSON from LLM text, handling markdown code fences.
+
+    Each ``find`` resumes where the previous one stopped, so a typical
+    fenced response is scanned about once.
+    """
     stripped = text.strip()
 
     # Try direct parse first
     if stripped.startswith(("{", "[")):
         return stripped
 
-    # Handle ```json ... ``` fences
-    if "```json" in stripped:
-        start = stripped.index("```json") + 7
-        end = stripped.index("```", start)
-        return stripped[start:end].strip()
-
-    # Handle ``` ... ``` fences
-    if "```" in stripped:
-        start = stripped.index("```") + 3
-        end = stripped.index("```", start)
-        return stripped[start:end].strip()
+    fence = stripped.find("```")
+    if fence != -1:
+        # Prefer a ```json fence, even after an untagged one
+        if stripped.startswith("json", fence + 3):
+            start = fence + 7
+        else:
+            json_fence = stripped.find("```json", fence + 3)
+            start = json_fence + 7 if json_fence != -1 else fence + 3
+        end = stripped.find("```", start)
+        if end != -1:
+            return stripped[start:end].strip()
 
     # Last resort — find first { to last }
     brace_start = stripped.find("{")
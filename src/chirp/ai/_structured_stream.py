@@ -0,0 +1,228 @@
+"""Incremental structured output — partial JSON while the LLM is still typing.
+
+``PartialJSON`` consumes text chunks and can produce, at any point, the
+value parsed so far. Snapshots follow three rules so a template can render
+each one in turn without flicker:
+
+    - a value never changes type once it appears
+    - strings only grow at the end
+    - arrays and objects only grow at the tail
+
+Numbers, ``true``/``false``/``null`` and object keys only appear once
+complete; a string value appears as soon as its opening quote arrives.
+
+Scanning is incremental — each chunk is examined once — and only the
+snapshot itself re-parses the text seen so far.
+"""
+
+import dataclasses
+import json
+from functools import lru_cache
+from typing import Any
+
+from chirp.ai._structured import _field_names
+
+_OPEN_TO_CLOSE = {"{": "}", "[": "]"}
+
+# What the innermost container expects next
+_KEY = 0  # object: a key or "}"
+_COLON = 1  # object: ":" after a key
+_VALUE = 2  # object or array: a value (or "]" right after "[")
+_COMMA = 3  # object or array: "," or the closing bracket
+
+
+class PartialJSON:
+    """Incremental scanner producing snapshots of a JSON document in flight.
+
+    Text before the first ``{`` or ``[`` (prose, a markdown fence) and text
+    after the top-level value closes are ignored.
+    """
+
+    __slots__ = (
+        "_done",
+        "_escape",
+        "_in_string",
+        "_parts",
+        "_pos",
+        "_safe",
+        "_scalar",
+        "_stack",
+        "_start",
+        "_states",
+        "_string_is_key",
+        "_string_safe",
+        "_surrogate",
+        "_text",
+    )
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._text = ""
+        self._pos = 0  # characters of _text scanned so far
+        self._start = -1  # index of the top-level "{" / "["
+        self._done = False
+        self._stack: list[str] = []
+        self._states: list[int] = []
+        self._in_string = False
+        self._string_is_key = False
+        self._escape = 0  # characters left in the current escape sequence
+        self._string_safe = 0  # end of the string text before a pending escape
+        self._surrogate = False  # scanned \uD800-\uDBFF awaiting its low half
+        self._scalar = False
+        # Longest prefix that is valid JSON once the closers are appended
+        self._safe: tuple[int, str] | None = None
+
+    def feed(self, chunk: str) -> None:
+        """Scan *chunk* and update the parser state."""
+        if self._done or not chunk:
+            return
+        self._parts.append(chunk)
+        self._text = text = "".join(self._parts)
+        for i in range(self._pos, len(text)):
+            self._step(text, i)
+            if self._done:
+                break
+        self._pos = len(text)
+
+    def snapshot(self) -> Any:
+        """Return the value parsed so far, or ``None`` before it starts."""
+        if self._start == -1:
+            return None
+        text = self._text
+        if self._in_string and not self._string_is_key:
+            end = self._string_safe if self._escape or self._surrogate else len(text)
+            candidate = text[self._start : end] + '"' + self._closers()
+        elif self._safe is not None:
+            end, closers = self._safe
+            candidate = text[self._start : end] + closers
+        else:
+            return None
+        return json.loads(candidate)
+
+    @property
+    def done(self) -> bool:
+        """Whether the top-level value has been closed."""
+        return self._done
+
+    # -- Scanner --
+
+    def _closers(self) -> str:
+        return "".join(_OPEN_TO_CLOSE[c] for c in reversed(self._stack))
+
+    def _mark_safe(self, end: int) -> None:
+        self._safe = (end, self._closers())
+
+    def _value_done(self, end: int) -> None:
+        """A value ended at *end*; the container now expects a comma."""
+        if self._states:
+            self._states[-1] = _COMMA
+        self._mark_safe(end)
+
+    def _step(self, text: str, i: int) -> None:
+        ch = text[i]
+
+        if self._in_string:
+            if self._escape:
+                if self._escape == 5 and ch == "u":
+                    self._escape = 4  # \uXXXX — four hex digits follow
+                elif self._escape == 5:
+                    self._escape = 0
+                    self._surrogate = False
+                else:
+                    self._escape -= 1
+                    if not self._escape:
+                        # A high surrogate alone is not encodable: keep the
+                        # string end before it until the low half arrives.
+                        hex_digits = text[i - 3 : i + 1].lower()
+                        self._surrogate = not self._surrogate and "d800" <= hex_digits <= "dbff"
+                return
+            if ch == "\\":
+                self._escape = 5
+                if not self._surrogate:
+                    self._string_safe = i
+                return
+            self._surrogate = False
+            if ch == '"':
+                self._in_string = False
+                if self._string_is_key:
+                    self._states[-1] = _COLON
+                else:
+                    self._value_done(i + 1)
+            return
+
+        if self._start == -1:
+            if ch in "{[":
+                self._start = i
+                self._open(ch, i)
+            return
+
+        if self._scalar:
+            if ch not in ",}] \t\r\n":
+                return
+            self._scalar = False
+            self._value_done(i)
+
+        if ch in " \t\r\n":
+            return
+        if ch in "{[":
+            self._open(ch, i)
+        elif ch in "}]":
+            self._stack.pop()
+            self._states.pop()
+            if self._stack:
+                self._value_done(i + 1)
+            else:
+                self._mark_safe(i + 1)
+                self._done = True
+        elif ch == '"':
+            self._in_string = True
+            self._string_is_key = self._states[-1] == _KEY
+            self._escape = 0
+        elif ch == ":":
+            self._states[-1] = _VALUE
+        elif ch == ",":
+            self._states[-1] = _KEY if self._stack[-1] == "{" else _VALUE
+        else:
+            self._scalar = True
+
+    def _open(self, ch: str, i: int) -> None:
+        self._stack.append(ch)
+        self._states.append(_KEY if ch == "{" else _VALUE)
+        self._mark_safe(i + 1)
+
+
+# -- Partial dataclass instances --
+
+
+@lru_cache(maxsize=256)
+def _placeholders(cls: type) -> tuple[tuple[str, Any], ...]:
+    """``(name, factory)`` for each required field of dataclass *cls*."""
+    result = []
+    for field in dataclasses.fields(cls):
+        if field.default is not dataclasses.MISSING:
+            continue
+        if field.default_factory is not dataclasses.MISSING:
+            continue
+        annotation = field.type
+        if annotation in (str, int, float, bool):
+            factory: Any = annotation
+        elif getattr(annotation, "__origin__", None) is list:
+            factory = list
+        else:
+            factory = type(None)
+        result.append((field.name, factory))
+    return tuple(result)
+
+
+def partial_instance[T](cls: type[T], data: dict[str, Any]) -> T:
+    """Build *cls* from partial *data*, filling missing required fields.
+
+    Missing fields get their type's empty value (``""``, ``0``, ``0.0``,
+    ``False``, ``[]``) or ``None`` for other types, so templates can
+    render the object before every field has arrived.
+    """
+    kwargs = {k: data[k] for k in data.keys() & _field_names(cls)}
+    for name, factory in _placeholders(cls):
+        if name not in kwargs:
+            kwargs[name] = factory()
+    return cls(**kwargs)
@@ -8,24 +8,46 @@ structured (dataclass) output modes.
 
 Free-threading safety:
     - LLM instances are effectively immutable after construction
-    - httpx.AsyncClient is created per-request (no shared mutable state)
+    - httpx.AsyncClient is pooled per event loop and base URL (see
+      ``chirp.ai._providers``), never shared across loops, and closed at
+      worker shutdown
     - ProviderConfig is a frozen dataclass
 """
 
 import dataclasses
+import json
 from collections.abc import AsyncIterator
 from typing import Any, overload
 
 from chirp.ai._providers import (
+    Messages,
+    aclose_clients,
     anthropic_generate,
     anthropic_stream,
     openai_generate,
     openai_stream,
     parse_provider,
 )
-from chirp.ai._structured import dataclass_to_schema, parse_structured
+from chirp.ai._structured import parse_structured, schema_json
+from chirp.ai._structured_stream import PartialJSON, partial_instance
 from chirp.ai.errors import AIError
 
+# Provider name -> implementation. Local servers speak the OpenAI API.
+_GENERATE = {
+    "anthropic": anthropic_generate,
+    "openai": openai_generate,
+    "ollama": openai_generate,
+    "lmstudio": openai_generate,
+    "localai": openai_generate,
+}
+_STREAM = {
+    "anthropic": anthropic_stream,
+    "openai": openai_stream,
+    "ollama": openai_stream,
+    "lmstudio": openai_stream,
+    "localai": openai_stream,
+}
+
 
 class LLM:
     """Typed async LLM access.
@@ -54,9 +76,28 @@ class LLM:
 
         - ``anthropic:claude-sonnet-4-20250514``
         - ``openai:gpt-4o``
+
+    Calls reuse a pooled HTTP connection to the provider, which the app
+    closes at worker shutdown. Outside an app, use ``async with`` or
+    ``aclose()`` to release it before the event loop ends::
+
+        async with LLM("openai:gpt-4o") as llm:
+            text = await llm.generate("Hello")
+
+    A stream whose connection drops mid-response raises by default. With
+    ``max_resumes=N`` it is reissued up to N times with the text received
+    so far, and the caller sees one unbroken stream. Each resume is a new,
+    billed request.
     """
 
-    __slots__ = ("_config", "_default_max_tokens", "_default_temperature")
+    __slots__ = (
+        "_config",
+        "_default_max_tokens",
+        "_default_temperature",
+        "_generate_fn",
+        "_max_resumes",
+        "_stream_fn",
+    )
 
     def __init__(
         self,
@@ -66,10 +107,15 @@ class LLM:
         api_key: str | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.0,
+        max_resumes: int = 0,
     ) -> None:
         self._config = parse_provider(provider, api_key=api_key)
+        # Resolved once here: every request is a direct call, no name checks
+        self._generate_fn = _GENERATE[self._config.provider]
+        self._stream_fn = _STREAM[self._config.provider]
         self._default_max_tokens = max_tokens
         self._default_temperature = temperature
+        self._max_resumes = max_resumes
 
     @property
     def provider(self) -> str:
@@ -81,6 +127,20 @@ class LLM:
         """The model name (e.g., 'claude-sonnet-4-20250514')."""
         return self._config.model
 
+    async def aclose(self) -> None:
+        """Close the pooled connection to this provider on the running loop.
+
+        The pool is shared by every ``LLM`` with the same base URL; a later
+        call on any of them simply opens a fresh client.
+        """
+        await aclose_clients(self._config.base_url)
+
+    async def __aenter__(self) -> LLM:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
     # -- Generate (complete response) --
 
     @overload
@@ -112,14 +172,9 @@ class LLM:
         The LLM is instructed to return JSON matching the dataclass schema.
         The response is parsed and mapped to a frozen dataclass instance.
         """
-        max_t = max_tokens or self._default_max_tokens
-        temp = temperature if temperature is not None else self._default_temperature
-
         if isinstance(prompt_or_cls, str):
-            # Text mode
-            messages = [{"role": "user", "content": prompt_or_cls}]
-            return await self._generate_raw(
-                messages, system=system, max_tokens=max_t, temperature=temp
+            return await self.generate_text(
+                prompt_or_cls, system=system, max_tokens=max_tokens, temperature=temperature
             )
 
         # Structured mode
@@ -128,23 +183,32 @@ class LLM:
             msg = "Structured generation requires a 'prompt' keyword argument"
             raise AIError(msg)
 
-        if not dataclasses.is_dataclass(cls):
-            msg = (
-                f"{cls.__name__} is not a dataclass — structured output requires frozen dataclasses"
-            )
-            raise TypeError(msg)
-
-        schema = dataclass_to_schema(cls)
-        structured_prompt = (
-            f"{prompt}\n\n"
-            f"Respond with a JSON object matching this schema:\n"
-            f"```json\n{schema}\n```\n"
-            f"Return ONLY the JSON object, no other text."
+        messages = ({"role": "user", "content": _structured_prompt(cls, prompt)},)
+        text = await self._generate_raw(
+            messages,
+            system=system,
+            max_tokens=max_tokens or self._default_max_tokens,
+            temperature=self._default_temperature if temperature is None else temperature,
         )
-        messages = [{"role": "user", "content": structured_prompt}]
-        text = await self._generate_raw(messages, system=system, max_tokens=max_t, temperature=temp)
         return parse_structured(cls, text)
 
+    async def generate_text(
+        self,
+        prompt: str,
+        /,
+        *,
+        system: str | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> str:
+        """Generate a text response — ``generate(prompt)`` without the mode dispatch."""
+        return await self._generate_raw(
+            ({"role": "user", "content": prompt},),
+            system=system,
+            max_tokens=max_tokens or self._default_max_tokens,
+            temperature=self._default_temperature if temperature is None else temperature,
+        )
+
     # -- Stream (incremental response) --
 
     @overload
@@ -152,7 +216,7 @@ class LLM:
     @overload
     def stream[T](self, cls: type[T], /, *, prompt: str, **kwargs: Any) -> AsyncIterator[str]: ...
 
-    async def stream(
+    def stream(
         self,
         prompt_or_cls: str | type,
         /,
@@ -176,85 +240,128 @@ class LLM:
         the full text and parse with ``parse_structured()`` after streaming
         completes.
         """
+        if isinstance(prompt_or_cls, str):
+            prompt = prompt_or_cls
+        elif prompt is None:
+            msg = "Structured streaming requires a 'prompt' keyword argument"
+            raise AIError(msg)
+        return self.stream_text(
+            prompt, system=system, max_tokens=max_tokens, temperature=temperature
+        )
+
+    def stream_text(
+        self,
+        prompt: str,
+        /,
+        *,
+        system: str | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream text tokens — ``stream(prompt)`` without the mode dispatch."""
+        return self._stream_raw(
+            ({"role": "user", "content": prompt},),
+            system=system,
+            max_tokens=max_tokens or self._default_max_tokens,
+            temperature=self._default_temperature if temperature is None else temperature,
+        )
+
+    async def stream_structured[T](
+        self,
+        cls: type[T],
+        /,
+        *,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> AsyncIterator[T]:
+        """Stream a structured response as progressively filled instances.
+
+        Yields a ``cls`` instance each time the JSON parsed so far grows.
+        Fields not yet received hold their type's empty value (``""``,
+        ``0``, ``[]``, ...); strings only ever grow and list fields only
+        gain items, so each instance can be rendered in place of the last::
+
+            async def generate():
+                async for summary in llm.stream_structured(Summary, prompt=p):
+                    yield Fragment("summary.html", "card", summary=summary)
+
+            return EventStream(generate())
+
+        The last instance is parsed strictly from the complete response,
+        like ``generate()``, and raises ``StructuredOutputError`` if the
+        response does not fit ``cls``.
+        """
         max_t = max_tokens or self._default_max_tokens
         temp = temperature if temperature is not None else self._default_temperature
+        messages = ({"role": "user", "content": _structured_prompt(cls, prompt)},)
 
-        if isinstance(prompt_or_cls, str):
-            messages = [{"role": "user", "content": prompt_or_cls}]
-        else:
-            if prompt is None:
-                msg = "Structured streaming requires a 'prompt' keyword argument"
-                raise AIError(msg)
-            messages = [{"role": "user", "content": prompt}]
-
+        parser = PartialJSON()
+        chunks: list[str] = []
+        last: Any = None
         async for token in self._stream_raw(
             messages, system=system, max_tokens=max_t, temperature=temp
         ):
-            yield token
+            chunks.append(token)
+            if parser.done:
+                continue
+            parser.feed(token)
+            try:
+                data = parser.snapshot()
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict) and data != last:
+                last = data
+                yield partial_instance(cls, data)
+        yield parse_structured(cls, "".join(chunks))
 
     # -- Internal dispatch --
 
     async def _generate_raw(
         self,
-        messages: list[dict[str, str]],
+        messages: Messages,
         *,
         system: str | None,
         max_tokens: int,
         temperature: float,
     ) -> str:
         """Dispatch to provider-specific generation."""
-        if self._config.provider == "anthropic":
-            return await anthropic_generate(
-                self._config,
-                messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system,
-            )
-        if self._config.provider in ("openai", "ollama", "lmstudio", "localai"):
-            # OpenAI and Ollama use system message in messages array
-            if system:
-                messages = [{"role": "system", "content": system}, *messages]
-            return await openai_generate(
-                self._config,
-                messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-            )
-        msg = f"Unsupported provider: {self._config.provider}"
-        raise AIError(msg)
+        return await self._generate_fn(
+            self._config,
+            messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+        )
 
-    async def _stream_raw(
+    def _stream_raw(
         self,
-        messages: list[dict[str, str]],
+        messages: Messages,
         *,
         system: str | None,
         max_tokens: int,
         temperature: float,
     ) -> AsyncIterator[str]:
         """Dispatch to provider-specific streaming."""
-        if self._config.provider == "anthropic":
-            async for token in anthropic_stream(
-                self._config,
-                messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system,
-            ):
-                yield token
-            return
-
-        if self._config.provider in ("openai", "ollama", "lmstudio", "localai"):
-            if system:
-                messages = [{"role": "system", "content": system}, *messages]
-            async for token in openai_stream(
-                self._config,
-                messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-            ):
-                yield token
-            return
-
-        msg = f"Unsupported provider: {self._config.provider}"
-        raise AIError(msg)
+        return self._stream_fn(
+            self._config,
+            messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            max_resumes=self._max_resumes,
+        )
+
+
+def _structured_prompt(cls: type, prompt: str) -> str:
+    """Append the JSON-schema instructions for dataclass *cls* to *prompt*."""
+    if not dataclasses.is_dataclass(cls):
+        msg = f"{cls.__name__} is not a dataclass — structured output requires frozen dataclasses"
+        raise TypeError(msg)
+    return (
+        f"{prompt}\n\n"
+        f"Respond with a JSON object matching this schema:\n"
+        f"```json\n{schema_json(cls)}\n```\n"
+        f"Return ONLY the JSON object, no other text."
+    )
@@ -14,11 +14,92 @@ The fundamental pattern::
 
 This module wraps that pattern into reusable helpers so common cases
 are one-liners while keeping the underlying primitives accessible.
+
+The helpers coalesce tokens that arrive close together (``flush_interval_ms``)
+so a fast model does not cost one block render and one SSE frame per token,
+and read tokens ahead while a fragment renders, so a slow block render never
+stalls the provider connection.
 """
 
+import asyncio
+import contextlib
 from collections.abc import AsyncIterator, Callable
+from time import monotonic
 from typing import Any
 
+from chirp.realtime.events import SSEEvent
+from chirp.templating.returns import Fragment
+
+# Token-count trigger for coalescing: the first token is sent alone (fast
+# first paint), then each flush may carry up to 3x as many, up to the cap.
+_FLUSH_GROWTH_FACTOR = 3
+_MAX_TOKENS_PER_FLUSH = 27
+
+# Tokens read ahead of rendering; when full, the network read waits.
+_PREFETCH_TOKENS = 64
+_END = object()
+
+
+async def _drain(tokens: AsyncIterator[str], queue: asyncio.Queue[Any]) -> None:
+    """Move *tokens* into *queue*, then the end marker (also after an error)."""
+    try:
+        async for token in tokens:
+            await queue.put(token)
+    except Exception:
+        await queue.put(_END)
+        raise
+    await queue.put(_END)
+
+
+async def _coalesce(
+    tokens: AsyncIterator[str], flush_interval_ms: float
+) -> AsyncIterator[list[str]]:
+    """Group *tokens* into batches, one per fragment render.
+
+    A background task reads *tokens* into a bounded queue, so the provider
+    connection keeps draining while the caller renders and sends the
+    previous fragment. A batch is flushed when ``flush_interval_ms`` has
+    passed since the last flush or when it holds the current token budget
+    (1, 3, 9, ... up to ``_MAX_TOKENS_PER_FLUSH``), whichever comes first —
+    tokens held when the model pauses go out when the interval expires.
+    The remainder is flushed when the stream ends. A non-positive interval
+    yields every token on its own.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(_PREFETCH_TOKENS)
+    producer = asyncio.create_task(_drain(tokens, queue))
+    interval = max(flush_interval_ms, 0) / 1000
+    budget = 1
+    last_flush = float("-inf")
+    batch: list[str] = []
+    try:
+        while True:
+            if batch:
+                try:
+                    token = await asyncio.wait_for(queue.get(), last_flush + interval - monotonic())
+                except TimeoutError:
+                    token = None
+            else:
+                token = await queue.get()
+            if token is _END:
+                break
+            if token is not None:
+                batch.append(token)
+            if len(batch) >= budget or monotonic() - last_flush >= interval:
+                yield batch
+                batch = []
+                # Timed from when the caller is back, so tokens that queued
+                # up during its render are batched rather than sent singly
+                last_flush = monotonic()
+                budget = min(budget * _FLUSH_GROWTH_FACTOR, _MAX_TOKENS_PER_FLUSH)
+        if batch:
+            yield batch
+        await producer  # re-raise a provider error
+    finally:
+        producer.cancel()
+        # Errors were raised above; on early close only the cancel matters
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await producer
+
 
 def extract_markdown_units(buffer: str) -> tuple[str, str]:
     """Extract complete markdown units from a buffer. Returns (complete, in_progress).
@@ -28,37 +109,62 @@ def extract_markdown_units(buffer: str) -> tuple[str, str]:
     server-side chunked markdown rendering: render only complete units to avoid
     partial-syntax artifacts.
     """
-    if not buffer:
-        return ("", "")
-
-    lines = buffer.split("\n")
-    in_code = False
-    complete_lines: list[str] = []
-    i = 0
-
-    while i < len(lines):
-        line = lines[i]
-        if in_code:
-            complete_lines.append(line)
-            if line.strip().startswith("```"):
-                in_code = False
-            i += 1
-            continue
-        if line.strip().startswith("```"):
-            in_code = True
-            complete_lines.append(line)
-            i += 1
-            continue
-        complete_lines.append(line)
-        i += 1
-
-    if in_code:
-        return ("", "\n".join(complete_lines))
-
-    if len(complete_lines) <= 1:
+    if _odd_fences(buffer, 0, len(buffer)):
         return ("", buffer)
 
-    return ("\n".join(complete_lines[:-1]), complete_lines[-1])
+    last_newline = buffer.rfind("\n")
+    if last_newline == -1:
+        return ("", buffer)
+
+    return (buffer[:last_newline], buffer[last_newline + 1 :])
+
+
+def _odd_fences(buffer: str, start: int, end: int) -> bool:
+    """Whether ``buffer[start:end]`` (from a line start) toggles code-block state.
+
+    A fence is a line whose first non-blank characters are ```; the text is
+    left inside a code block iff it holds an odd number of fence lines.
+    """
+    odd = False
+    pos = buffer.find("```", start, end)
+    while pos != -1:
+        line_start = max(buffer.rfind("\n", start, pos) + 1, start)
+        if line_start == pos or buffer[line_start:pos].isspace():
+            odd = not odd
+        next_line = buffer.find("\n", pos, end)
+        if next_line == -1:
+            break
+        pos = buffer.find("```", next_line, end)
+    return odd
+
+
+class _MarkdownUnits:
+    """``extract_markdown_units`` for a buffer that only grows at the end.
+
+    Complete lines are scanned for fences once; each call scans only the
+    lines completed since the last call plus the current partial line.
+    """
+
+    __slots__ = ("_in_code", "_line_start")
+
+    def __init__(self) -> None:
+        self._in_code = False  # code-block state after the complete lines
+        self._line_start = 0  # start of the partial last line
+
+    def split_at(self, buffer: str) -> int:
+        """Index of the newline ending the complete part, or -1 if none.
+
+        ``(buffer[:i], buffer[i + 1 :])`` equals ``extract_markdown_units(buffer)``
+        for ``i >= 0``; ``-1`` means ``("", buffer)``.
+        """
+        last_newline = buffer.rfind("\n", self._line_start)
+        if last_newline != -1:
+            if _odd_fences(buffer, self._line_start, last_newline + 1):
+                self._in_code = not self._in_code
+            self._line_start = last_newline + 1
+        if self._in_code != _odd_fences(buffer, self._line_start, len(buffer)):
+            return -1
+        return self._line_start - 1
 
 
 def stream_to_fragments(
@@ -69,11 +175,13 @@ def stream_to_fragments(
     *,
     context_key: str = "text",
     extra_context: dict[str, Any] | None = None,
+    flush_interval_ms: float = 30.0,
 ) -> AsyncIterator[Any]:
     """Wrap an LLM token stream as a Fragment-yielding async generator.
 
     Accumulates tokens and yields a ``Fragment`` with the accumulated text
-    after each token. The Fragment re-renders the named block with the
+    as they arrive, coalescing tokens that land within ``flush_interval_ms``
+    of each other. The Fragment re-renders the named block with the
     current text, which htmx swaps into the DOM.
 
     Usage::
@@ -101,19 +209,20 @@ def stream_to_fragments(
             Defaults to ``"text"``.
         extra_context: Additional template variables passed to every
             Fragment render (e.g., user info, metadata).
+        flush_interval_ms: Coalescing window. The first token is sent at
+            once; later ones are batched per window. ``0`` yields a
+            Fragment per token.
 
     Yields:
         ``Fragment`` instances with progressively accumulated text.
     """
-    # Deferred import to avoid circular dependency
-    from chirp.templating.returns import Fragment
-
     return _stream_fragments(
         tokens,
         template_name,
         block_name,
         context_key=context_key,
         extra_context=extra_context or {},
+        flush_interval_ms=flush_interval_ms,
         fragment_cls=Fragment,
     )
 
@@ -125,17 +234,22 @@ async def _stream_fragments(
     *,
     context_key: str,
     extra_context: dict[str, Any],
+    flush_interval_ms: float,
     fragment_cls: type,
 ) -> AsyncIterator[Any]:
     """Internal generator that accumulates tokens and yields Fragments."""
-    accumulated = ""
-    async for token in tokens:
-        accumulated += token
-        yield fragment_cls(
-            template_name,
-            block_name,
-            **{context_key: accumulated, **extra_context},
-        )
+    # Each yielded Fragment keeps a reference to the text, so ``+=`` could
+    # never grow it in place — collect tokens and join once per yield.
+    chunks: list[str] = []
+    # Only the text changes between yields; ``**ctx`` gives each Fragment
+    # its own copy, so one dict is updated in place.
+    ctx = {**extra_context, context_key: ""}
+    # aclosing: closing this generator early must stop the token reader now
+    async with contextlib.aclosing(_coalesce(tokens, flush_interval_ms)) as batches:
+        async for batch in batches:
+            chunks.extend(batch)
+            ctx[context_key] = "".join(chunks)
+            yield fragment_cls(template_name, block_name, **ctx)
 
 
 def stream_with_sources(
@@ -150,6 +264,9 @@ def stream_with_sources(
     share_link_block: str | None = None,
     on_complete: Callable[[str, Any, dict[str, Any]], Any] | None = None,
     chunk_renderer: Callable[[str], str] | None = None,
+    flush_interval_ms: float = 30.0,
+    append_mode: bool = False,
+    in_progress_block: str | None = None,
 ) -> AsyncIterator[Any]:
     """Stream LLM tokens as fragments, optionally prefixed with a sources block.
 
@@ -170,6 +287,24 @@ def stream_with_sources(
                 response_block="answer",
             ))
 
+    With ``chunk_renderer``, each update normally re-sends all HTML rendered
+    so far. ``append_mode=True`` sends only the newly rendered HTML, as a
+    plain ``SSEEvent`` named after ``response_block`` (no out-of-band
+    wrapper), and the unfinished tail as ``in_progress`` to its own block,
+    so the stream carries each part of the answer once. The response
+    element appends what it receives::
+
+        {% block answer %}{{ text | markdown }}{% end %}
+        {% block answer_tail %}<p>{{ in_progress }}</p>{% end %}
+
+        <div id="answer" sse-swap="answer" hx-swap="beforeend"></div>
+        <div id="answer_tail" sse-swap="answer_tail"></div>
+
+    The tail element must sit outside the response element. When the
+    stream ends the response block is re-rendered whole (full text in
+    ``context_key``) as the usual out-of-band Fragment, replacing the
+    appended parts, and the tail is cleared.
+
     Args:
         tokens: Async iterator of string tokens (from ``llm.stream()``).
         template_name: Kida template containing the target blocks.
@@ -178,8 +313,16 @@ def stream_with_sources(
         sources: Context value passed to the sources block.
         context_key: Template variable name for accumulated text.
         extra_context: Additional context for all Fragment renders.
+        flush_interval_ms: Coalescing window for response fragments, as in
+            ``stream_to_fragments``. ``0`` yields a Fragment per token.
+        append_mode: Send only newly rendered HTML per update. Requires
+            ``chunk_renderer``.
+        in_progress_block: Block receiving the unfinished tail in
+            ``append_mode``. Without it the tail is not streamed.
     """
-    from chirp.templating.returns import Fragment
+    if append_mode and chunk_renderer is None:
+        msg = "append_mode requires a chunk_renderer"
+        raise ValueError(msg)
 
     return _stream_with_sources_impl(
         tokens,
@@ -192,6 +335,9 @@ def stream_with_sources(
         share_link_block=share_link_block,
         on_complete=on_complete,
         chunk_renderer=chunk_renderer,
+        flush_interval_ms=flush_interval_ms,
+        append_mode=append_mode,
+        in_progress_block=in_progress_block,
         fragment_cls=Fragment,
     )
 
@@ -208,7 +354,10 @@ async def _stream_with_sources_impl(
     share_link_block: str | None,
     on_complete: Callable[[str, Any, dict[str, Any]], Any] | None,
     chunk_renderer: Callable[[str], str] | None,
+    flush_interval_ms: float,
     fragment_cls: type,
+    append_mode: bool = False,
+    in_progress_block: str | None = None,
 ) -> AsyncIterator[Any]:
     """Internal: yield sources fragment, then stream response fragments."""
     # Phase 1: Send sources block (immediate, one-shot)
@@ -222,57 +371,66 @@ async def _stream_with_sources_impl(
         )
 
     # Phase 2: Stream response tokens as fragments
+    chunks: list[str] = []
     accumulated = ""
-    base_ctx: dict[str, Any] = {**extra_context}
+    base_ctx: dict[str, Any] = {**extra_context, "target": response_block}
     if sources is not None:
         base_ctx["sources"] = sources
-
-    if chunk_renderer:
-        rendered_html = ""
-        rendered_markdown = ""
-        async for token in tokens:
-            accumulated += token
-            complete, in_progress = extract_markdown_units(accumulated)
-            if complete and (not rendered_markdown or complete.startswith(rendered_markdown)):
-                new_markdown = complete[len(rendered_markdown) :]
-                if new_markdown:
-                    rendered_html += chunk_renderer(new_markdown)
-                    rendered_markdown = complete
-            yield fragment_cls(
-                template_name,
-                response_block,
-                target=response_block,
-                streaming=True,
-                rendered_html=rendered_html,
-                in_progress=in_progress,
-                **base_ctx,
-            )
-        if accumulated:
-            yield fragment_cls(
-                template_name,
-                response_block,
-                target=response_block,
-                streaming=False,
-                **{context_key: accumulated, **base_ctx},
-            )
-    else:
-        async for token in tokens:
-            accumulated += token
-            yield fragment_cls(
-                template_name,
-                response_block,
-                target=response_block,
-                streaming=True,
-                **{context_key: accumulated, **base_ctx},
-            )
-        if accumulated:
-            yield fragment_cls(
-                template_name,
-                response_block,
-                target=response_block,
-                streaming=False,
-                **{context_key: accumulated, **base_ctx},
-            )
+    # Invariant kwargs built once; each yield updates the changing keys and
+    # ``**`` gives every Fragment its own copy.
+    streaming_ctx = {**base_ctx, "streaming": True}
+
+    async with contextlib.aclosing(_coalesce(tokens, flush_interval_ms)) as batches:
+        if chunk_renderer and append_mode:
+            units = _MarkdownUnits()
+            rendered_end = 0
+            tail_ctx = {**streaming_ctx, "target": in_progress_block}
+            async for batch in batches:
+                chunks.extend(batch)
+                accumulated = "".join(chunks)
+                split = units.split_at(accumulated)
+                if split > rendered_end:
+                    # Raw HTML: an hx-swap-oob wrapper would be swapped in first,
+                    # then the element's own swap would clear it
+                    delta_html = chunk_renderer(accumulated[rendered_end:split])
+                    rendered_end = split
+                    yield SSEEvent(data=delta_html, event=response_block)
+                if in_progress_block:
+                    tail_ctx["in_progress"] = (
+                        accumulated[split + 1 :] if split != -1 else accumulated
+                    )
+                    yield fragment_cls(template_name, in_progress_block, **tail_ctx)
+            if in_progress_block and accumulated:
+                tail_ctx["in_progress"] = ""
+                tail_ctx["streaming"] = False
+                yield fragment_cls(template_name, in_progress_block, **tail_ctx)
+        elif chunk_renderer:
+            # The complete part only ever grows, so each update renders the
+            # markdown between the previous split and the new one.
+            units = _MarkdownUnits()
+            rendered_html = ""
+            rendered_end = 0
+            async for batch in batches:
+                chunks.extend(batch)
+                accumulated = "".join(chunks)
+                split = units.split_at(accumulated)
+                if split > rendered_end:
+                    rendered_html += chunk_renderer(accumulated[rendered_end:split])
+                    rendered_end = split
+                streaming_ctx["rendered_html"] = rendered_html
+                streaming_ctx["in_progress"] = (
+                    accumulated[split + 1 :] if split != -1 else accumulated
+                )
+                yield fragment_cls(template_name, response_block, **streaming_ctx)
+        else:
+            async for batch in batches:
+                chunks.extend(batch)
+                accumulated = "".join(chunks)
+                streaming_ctx[context_key] = accumulated
+                yield fragment_cls(template_name, response_block, **streaming_ctx)
+    if accumulated:
+        final_ctx = {**base_ctx, "streaming": False, context_key: accumulated}
+        yield fragment_cls(template_name, response_block, **final_ctx)
     if share_link_block and on_complete:
         share_slug = await on_complete(accumulated, sources, extra_context)
         if share_slug:
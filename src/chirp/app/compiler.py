@@ -8,7 +8,7 @@ from chirp._internal.invoke_plan import compile_invoke_plan
 from chirp.config import AppConfig
 from chirp.routing.route import Route
 from chirp.routing.router import Router, parse_path
-from chirp.templating.integration import create_environment
+from chirp.templating.integration import create_environment, precompile_templates
 from chirp.tools.registry import compile_tools
 
 from .registry import AppRegistry
@@ -177,8 +177,14 @@ def _compile_routes(
 ) -> Router:
     """Build router from pending routes."""
     router = Router()
+    # Most routes share a handful of method lists; build each set once so
+    # routes share one frozenset per distinct list.
+    method_sets: dict[tuple[str, ...], frozenset[str]] = {}
     for pending in pending_routes:
-        methods = frozenset(m.upper() for m in (pending.methods or ["GET"]))
+        key = tuple(pending.methods or ("GET",))
+        methods = method_sets.get(key)
+        if methods is None:
+            methods = method_sets[key] = frozenset(m.upper() for m in key)
         segments = parse_path(pending.path)
         path_param_names = frozenset(s.param_name for s in segments if s.is_param and s.param_name)
         invoke_plan = compile_invoke_plan(
@@ -278,6 +284,9 @@ class AppCompiler:
                 plugin_loaders=self._mutable.plugin_loaders,
             )
 
+        if self._config.precompile_templates and not self._config.debug:
+            precompile_templates(self._runtime.kida_env, self._config.template_dir)
+
         self._runtime.tool_registry = compile_tools(
             [(t.name, t.description, t.handler) for t in self._mutable.pending_tools],
             self._mutable.tool_events,
@@ -298,6 +307,14 @@ class AppCompiler:
 
         self._runtime.frozen = True
 
+        # Everything below now lives in the router, the middleware tuple and
+        # the template env; drop the setup-time copies so they do not pin
+        # handlers and middleware for the life of the app.
+        self._mutable.pending_routes.clear()
+        self._mutable.middleware_list.clear()
+        self._mutable.template_filters.clear()
+        self._mutable.template_globals.clear()
+
         sync_runtime_aliases()
         if self._config.debug and not self._config.skip_contract_checks:
             run_debug_checks()
@@ -1,6 +1,7 @@
 """ASGI lifespan and worker lifecycle coordination."""
 
 import inspect
+import sys
 from collections.abc import Callable
 from typing import Any
 
@@ -17,6 +18,13 @@ async def _run_hook(hook: Callable[..., Any]) -> None:
         await result
 
 
+async def _close_llm_clients() -> None:
+    """Close the running loop's pooled LLM clients, if ``chirp.ai`` was used."""
+    providers = sys.modules.get("chirp.ai._providers")
+    if providers is not None:
+        await providers.aclose_clients()
+
+
 class LifecycleCoordinator:
     """Owns lifespan and worker startup/shutdown behavior."""
 
@@ -60,6 +68,7 @@ class LifecycleCoordinator:
     async def handle_worker_shutdown(self) -> None:
         for hook in self._state.worker_shutdown_hooks:
             await _run_hook(hook)
+        await _close_llm_clients()
 
     async def _on_startup(self) -> None:
         if self._config.audit_sink == "log":
@@ -100,4 +109,5 @@ class LifecycleCoordinator:
             await _run_hook(hook)
         if self._state.db is not None:
             await self._state.db.disconnect()
+        await _close_llm_clients()
         self._state.tool_events.close()
@@ -195,6 +195,7 @@ class AppRegistry:
         from chirp.pages.shell_context import build_shell_context, resolve_meta
 
         _handler = handler
+        _handler_is_async = inspect.iscoroutinefunction(handler)
         _kind = kind
         _chain = layout_chain
         _providers = context_providers
@@ -276,7 +277,7 @@ class AppRegistry:
                             )
 
             kwargs = await resolve_kwargs(_handler, request, full_ctx, _service_providers)
-            result = await invoke(_handler, **kwargs)
+            result = await invoke(_handler, is_async=_handler_is_async, **kwargs)
             return upgrade_result(
                 result,
                 full_ctx,
@@ -1,10 +1,10 @@
 """ASGI runtime dispatch for App."""
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 from chirp._internal.asgi import Receive, Scope, Send
 from chirp.config import AppConfig
-from chirp.server.handler import create_request_handler, handle_request
+from chirp.server.handler import create_asgi_handler, create_request_handler
 
 from .lifecycle import LifecycleCoordinator
 from .state import MutableAppState, RuntimeAppState
@@ -19,6 +19,7 @@ class ASGIRuntime:
         "_ensure_frozen",
         "_lifecycle",
         "_mutable",
+        "_request",
         "_runtime",
     )
 
@@ -36,6 +37,7 @@ class ASGIRuntime:
         self._lifecycle = lifecycle
         self._ensure_frozen = ensure_frozen
         self._compiled_handler = None
+        self._request: Callable[[Scope, Receive, Send], Awaitable[None]] | None = None
 
     def _get_compiled_handler(self):
         if self._compiled_handler is None:
@@ -65,13 +67,21 @@ class ASGIRuntime:
             await self._lifecycle.handle_worker_shutdown()
             return
 
+        request = self._request
+        if request is None:
+            request = self._bind_request()
+        await request(scope, receive, send)
+
+    def _bind_request(self) -> Callable[[Scope, Receive, Send], Awaitable[None]]:
+        """Freeze the app and build its ASGI request handler.
+
+        Runtime state is fixed once frozen, so later requests skip the
+        freeze check and the argument lookups.
+        """
         self._ensure_frozen()
         assert self._runtime.router is not None
 
-        await handle_request(
-            scope,
-            receive,
-            send,
+        self._request = request = create_asgi_handler(
             router=self._runtime.router,
             middleware=self._runtime.middleware,
             error_handlers=self._mutable.error_handlers,
@@ -87,3 +97,4 @@ class ASGIRuntime:
             oob_registry=self._runtime.oob_registry,
             fragment_target_registry=self._runtime.fragment_target_registry,
         )
+        return request
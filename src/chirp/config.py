@@ -80,6 +80,9 @@ class AppConfig:
     autoescape: bool = True
     trim_blocks: bool = True
     lstrip_blocks: bool = True
+    # Compile every template under template_dir at startup (syntax errors fail fast,
+    # first requests skip the compile). Ignored in debug, where templates auto-reload.
+    precompile_templates: bool = False
 
     # Static files
     static_dir: str | Path | None = "static"
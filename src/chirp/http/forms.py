@@ -12,14 +12,19 @@ coercion for ``str``, ``int``, ``float``, and ``bool``.
 URL-encoded forms use stdlib ``urllib.parse`` — no extra dependency.
 """
 
+import asyncio
 from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from dataclasses import fields as dc_fields
 from pathlib import Path
 from typing import Any, cast, get_type_hints
+from urllib.parse import unquote_plus
 
 from chirp.templating.returns import ValidationError
 
+# UploadFile.save() writes at most this many bytes on the event loop thread.
+_INLINE_SAVE_MAX = 64 * 1024
+
 
 @dataclass(frozen=True, slots=True)
 class UploadFile:
@@ -43,10 +48,17 @@ class UploadFile:
     async def save(self, path: Path) -> None:
         """Write the file content to disk.
 
+        Files larger than 64 KB are written from a worker thread so the
+        blocking ``write()`` does not stall the event loop; smaller ones are
+        written inline, where the thread hop would cost more than the write.
+
         Args:
             path: Destination file path. Parent directories must exist.
         """
-        path.write_bytes(self._content)
+        if self.size <= _INLINE_SAVE_MAX:
+            path.write_bytes(self._content)
+            return
+        await asyncio.to_thread(path.write_bytes, self._content)
 
     def __repr__(self) -> str:
         return f"UploadFile({self.filename!r}, {self.content_type!r}, {self.size} bytes)"
@@ -330,11 +342,45 @@ async def parse_form_data(
 
 
 def _parse_urlencoded(body: bytes) -> FormData:
-    """Parse URL-encoded form data using stdlib."""
-    from urllib.parse import parse_qs
+    """Parse URL-encoded form data.
 
-    parsed = parse_qs(body.decode("utf-8"), keep_blank_values=True)
-    return FormData(parsed)
+    Same result as ``parse_qs(..., keep_blank_values=True)``, but pairs
+    without ``+`` or ``%`` escapes — most short form fields — skip the
+    unquote step entirely.
+    """
+    data: dict[str, list[str]] = {}
+    for pair in body.decode("utf-8").split("&"):
+        if not pair:
+            continue
+        name, _, value = pair.partition("=")
+        if "+" in pair or "%" in pair:
+            name = unquote_plus(name)
+            value = unquote_plus(value)
+        data.setdefault(name, []).append(value)
+    return FormData(data)
+
+
+def parse_urlencoded_fields(body: bytes, names: tuple[str, ...]) -> tuple[str | None, ...]:
+    """Extract the first value of each of *names* from a URL-encoded body.
+
+    Values are whitespace-stripped; a field absent from the body yields
+    ``None``. Only the requested fields are unquoted, no ``FormData`` is
+    built, and the scan stops once every name has been found.
+    """
+    wanted = set(names)
+    found: dict[str, str] = {}
+    for pair in body.decode("utf-8").split("&"):
+        name, _, value = pair.partition("=")
+        if "+" in name or "%" in name:
+            name = unquote_plus(name)
+        if name not in wanted or name in found:
+            continue
+        if "+" in value or "%" in value:
+            value = unquote_plus(value)
+        found[name] = value.strip()
+        if len(found) == len(wanted):
+            break
+    return tuple(found.get(name) for name in names)
 
 
 async def _parse_multipart(body: bytes, content_type: str) -> FormData:
@@ -380,7 +426,9 @@ async def _parse_multipart(body: bytes, content_type: str) -> FormData:
         current_filename = None
 
     def on_part_data(data_chunk: bytes, start: int, end: int) -> None:
-        current_data.extend(data_chunk[start:end])
+        # memoryview slice: append straight from the parser's buffer
+        # without materializing an intermediate bytes copy per chunk.
+        current_data.extend(memoryview(data_chunk)[start:end])
 
     def on_part_end() -> None:
         nonlocal current_field_name, current_filename
@@ -24,44 +24,49 @@ class Headers(Mapping[str, str]):
 
     Attributes:
         _raw: Raw (name, value) byte pairs from ASGI scope.
+        _index: Lowercased name → first raw value, built on the first
+            lookup so each later lookup is one dict probe, not a scan.
 
     ``__getitem__`` returns the first matching value.
     ``get_list`` returns all values for a header (e.g. multiple ``Set-Cookie``).
     """
 
     _raw: tuple[tuple[bytes, bytes], ...]
+    _index: dict[bytes, bytes] | None
 
-    __slots__ = ("_raw",)
+    __slots__ = ("_index", "_raw")
 
     def __init__(self, raw: tuple[tuple[bytes, bytes], ...] = ()) -> None:
         object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_index", None)
+
+    def _ensure_index(self) -> dict[bytes, bytes]:
+        index = self._index
+        if index is None:
+            index = {}
+            for name, value in self._raw:
+                index.setdefault(name.lower(), value)
+            # Racing builders produce equal dicts; either one may win.
+            object.__setattr__(self, "_index", index)
+        return index
 
     def __getitem__(self, key: str) -> str:
-        key_lower = key.lower().encode("latin-1")
-        for name, value in self._raw:
-            if name.lower() == key_lower:
-                return value.decode("latin-1")
-        raise KeyError(key)
+        value = self._ensure_index().get(key.lower().encode("latin-1"))
+        if value is None:
+            raise KeyError(key)
+        return value.decode("latin-1")
 
     def __contains__(self, key: object) -> bool:
         if not isinstance(key, str):
             return False
-        key_lower = key.lower().encode("latin-1")
-        return any(name.lower() == key_lower for name, _ in self._raw)
+        return key.lower().encode("latin-1") in self._ensure_index()
 
     def __iter__(self) -> Iterator[str]:
-        seen: set[str] = set()
-        for name, _ in self._raw:
-            key = name.decode("latin-1").lower()
-            if key not in seen:
-                seen.add(key)
-                yield key
+        for name in self._ensure_index():
+            yield name.decode("latin-1")
 
     def __len__(self) -> int:
-        seen: set[str] = set()
-        for name, _ in self._raw:
-            seen.add(name.decode("latin-1").lower())
-        return len(seen)
+        return len(self._ensure_index())
 
     def __repr__(self) -> str:
         items = ", ".join(f"{k!r}: {self[k]!r}" for k in self)
@@ -69,10 +74,10 @@ class Headers(Mapping[str, str]):
 
     def get(self, key: str, default: str | None = None) -> str | None:  # type: ignore[override]
         """Return the first value for *key*, or *default* if missing."""
-        try:
-            return self[key]
-        except KeyError:
+        value = self._ensure_index().get(key.lower().encode("latin-1"))
+        if value is None:
             return default
+        return value.decode("latin-1")
 
     def get_list(self, key: str) -> list[str]:
         """Return all values for *key* (e.g. multiple ``Set-Cookie``)."""
@@ -10,6 +10,7 @@ from collections.abc import AsyncGenerator, Iterator, Mapping
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote, urlparse
+from uuid import uuid4
 
 from chirp._internal.asgi import Receive, Scope
 from chirp.http.cookies import parse_cookies
@@ -391,6 +392,29 @@ class Request:
         self._cache["_form"] = result
         return result
 
+    async def form_fields(self, *names: str) -> tuple[str | None, ...]:
+        """Return the first value of each named form field, whitespace-stripped.
+
+        For handlers that read a few known fields. URL-encoded bodies are
+        scanned once for just these names instead of being parsed into a
+        full ``FormData``; other encodings (or an already-parsed form) go
+        through ``form()``. Missing fields are ``None``.
+
+        Usage::
+
+            text, tag = await request.form_fields("text", "tag")
+        """
+        ct = self.content_type or "application/x-www-form-urlencoded"
+        if "_form" not in self._cache and ct.split(";")[0].strip().lower() == (
+            "application/x-www-form-urlencoded"
+        ):
+            from chirp.http.forms import parse_urlencoded_fields
+
+            return parse_urlencoded_fields(await self.body(), names)
+
+        form = await self.form()
+        return tuple(None if (value := form.get(name)) is None else value.strip() for name in names)
+
     # -- Factory --
 
     @classmethod
@@ -405,15 +429,11 @@ class Request:
         Reuses request_id from scope["extensions"]["request_id"] when Pounce
         (or another ASGI server) has already set it, avoiding redundant UUID generation.
         """
-        import uuid
-
         headers = Headers(tuple(scope.get("headers", ())))
         server = scope.get("server")
         client = scope.get("client")
         extensions = scope.get("extensions") or {}
-        request_id = (
-            extensions.get("request_id") or headers.get("x-request-id") or str(uuid.uuid4())
-        )
+        request_id = extensions.get("request_id") or headers.get("x-request-id") or str(uuid4())
         query_raw = scope.get("query_string", b"")
         cookie_header = headers.get("cookie") or ""
         return cls(
@@ -40,6 +40,9 @@ from chirp.security.audit import emit_security_event
 
 _csrf_token_var: ContextVar[str | None] = ContextVar("chirp_csrf_token", default=None)
 
+# Rendered hidden input, memoized per request by csrf_field()
+_csrf_field_var: ContextVar[str | None] = ContextVar("chirp_csrf_field", default=None)
+
 # Methods that mutate state and need CSRF protection
 _UNSAFE_METHODS: frozenset[str] = frozenset({"POST", "PUT", "PATCH", "DELETE"})
 
@@ -71,11 +74,18 @@ def csrf_field() -> str:
         </form>
 
     Renders: ``<input type="hidden" name="_csrf_token" value="...">``
+
+    The markup is built once per request; pages with several forms
+    reuse it.
     """
-    from kida.utils.html import Markup
+    html = _csrf_field_var.get()
+    if html is None:
+        from kida.utils.html import Markup
 
-    token = get_csrf_token()
-    return Markup(f'<input type="hidden" name="_csrf_token" value="{token}">')
+        token = get_csrf_token()
+        html = Markup(f'<input type="hidden" name="_csrf_token" value="{token}">')
+        _csrf_field_var.set(html)
+    return html
 
 
 def csrf_token() -> str:
@@ -161,6 +171,7 @@ class CSRFMiddleware:
 
         # Make token available via ContextVar
         cv_token = _csrf_token_var.set(token)
+        cv_field = _csrf_field_var.set(None)
 
         try:
             # Validate on unsafe methods
@@ -169,6 +180,7 @@ class CSRFMiddleware:
 
             return await next(request)
         finally:
+            _csrf_field_var.reset(cv_field)
             _csrf_token_var.reset(cv_token)
 
 
@@ -7,10 +7,15 @@ horizontal scaling, use ``RedisSessionStore``.
 The session object is stored in a ContextVar, accessible via
 ``get_session()`` from any handler or middleware.
 
+``CookieSessionStore`` can keep recently seen sessions decoded in memory
+(``SessionConfig.cache_size``) so consecutive requests carrying the cookie
+it just issued skip signature verification and deserialization.
+
 ``itsdangerous`` is required for cookie store. ``redis`` is required
 for RedisSessionStore (``pip install chirp[redis]``).
 """
 
+import threading
 from contextvars import ContextVar
 from dataclasses import dataclass
 from time import time
@@ -118,15 +123,32 @@ class SessionConfig:
     created_at_key: str = "__created_at"
     last_seen_at_key: str = "__last_seen_at"
     store: SessionStore | None = None  # None = CookieSessionStore (default)
+    cache_size: int = 0  # decoded cookie sessions kept in memory; 0 = off
+
+
+def _copy_session(value: Any) -> Any:
+    """Deep-copy decoded JSON session data."""
+    if type(value) is dict:
+        return {k: _copy_session(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_session(v) for v in value]
+    return value
 
 
 # -- Store implementations --
 
 
 class CookieSessionStore:
-    """Signed cookie session store. Session data stored in cookie."""
+    """Signed cookie session store. Session data stored in cookie.
 
-    __slots__ = ("_config", "_serializer")
+    With ``cache_size`` set, each cookie this store issues or decodes is
+    remembered with its data until the cookie's ``max_age`` runs out, up to
+    ``cache_size`` entries (oldest evicted first). Handlers always get a
+    private copy, so mutating the session never touches the cache. Empty
+    sessions — e.g. after ``regenerate_session()`` — are not cached.
+    """
+
+    __slots__ = ("_cache", "_config", "_lock", "_serializer")
 
     def __init__(self, config: SessionConfig) -> None:
         try:
@@ -141,17 +163,28 @@ class CookieSessionStore:
             raise ConfigurationError(msg)
         self._config = config
         self._serializer = URLSafeTimedSerializer(config.secret_key)
+        self._cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
 
     async def load(self, request: Request) -> dict[str, Any]:
         cookie_value = request.cookies.get(self._config.cookie_name)
         if not cookie_value:
             return {}
+        if self._config.cache_size:
+            with self._lock:
+                entry = self._cache.get(cookie_value)
+            if entry is not None and entry[0] > time():
+                return self._apply_timeouts(_copy_session(entry[1]))
         try:
-            data = self._serializer.loads(cookie_value, max_age=self._config.max_age)
+            data, signed_at = self._serializer.loads(
+                cookie_value, max_age=self._config.max_age, return_timestamp=True
+            )
         except Exception:
             return {}
         if not isinstance(data, dict):
             return {}
+        if self._config.cache_size and data:
+            self._remember(cookie_value, signed_at.timestamp(), _copy_session(data))
         return self._apply_timeouts(data)
 
     async def save(
@@ -162,7 +195,14 @@ class CookieSessionStore:
         regenerate_old_id: str | None = None,
     ) -> AnyResponse:
         cfg = self._config
+        # The signer stamps whole seconds; reading the clock first means the
+        # cached entry never outlives the cookie's own max_age check.
+        signed_at = int(time())
         value = self._serializer.dumps(session)
+        if cfg.cache_size and session:
+            # Cache what load() would decode (str keys, lists), not the dict
+            codec = self._serializer.serializer
+            self._remember(value, signed_at, codec.loads(codec.dumps(session)))
         return response.with_cookie(
             name=cfg.cookie_name,
             value=value,
@@ -174,6 +214,15 @@ class CookieSessionStore:
             samesite=cfg.samesite,
         )
 
+    def _remember(self, cookie_value: str, signed_at: float, data: dict[str, Any]) -> None:
+        expires_at = signed_at + self._config.max_age
+        with self._lock:
+            cache = self._cache
+            cache.pop(cookie_value, None)
+            while len(cache) >= self._config.cache_size:
+                del cache[next(iter(cache))]
+            cache[cookie_value] = (expires_at, data)
+
     def _apply_timeouts(self, data: dict[str, Any]) -> dict[str, Any]:
         cfg = self._config
         if cfg.idle_timeout_seconds is None and cfg.absolute_timeout_seconds is None:
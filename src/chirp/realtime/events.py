@@ -42,6 +42,8 @@ class EventStream:
     - ``dict``: JSON-serialized as data
     - ``Fragment``: rendered via kida, sent with ``event: fragment``
     - ``SSEEvent``: sent as-is
+    - ``bytes``: written to the wire untouched — must already be complete
+      SSE frames (e.g. ``SSEEvent(...).encode().encode()`` built ahead of time)
 
     Usage::
 
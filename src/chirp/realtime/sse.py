@@ -91,6 +91,9 @@ async def handle_sse(
         the ``finally`` block could suppress the exception.
         """
         pending_next: asyncio.Task[Any] | None = None
+        # Templates resolved once per stream: a token stream re-renders the
+        # same block many times, so later events skip the loader lookup.
+        templates: dict[str, Any] = {}
         try:
             heartbeat_interval = event_stream.heartbeat_interval
             gen_iter = event_stream.generator.__aiter__()
@@ -135,29 +138,36 @@ async def handle_sse(
                 except StopAsyncIteration:
                     break
 
-                # Error boundary: per-event isolation.  A rendering failure
-                # in one block should not kill the entire stream.
-                try:
-                    sse_text = _format_event(
-                        value,
-                        default_event=event_stream.event_type,
-                        kida_env=kida_env,
-                    )
-                except Exception as render_exc:
-                    from chirp.server.terminal_errors import log_error
-
-                    log_error(render_exc)
-                    if debug:
-                        sse_text = _format_error_event(value, render_exc)
-                    else:
-                        continue  # Skip this event, keep stream alive
-
-                if sse_text:
+                # Pre-framed bytes go to the wire as-is: no formatting and
+                # no encode per event.
+                if isinstance(value, bytes):
+                    body = value
+                else:
+                    # Error boundary: per-event isolation.  A rendering failure
+                    # in one block should not kill the entire stream.
+                    try:
+                        sse_text = _format_event(
+                            value,
+                            default_event=event_stream.event_type,
+                            kida_env=kida_env,
+                            templates=templates,
+                        )
+                    except Exception as render_exc:
+                        from chirp.server.terminal_errors import log_error
+
+                        log_error(render_exc)
+                        if debug:
+                            sse_text = _format_error_event(value, render_exc)
+                        else:
+                            continue  # Skip this event, keep stream alive
+                    body = sse_text.encode("utf-8")
+
+                if body:
                     try:
                         await send(
                             {
                                 "type": "http.response.body",
-                                "body": sse_text.encode("utf-8"),
+                                "body": body,
                                 "more_body": True,
                             }
                         )
@@ -239,9 +249,12 @@ def _format_event(
     *,
     default_event: str | None = None,
     kida_env: Environment | None = None,
+    templates: dict[str, Any] | None = None,
 ) -> str:
     """Convert a yielded value to SSE wire format.
 
+    *templates* caches resolved templates by name across calls.
+
     Dispatch:
         - ``SSEEvent`` -> encode as-is
         - ``Fragment`` -> render via kida, wrap with event: fragment
@@ -254,9 +267,12 @@ def _format_event(
     if isinstance(value, Fragment):
         if kida_env is None:
             raise RuntimeError("Fragment events require kida integration.")
-        from chirp.templating.integration import render_fragment
-
-        html = render_fragment(kida_env, value).strip()
+        template = templates.get(value.template_name) if templates is not None else None
+        if template is None:
+            template = kida_env.get_template(value.template_name)
+            if templates is not None:
+                templates[value.template_name] = template
+        html = template.render_block(value.block_name, value.context).strip()
         # Use the Fragment's target as the SSE event name when specified.
         # This allows sse-swap="target_id" on DOM elements to receive
         # updates for specific blocks (reactive templates pattern).
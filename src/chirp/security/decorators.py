@@ -26,7 +26,7 @@ Usage::
 import logging
 from collections.abc import Awaitable, Callable
 from functools import wraps
-from inspect import isawaitable
+from inspect import isawaitable, iscoroutinefunction
 from typing import Any
 from urllib.parse import quote
 
@@ -75,6 +75,7 @@ def login_required(handler: Callable) -> Callable:
         def dashboard():
             return Template("dashboard.html")
     """
+    handler_is_async = iscoroutinefunction(handler)
 
     @wraps(handler)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -100,7 +101,7 @@ def login_required(handler: Callable) -> Callable:
             emit_security_event("auth.require.unauthenticated", request=request)
             raise HTTPError(status=401, detail="Authentication required")
 
-        return await invoke(handler, *args, **kwargs)
+        return await invoke(handler, *args, is_async=handler_is_async, **kwargs)
 
     return wrapper
 
@@ -126,11 +127,15 @@ def requires(
             return Template("edit.html")
     """
 
+    required = frozenset(permissions)
+
     def decorator(handler: Callable) -> Callable:
+        handler_is_async = iscoroutinefunction(handler)
+
         @wraps(handler)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             from chirp.context import get_request
-            from chirp.middleware.auth import UserWithPermissions, _active_config, get_user
+            from chirp.middleware.auth import _active_config, get_user
 
             user = get_user()
             if not user.is_authenticated:
@@ -151,8 +156,11 @@ def requires(
                 emit_security_event("auth.require.unauthenticated", request=request)
                 raise HTTPError(status=401, detail="Authentication required")
 
-            # Check permissions
-            if not isinstance(user, UserWithPermissions):
+            # Check permissions. A plain attribute probe instead of an
+            # isinstance() against the runtime_checkable UserWithPermissions
+            # protocol, which re-checks every protocol member per request.
+            user_permissions = getattr(user, "permissions", None)
+            if user_permissions is None:
                 _log.warning(
                     "User %s model does not implement permissions protocol",
                     user.id,
@@ -164,9 +172,8 @@ def requires(
                 )
                 raise HTTPError(status=403, detail="Forbidden")
 
-            required = frozenset(permissions)
-            if not required.issubset(user.permissions):
-                missing = required - user.permissions
+            if not required.issubset(user_permissions):
+                missing = required - user_permissions
                 _log.warning(
                     "User %s missing permissions: %s",
                     user.id,
@@ -193,7 +200,7 @@ def requires(
                     )
                     raise HTTPError(status=403, detail="Forbidden")
 
-            return await invoke(handler, *args, **kwargs)
+            return await invoke(handler, *args, is_async=handler_is_async, **kwargs)
 
         return wrapper
 
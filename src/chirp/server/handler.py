@@ -5,7 +5,7 @@ to typed Request objects, dispatches through middleware and routing,
 and sends Response back through ASGI send().
 """
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from contextvars import Token
 from dataclasses import replace
 from typing import Any
@@ -43,14 +43,18 @@ def compile_middleware_chain(
     middleware: tuple[Callable[..., Any], ...],
     dispatch: Callable[[Request], Any],
 ) -> Callable[[Request], Any]:
-    """Build middleware chain once. Returns async handler(req) -> Response."""
+    """Build middleware chain once. Returns async handler(req) -> Response.
+
+    Each layer is a plain function handing back the middleware's awaitable,
+    so a request creates one coroutine per middleware rather than two.
+    """
     chain = dispatch
     for mw in reversed(middleware):
         inner = chain
         mw_ref = mw
 
-        async def layer(req: Request, _mw: Any = mw_ref, _next: Next = inner) -> AnyResponse:
-            return await _mw(req, _next)
+        def layer(req: Request, _mw: Any = mw_ref, _next: Next = inner) -> Awaitable[AnyResponse]:
+            return _mw(req, _next)
 
         chain = layer
     return chain
@@ -137,78 +141,127 @@ async def handle_request(
     oob_registry: OOBRegistry | None = None,
     fragment_target_registry: FragmentTargetRegistry | None = None,
 ) -> None:
-    """Process a single HTTP request through the full pipeline."""
-    if scope["type"] != "http":
-        return
+    """Process a single HTTP request through the full pipeline.
 
-    # Build Request from ASGI scope
-    request = Request.from_asgi(scope, receive)
+    One-off form of ``create_asgi_handler``; the app runtime builds its
+    handler once and calls that instead.
+    """
+    handler = create_asgi_handler(
+        router=router,
+        middleware=middleware,
+        error_handlers=error_handlers,
+        kida_env=kida_env,
+        debug=debug,
+        providers=providers,
+        tool_registry=tool_registry,
+        mcp_path=mcp_path,
+        sse_heartbeat_interval=sse_heartbeat_interval,
+        sse_retry_ms=sse_retry_ms,
+        sse_close_event=sse_close_event,
+        compiled_handler=compiled_handler,
+        oob_registry=oob_registry,
+        fragment_target_registry=fragment_target_registry,
+    )
+    await handler(scope, receive, send)
 
-    # Pounce sync workers set this so sync handlers run directly on the
-    # worker thread instead of being dispatched through asyncio.to_thread().
-    extensions = scope.get("extensions") or {}
-    force_inline_sync = bool(extensions.get("pounce.inline_sync"))
 
-    # Set request and request_id context vars (reset after dispatch)
-    token: Token[Request] = request_var.set(request)
-    rid_token = request_id_var.set(request.request_id)
-    sync_token = force_inline_sync_var.set(force_inline_sync)
+def create_asgi_handler(
+    *,
+    router: Router,
+    middleware: tuple[Callable[..., Any], ...],
+    error_handlers: dict[int | type, Callable[..., Any]],
+    kida_env: Environment | None = None,
+    debug: bool,
+    providers: dict[type, Callable[..., Any]] | None = None,
+    tool_registry: ToolRegistry | None = None,
+    mcp_path: str = "/mcp",
+    sse_heartbeat_interval: float = 15.0,
+    sse_retry_ms: int | None = None,
+    sse_close_event: str | None = None,
+    compiled_handler: Callable[[Request], Any] | None = None,
+    oob_registry: OOBRegistry | None = None,
+    fragment_target_registry: FragmentTargetRegistry | None = None,
+) -> Callable[[Scope, Receive, Send], Awaitable[None]]:
+    """Build the per-app ASGI request handler once. Reuse per request.
 
+    The settings are closed over, so each request is a three-argument call
+    with no keyword arguments to pack and parse.
+    """
     if compiled_handler is None:
         msg = "compiled_handler is required; ASGIRuntime always provides it"
         raise RuntimeError(msg)
+    chain = compiled_handler
+
+    async def handle(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return
+
+        # Build Request from ASGI scope
+        request = Request.from_asgi(scope, receive)
+
+        # Pounce sync workers set this so sync handlers run directly on the
+        # worker thread instead of being dispatched through asyncio.to_thread().
+        extensions = scope.get("extensions") or {}
+        force_inline_sync = bool(extensions.get("pounce.inline_sync"))
+
+        # Set request and request_id context vars (reset after dispatch)
+        token: Token[Request] = request_var.set(request)
+        rid_token = request_id_var.set(request.request_id)
+        sync_token = force_inline_sync_var.set(force_inline_sync)
+
+        try:
+            response = await chain(request)
+        except HTTPError as exc:
+            response = await handle_http_error(
+                exc,
+                request,
+                error_handlers,
+                kida_env,
+                debug,
+                oob_registry=oob_registry,
+                fragment_target_registry=fragment_target_registry,
+            )
+        except Exception as exc:
+            response = await handle_internal_error(
+                exc,
+                request,
+                error_handlers,
+                kida_env,
+                debug,
+                oob_registry=oob_registry,
+                fragment_target_registry=fragment_target_registry,
+            )
+        finally:
+            g._reset()
+            request_var.reset(token)
+            request_id_var.reset(rid_token)
+            force_inline_sync_var.reset(sync_token)
+
+        # Dispatch based on response type — X-Request-ID injected at send time
+        # to avoid an extra Response clone + tuple allocation per request.
+        rid = request.request_id
+        if isinstance(response, SSEResponse):
+            from chirp.realtime.sse import handle_sse
+
+            stream = response.event_stream
+            if stream.heartbeat_interval == 15.0:
+                stream = replace(stream, heartbeat_interval=sse_heartbeat_interval)
+
+            await handle_sse(
+                stream,
+                send,
+                receive,
+                kida_env=response.kida_env,
+                debug=debug,
+                retry_ms=sse_retry_ms,
+                close_event=sse_close_event,
+            )
+        elif isinstance(response, StreamingResponse):
+            await send_streaming_response(response, send, debug=debug, request_id=rid)
+        else:
+            await send_response(response, send, request_id=rid)
 
-    try:
-        response = await compiled_handler(request)
-    except HTTPError as exc:
-        response = await handle_http_error(
-            exc,
-            request,
-            error_handlers,
-            kida_env,
-            debug,
-            oob_registry=oob_registry,
-            fragment_target_registry=fragment_target_registry,
-        )
-    except Exception as exc:
-        response = await handle_internal_error(
-            exc,
-            request,
-            error_handlers,
-            kida_env,
-            debug,
-            oob_registry=oob_registry,
-            fragment_target_registry=fragment_target_registry,
-        )
-    finally:
-        g._reset()
-        request_var.reset(token)
-        request_id_var.reset(rid_token)
-        force_inline_sync_var.reset(sync_token)
-
-    # Dispatch based on response type — X-Request-ID injected at send time
-    # to avoid an extra Response clone + tuple allocation per request.
-    rid = request.request_id
-    if isinstance(response, SSEResponse):
-        from chirp.realtime.sse import handle_sse
-
-        stream = response.event_stream
-        if stream.heartbeat_interval == 15.0:
-            stream = replace(stream, heartbeat_interval=sse_heartbeat_interval)
-
-        await handle_sse(
-            stream,
-            send,
-            receive,
-            kida_env=response.kida_env,
-            debug=debug,
-            retry_ms=sse_retry_ms,
-            close_event=sse_close_event,
-        )
-    elif isinstance(response, StreamingResponse):
-        await send_streaming_response(response, send, debug=debug, request_id=rid)
-    else:
-        await send_response(response, send, request_id=rid)
+    return handle
 
 
 async def _invoke_handler(
@@ -263,13 +316,19 @@ async def _invoke_handler(
     # When a compiled plan exists, pass cached flags to skip per-request inspect.
     # force_inline_sync overrides to_thread dispatch (set by Pounce sync workers
     # where the event loop is single-purpose and blocking is safe).
-    invoke_kw: dict[str, Any] = {}
-    if plan is not None:
-        invoke_kw["is_async"] = plan.is_async
-        invoke_kw["inline_sync"] = plan.inline_sync or force_inline_sync
-    elif force_inline_sync:
-        invoke_kw["inline_sync"] = True
-    result = await invoke(handler, **invoke_kw, **kwargs)
+    if plan is not None and plan.is_async:
+        # Known coroutine function: await it directly — invoke() would only add
+        # a coroutine frame and re-pack kwargs into a second dict.
+        result = await handler(**kwargs)
+    elif plan is not None:
+        result = await invoke(
+            handler,
+            is_async=False,
+            inline_sync=plan.inline_sync or force_inline_sync,
+            **kwargs,
+        )
+    else:
+        result = await invoke(handler, inline_sync=force_inline_sync, **kwargs)
 
     return negotiate(
         result,
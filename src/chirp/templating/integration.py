@@ -6,6 +6,7 @@ once during App._freeze() and passed through the request pipeline.
 """
 
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any, cast
 
 from kida import ChoiceLoader, Environment, FileSystemLoader, PackageLoader
@@ -124,6 +125,25 @@ def create_environment(
     return env
 
 
+def precompile_templates(env: Environment, template_dir: str | Path) -> int:
+    """Compile every ``.html`` template under *template_dir* into *env*'s cache.
+
+    Called once during ``App._freeze()`` when ``AppConfig.precompile_templates``
+    is set, so the first request for each template does not pay for loading
+    and compiling it. Syntax errors surface at startup instead of on first render.
+
+    Returns the number of templates compiled.
+    """
+    root = Path(template_dir)
+    if not root.is_dir():
+        return 0
+    count = 0
+    for path in sorted(root.rglob("*.html")):
+        env.get_template(path.relative_to(root).as_posix())
+        count += 1
+    return count
+
+
 def render_template(env: Environment, tpl: Template) -> str:
     """Render a full template to string."""
     template = env.get_template(tpl.name)
@@ -13,12 +13,48 @@ import asyncio
 import contextlib
 import inspect
 from collections.abc import MutableMapping
+from http.cookies import CookieError, SimpleCookie
 from typing import Any
 
 from chirp.app import App
 from chirp.http.response import Response
 from chirp.testing.sse import SSETestResult, parse_sse_frames
 
+# Scope fields that never vary between test requests. There is no socket to
+# keep alive in-process — the per-request cost is building the scope, so the
+# invariant part is built once and copied.
+_BASE_SCOPE: dict[str, Any] = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "root_path": "",
+    "server": ("testserver", 80),
+    "client": ("127.0.0.1", 0),
+}
+
+
+def _build_scope(
+    method: str,
+    path: str,
+    raw_headers: list[tuple[bytes, bytes]],
+    headers: dict[str, str] | None,
+) -> dict[str, Any]:
+    """Build an HTTP ASGI scope, appending *headers* to *raw_headers*."""
+    path_part, _, query_string = path.partition("?")
+    if headers:
+        raw_headers.extend(
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers.items()
+        )
+    return {
+        **_BASE_SCOPE,
+        "method": method,
+        "path": path_part,
+        "raw_path": path_part.encode("latin-1"),
+        "query_string": query_string.encode("latin-1"),
+        "headers": raw_headers,
+    }
+
 
 async def _worker_lifecycle_receive() -> dict[str, Any]:
     """Dummy receive for worker startup/shutdown — returns disconnect immediately."""
@@ -41,12 +77,42 @@ class TestClient:
         async with TestClient(app) as client:
             response = await client.get("/")
             assert response.status == 200
+
+    With ``persist_cookies=True`` the client keeps a cookie jar: cookies
+    from ``set-cookie`` responses are stored in ``client.cookies`` and sent
+    back on later requests, like a browser. An explicit ``Cookie`` header
+    on a request takes precedence over the jar.
     """
 
-    __slots__ = ("app",)
+    __slots__ = ("_persist_cookies", "app", "cookies")
 
-    def __init__(self, app: App) -> None:
+    def __init__(self, app: App, *, persist_cookies: bool = False) -> None:
         self.app = app
+        self.cookies: SimpleCookie = SimpleCookie()
+        self._persist_cookies = persist_cookies
+
+    def _with_cookies(self, headers: dict[str, str] | None) -> dict[str, str] | None:
+        """Add the jar's ``Cookie`` header unless the caller set one."""
+        if not self._persist_cookies or not self.cookies:
+            return headers
+        if headers and any(name.lower() == "cookie" for name in headers):
+            return headers
+        cookie = "; ".join(f"{m.key}={m.coded_value}" for m in self.cookies.values())
+        return {**(headers or {}), "Cookie": cookie}
+
+    def _store_cookies(self, set_cookies: list[str]) -> None:
+        """Update the jar from ``set-cookie`` values; ``Max-Age=0`` deletes."""
+        for value in set_cookies:
+            jar: SimpleCookie = SimpleCookie()
+            try:
+                jar.load(value)
+            except CookieError:
+                continue
+            for key, morsel in jar.items():
+                if morsel["max-age"] == "0":
+                    self.cookies.pop(key, None)
+                else:
+                    self.cookies[key] = morsel
 
     async def __aenter__(self) -> TestClient:
         self.app._ensure_frozen()
@@ -224,33 +290,9 @@ class TestClient:
             raise TypeError(msg)
         if timeout is not None:
             disconnect_after = timeout
-        # Split path and query string
-        if "?" in path:
-            path_part, query_string = path.split("?", 1)
-        else:
-            path_part = path
-            query_string = ""
-
-        # Build raw ASGI headers
-        raw_headers: list[tuple[bytes, bytes]] = [
-            (b"accept", b"text/event-stream"),
-        ]
-        for name, value in (headers or {}).items():
-            raw_headers.append((name.lower().encode("latin-1"), value.encode("latin-1")))
-
-        scope: dict[str, Any] = {
-            "type": "http",
-            "asgi": {"version": "3.0"},
-            "http_version": "1.1",
-            "method": "GET",
-            "path": path_part,
-            "raw_path": path_part.encode("latin-1"),
-            "query_string": query_string.encode("latin-1"),
-            "root_path": "",
-            "headers": raw_headers,
-            "server": ("testserver", 80),
-            "client": ("127.0.0.1", 0),
-        }
+        scope = _build_scope(
+            "GET", path, [(b"accept", b"text/event-stream")], self._with_cookies(headers)
+        )
 
         # Disconnect control: blocks receive() until we want to disconnect.
         # Key invariant: setting disconnect_trigger causes monitor_disconnect()
@@ -352,32 +394,7 @@ class TestClient:
         body: bytes | None = None,
     ) -> Response:
         """Send an arbitrary request through the ASGI app."""
-        # Split path and query string
-        if "?" in path:
-            path_part, query_string = path.split("?", 1)
-        else:
-            path_part = path
-            query_string = ""
-
-        # Build raw ASGI headers
-        raw_headers: list[tuple[bytes, bytes]] = []
-        for name, value in (headers or {}).items():
-            raw_headers.append((name.lower().encode("latin-1"), value.encode("latin-1")))
-
-        # Build ASGI scope
-        scope: dict[str, Any] = {
-            "type": "http",
-            "asgi": {"version": "3.0"},
-            "http_version": "1.1",
-            "method": method.upper(),
-            "path": path_part,
-            "raw_path": path_part.encode("latin-1"),
-            "query_string": query_string.encode("latin-1"),
-            "root_path": "",
-            "headers": raw_headers,
-            "server": ("testserver", 80),
-            "client": ("127.0.0.1", 0),
-        }
+        scope = _build_scope(method.upper(), path, [], self._with_cookies(headers))
 
         # Build receive callable
         request_body = body or b""
@@ -424,6 +441,8 @@ class TestClient:
         extra_headers = [
             (n, v) for n, v in decoded if n != "content-type" and n != "content-length"
         ]
+        if self._persist_cookies:
+            self._store_cookies([v for n, v in extra_headers if n == "set-cookie"])
 
         return Response(
             body=body_bytes,
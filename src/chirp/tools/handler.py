@@ -10,15 +10,37 @@ Implements the minimal MCP surface for v1:
     - ``notifications/initialized`` — client acknowledgment (no-op)
     - ``tools/list`` — return registered tool schemas
     - ``tools/call`` — dispatch to tool handler, return result
+
+JSON encoding and decoding use ``orjson`` when it is installed
+(``pip install chirp[json]``) and fall back to stdlib ``json`` otherwise.
+Both encoders write the same bytes: compact separators, raw UTF-8,
+``str()`` for types JSON lacks (datetimes and dataclasses included), enum
+members as their value and non-finite floats as ``null``. Every response
+body, the pre-encoded ``tools/list`` result included, goes through them.
 """
 
+import contextlib
 import json as json_module
+import math
+from enum import Enum
 from typing import Any
 
 from chirp.http.request import Request
 from chirp.http.response import Response
 from chirp.tools.registry import ToolRegistry
 
+_HAS_ORJSON = False
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+    # Datetimes and dataclasses go through _default, as they do in stdlib
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:
+    pass
+
 # MCP protocol version
 _MCP_VERSION = "2024-11-05"
 
@@ -68,7 +90,7 @@ async def handle_mcp_request(
 
     # Parse JSON-RPC
     try:
-        rpc_request = json_module.loads(body)
+        rpc_request = _loads(body)
     except json_module.JSONDecodeError:
         return _json_response(
             400,
@@ -112,6 +134,10 @@ async def handle_mcp_request(
     if is_notification:
         return _handle_notification(rpc_method)
 
+    # Tool schemas are frozen at startup — splice the pre-encoded result
+    if rpc_method == "tools/list":
+        return _encoded_result_response(registry.tools_list_json, rpc_id)
+
     # Dispatch to MCP methods
     result = await _dispatch(rpc_method, params, registry=registry)
 
@@ -157,8 +183,6 @@ async def _dispatch(
     """Route a JSON-RPC method to the appropriate handler."""
     if method == "initialize":
         return _handle_initialize(params)
-    if method == "tools/list":
-        return _handle_tools_list(registry)
     if method == "tools/call":
         return await _handle_tools_call(params, registry)
 
@@ -174,11 +198,6 @@ def _handle_initialize(params: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _handle_tools_list(registry: ToolRegistry) -> dict[str, Any]:
-    """Handle MCP ``tools/list`` — return registered tool schemas."""
-    return {"tools": registry.list_tools()}
-
-
 async def _handle_tools_call(
     params: dict[str, Any],
     registry: ToolRegistry,
@@ -212,7 +231,7 @@ def _format_result(result: Any) -> dict[str, Any]:
     if isinstance(result, str):
         return {"type": "text", "text": result}
     if isinstance(result, dict | list):
-        return {"type": "text", "text": json_module.dumps(result, default=str)}
+        return {"type": "text", "text": _dumps(result).decode("utf-8")}
     # Fallback: convert to string
     return {"type": "text", "text": str(result)}
 
@@ -220,7 +239,60 @@ def _format_result(result: Any) -> dict[str, Any]:
 def _json_response(status: int, body: dict[str, Any]) -> Response:
     """Build a chirp Response with JSON content."""
     return Response(
-        body=json_module.dumps(body, default=str),
+        body=_dumps(body),
         status=status,
         content_type="application/json; charset=utf-8",
     )
+
+
+def _encoded_result_response(result_json: bytes, rpc_id: Any) -> Response:
+    """Build a JSON-RPC success Response around an already-encoded result."""
+    return Response(
+        body=b'{"jsonrpc":"2.0","result":' + result_json + b',"id":' + _dumps(rpc_id) + b"}",
+        status=200,
+        content_type="application/json; charset=utf-8",
+    )
+
+
+def _loads(body: bytes) -> Any:
+    """Decode a JSON request body (``orjson.JSONDecodeError`` subclasses stdlib's)."""
+    if _HAS_ORJSON:
+        return orjson.loads(body)
+    return json_module.loads(body)
+
+
+def _default(obj: Any) -> Any:
+    """Encode a value JSON has no type for, identically on both encoders."""
+    if isinstance(obj, Enum):
+        return obj.value  # orjson's native encoding of enum members
+    return str(obj)
+
+
+def _finite(obj: Any) -> Any:
+    """Copy *obj* with NaN and infinities replaced by ``None``."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, list | tuple):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode *obj* as compact UTF-8 JSON, stringifying unknown types."""
+    if _HAS_ORJSON:
+        # orjson rejects a few values stdlib accepts (e.g. ints wider than
+        # 64 bits) — those fall through to the stdlib encoder.
+        with contextlib.suppress(TypeError):
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    try:
+        text = json_module.dumps(
+            obj, default=_default, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        )
+    except ValueError:
+        # NaN / Infinity are not JSON; write null, as orjson does
+        text = json_module.dumps(
+            _finite(obj), default=_default, separators=(",", ":"), ensure_ascii=False
+        )
+    return text.encode("utf-8")
@@ -7,6 +7,7 @@ is the compiled lookup table (like ``Router``).
 Free-threading safety:
     - ToolDef is a frozen dataclass (immutable)
     - ToolRegistry._tools is a dict built at freeze time, never mutated
+    - The ``tools/list`` payload is encoded once at freeze time and shared
     - ToolEventBus handles its own synchronization
 """
 
@@ -40,7 +41,7 @@ class ToolRegistry:
     for MCP ``tools/call`` dispatch.
     """
 
-    __slots__ = ("_event_bus", "_tools")
+    __slots__ = ("_event_bus", "_tools", "_tools_list", "_tools_list_json")
 
     def __init__(
         self,
@@ -49,10 +50,9 @@ class ToolRegistry:
     ) -> None:
         self._tools: dict[str, ToolDef] = {t.name: t for t in tools}
         self._event_bus = event_bus
-
-    def list_tools(self) -> list[dict[str, Any]]:
-        """Return MCP-formatted tool list for ``tools/list`` response."""
-        return [
+        # Schemas are fixed once compiled — build and encode the
+        # ``tools/list`` result up front instead of on every request.
+        self._tools_list: list[dict[str, Any]] = [
             {
                 "name": tool.name,
                 "description": tool.description,
@@ -60,6 +60,19 @@ class ToolRegistry:
             }
             for tool in self._tools.values()
         ]
+        # Encoded like every other MCP response body (see chirp.tools.handler)
+        from chirp.tools.handler import _dumps
+
+        self._tools_list_json = _dumps({"tools": self._tools_list})
+
+    def list_tools(self) -> list[dict[str, Any]]:
+        """Return MCP-formatted tool list for ``tools/list`` response."""
+        return list(self._tools_list)
+
+    @property
+    def tools_list_json(self) -> bytes:
+        """Pre-encoded ``tools/list`` result object (``{"tools": [...]}``)."""
+        return self._tools_list_json
 
     async def call_tool(
         self,
@@ -0,0 +1,234 @@
+"""Tests for LLM provider plumbing (chirp.ai._providers)."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+
+from chirp import App
+from chirp.ai import LLM, ProviderError
+from chirp.ai._providers import (
+    _CONTINUE_PROMPT,
+    _clients,
+    _get_client,
+    _iter_sse_events,
+    aclose_clients,
+    openai_stream,
+    parse_provider,
+)
+
+
+async def _dummy_receive() -> dict[str, Any]:
+    return {"type": "http.disconnect"}
+
+
+async def _dummy_send(message: dict[str, Any]) -> None:
+    pass
+
+
+class TestClientPool:
+    def test_worker_shutdown_closes_each_loops_clients(self) -> None:
+        app = App()
+
+        @app.route("/")
+        def index():
+            return "ok"
+
+        config = parse_provider("openai:gpt-4o", api_key="k")
+
+        async def worker() -> tuple[Any, asyncio.AbstractEventLoop]:
+            client = _get_client(config)
+            assert _get_client(config) is client
+            await app(
+                {"type": "pounce.worker.shutdown", "worker_id": 0},
+                _dummy_receive,
+                _dummy_send,
+            )
+            return client, asyncio.get_running_loop()
+
+        first, first_loop = asyncio.run(worker())
+        assert first.is_closed
+        assert first_loop not in _clients
+
+        second, second_loop = asyncio.run(worker())
+        assert second is not first
+        assert second.is_closed
+        assert second_loop not in _clients
+
+    def test_closed_loops_are_dropped_on_next_use(self) -> None:
+        config = parse_provider("openai:gpt-4o", api_key="k")
+
+        async def use_pool() -> asyncio.AbstractEventLoop:
+            _get_client(config)
+            return asyncio.get_running_loop()
+
+        first_loop = asyncio.run(use_pool())
+        second_loop = asyncio.run(use_pool())
+        try:
+            assert list(_clients) == [second_loop]
+            assert first_loop not in _clients
+        finally:
+            _clients.pop(second_loop, None)
+
+
+def _sse(*events: dict[str, Any], done: bool = False) -> bytes:
+    frames = b"".join(b"data: " + json.dumps(event).encode() + b"\n\n" for event in events)
+    return frames + (b"data: [DONE]\n\n" if done else b"")
+
+
+def _anthropic_delta(text: str) -> dict[str, Any]:
+    return {"type": "content_block_delta", "delta": {"type": "text_delta", "text": text}}
+
+
+def _openai_delta(text: str) -> dict[str, Any]:
+    return {"choices": [{"delta": {"content": text}}]}
+
+
+class _Body(httpx.AsyncByteStream):
+    """A response body that can end in a dropped connection."""
+
+    def __init__(self, chunks: list[bytes], *, drop: bool) -> None:
+        self._chunks = chunks
+        self._drop = drop
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self._chunks:
+            yield chunk
+        if self._drop:
+            raise httpx.RemoteProtocolError("peer closed connection")
+
+
+class _Provider:
+    """Mock provider: each request gets the next scripted ``(chunks, drop)`` reply."""
+
+    def __init__(self, *replies: tuple[list[bytes], bool], status: int = 200) -> None:
+        self.replies = list(replies)
+        self.status = status
+        self.bodies: list[dict[str, Any]] = []
+
+    def install(self, base_url: str) -> None:
+        """Put a client for this mock in the running loop's pool."""
+        transport = httpx.MockTransport(self._handle)
+        client = httpx.AsyncClient(base_url=base_url, transport=transport)
+        _clients[asyncio.get_running_loop()] = {base_url: client}
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.bodies.append(json.loads(request.content))
+        if self.status != 200:
+            return httpx.Response(self.status, content=b"overloaded")
+        chunks, drop = self.replies.pop(0)
+        return httpx.Response(200, stream=_Body(chunks, drop=drop))
+
+
+async def _collect(tokens: AsyncIterator[str]) -> list[str]:
+    return [token async for token in tokens]
+
+
+class TestResilientStream:
+    @pytest.fixture(autouse=True)
+    async def _close_pool(self) -> AsyncIterator[None]:
+        yield
+        await aclose_clients()
+
+    async def test_drop_raises_by_default(self) -> None:
+        llm = LLM("anthropic:claude-test", api_key="k")
+        provider = _Provider(([_sse(_anthropic_delta("Hello "))], True))
+        provider.install("https://api.anthropic.com")
+        tokens = llm.stream("hi")
+        assert await anext(tokens) == "Hello "
+        with pytest.raises(httpx.RemoteProtocolError):
+            await anext(tokens)
+        assert len(provider.bodies) == 1
+
+    async def test_anthropic_resumes_from_prefill(self) -> None:
+        llm = LLM("anthropic:claude-test", api_key="k", max_resumes=1)
+        provider = _Provider(
+            ([_sse(_anthropic_delta("Hello "))], True),
+            ([_sse(_anthropic_delta(" world"), _anthropic_delta("!"))], False),
+        )
+        provider.install("https://api.anthropic.com")
+        tokens = await _collect(llm.stream("hi"))
+        # The prefill is sent stripped; the repeated space is not sent twice
+        assert "".join(tokens) == "Hello world!"
+        first, second = provider.bodies
+        assert second["messages"] == [
+            *first["messages"],
+            {"role": "assistant", "content": "Hello"},
+        ]
+
+    async def test_openai_resumes_with_continue_turn(self) -> None:
+        config = parse_provider("openai:gpt-test", api_key="k")
+        provider = _Provider(
+            ([_sse(_openai_delta("One, "))], True),
+            ([_sse(_openai_delta("two."), done=True)], False),
+        )
+        provider.install(config.base_url)
+        messages = ({"role": "user", "content": "count"},)
+        tokens = await _collect(openai_stream(config, messages, max_resumes=2))
+        assert tokens == ["One, ", "two."]
+        assert provider.bodies[1]["messages"] == [
+            {"role": "user", "content": "count"},
+            {"role": "assistant", "content": "One, "},
+            {"role": "user", "content": _CONTINUE_PROMPT},
+        ]
+
+    async def test_gives_up_after_max_resumes(self) -> None:
+        config = parse_provider("openai:gpt-test", api_key="k")
+        provider = _Provider(*[([_sse(_openai_delta("x"))], True)] * 3)
+        provider.install(config.base_url)
+        messages = ({"role": "user", "content": "go"},)
+        with pytest.raises(httpx.RemoteProtocolError):
+            await _collect(openai_stream(config, messages, max_resumes=2))
+        assert len(provider.bodies) == 3
+
+    async def test_http_errors_are_not_retried(self) -> None:
+        config = parse_provider("openai:gpt-test", api_key="k")
+        provider = _Provider(status=529)
+        provider.install(config.base_url)
+        messages = ({"role": "user", "content": "go"},)
+        with pytest.raises(ProviderError):
+            await _collect(openai_stream(config, messages, max_resumes=2))
+        assert len(provider.bodies) == 1
+
+
+class _Chunks:
+    """Just enough of an ``httpx.Response`` for ``_iter_sse_events``."""
+
+    def __init__(self, *chunks: bytes) -> None:
+        self._chunks = chunks
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        for chunk in self._chunks:
+            yield chunk
+
+
+async def _events(*chunks: bytes) -> list[Any]:
+    return [event async for event in _iter_sse_events(_Chunks(*chunks))]
+
+
+class TestIterSSEEvents:
+    async def test_payload_split_across_chunks(self) -> None:
+        events = await _events(b'data: {"a"', b": 1}\n", b'\ndata: {"b": 2}\n\n')
+        assert events == [{"a": 1}, {"b": 2}]
+
+    async def test_crlf_line_endings(self) -> None:
+        events = await _events(b'event: x\r\ndata: {"a": 1}\r', b'\n\r\ndata: {"b": 2}\r\n\r\n')
+        assert events == [{"a": 1}, {"b": 2}]
+
+    async def test_bare_cr_line_endings(self) -> None:
+        assert await _events(b'data: {"a": 1}\r\rdata: {"b": 2}\r\r') == [{"a": 1}, {"b": 2}]
+
+    async def test_done_ends_the_stream(self) -> None:
+        events = await _events(b'data: {"a": 1}\n\ndata: [DONE]\n\ndata: {"b": 2}\n\n')
+        assert events == [{"a": 1}]
+
+    async def test_last_line_without_newline_is_parsed(self) -> None:
+        assert await _events(b'data: {"a": 1}\n\n', b'data: {"b": 2}') == [{"a": 1}, {"b": 2}]
+        assert await _events(b'data: {"a": 1}\n\ndata: [DONE]') == [{"a": 1}]
+
+    async def test_comments_and_invalid_json_skipped(self) -> None:
+        events = await _events(b": ping\n\nevent: delta\ndata: oops\n\n", b'data: {"a": 1}\n\n')
+        assert events == [{"a": 1}]
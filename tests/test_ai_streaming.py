@@ -0,0 +1,204 @@
+"""Tests for AI streaming helpers (chirp.ai.streaming)."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from chirp.ai.streaming import (
+    _PREFETCH_TOKENS,
+    _coalesce,
+    _MarkdownUnits,
+    extract_markdown_units,
+    stream_to_fragments,
+    stream_with_sources,
+)
+from chirp.realtime.events import SSEEvent
+from chirp.templating.returns import Fragment
+
+
+async def _tokens(*tokens: str) -> AsyncIterator[str]:
+    for token in tokens:
+        yield token
+
+
+async def _batches(tokens: AsyncIterator[str], flush_interval_ms: float) -> list[list[str]]:
+    return [list(batch) async for batch in _coalesce(tokens, flush_interval_ms)]
+
+
+_WORDS = [f"w{i} " for i in range(100)]
+
+
+class TestCoalesce:
+    async def test_first_token_alone_then_budget_grows_to_cap(self) -> None:
+        # A long interval leaves the token budget as the only flush trigger
+        batches = await _batches(_tokens(*_WORDS), 10_000)
+        assert batches[0] == ["w0 "]
+        assert [len(batch) for batch in batches] == [1, 3, 9, 27, 27, 27, 6]
+
+    async def test_leftover_flushed_at_end_of_stream(self) -> None:
+        batches = await _batches(_tokens("a", "b", "c", "d", "e"), 10_000)
+        assert batches == [["a"], ["b", "c", "d"], ["e"]]
+
+    async def test_zero_interval_yields_each_token(self) -> None:
+        assert await _batches(_tokens("a", "b", "c"), 0) == [["a"], ["b"], ["c"]]
+
+    async def test_fragments_join_to_the_per_token_text(self) -> None:
+        batched = [f async for f in stream_to_fragments(_tokens(*_WORDS), "t.html", "b")]
+        single = [
+            f
+            async for f in stream_to_fragments(_tokens(*_WORDS), "t.html", "b", flush_interval_ms=0)
+        ]
+        assert len(single) == len(_WORDS)
+        assert len(batched) < len(single)
+        assert batched[-1].context["text"] == single[-1].context["text"] == "".join(_WORDS)
+        # Every batched update is one of the per-token texts
+        assert {f.context["text"] for f in batched} <= {f.context["text"] for f in single}
+
+
+class TestExtractMarkdownUnits:
+    def test_empty(self) -> None:
+        assert extract_markdown_units("") == ("", "")
+
+    def test_single_partial_line(self) -> None:
+        assert extract_markdown_units("Hello wor") == ("", "Hello wor")
+
+    def test_splits_at_last_newline(self) -> None:
+        assert extract_markdown_units("# Title\nSome text\nmore") == (
+            "# Title\nSome text",
+            "more",
+        )
+
+    def test_trailing_newline_leaves_nothing_in_progress(self) -> None:
+        assert extract_markdown_units("one\ntwo\n") == ("one\ntwo", "")
+
+    def test_unclosed_fence_holds_everything(self) -> None:
+        buffer = "Intro\n```python\nx = 1\n"
+        assert extract_markdown_units(buffer) == ("", buffer)
+
+    def test_closed_fence_is_complete(self) -> None:
+        buffer = "Intro\n```python\nx = 1\n```\nAfter"
+        assert extract_markdown_units(buffer) == ("Intro\n```python\nx = 1\n```", "After")
+
+    def test_indented_fence_counts(self) -> None:
+        buffer = "- item\n  ```\n  code\n"
+        assert extract_markdown_units(buffer) == ("", buffer)
+
+    def test_inline_backticks_are_not_fences(self) -> None:
+        assert extract_markdown_units("Use ```x``` inline\nnext") == (
+            "Use ```x``` inline",
+            "next",
+        )
+
+
+class TestMarkdownUnitsIncremental:
+    def test_matches_full_scan_on_every_prefix(self) -> None:
+        doc = "# Title\nIntro `x`\n  ```py\ncode ``` here\n```\nafter\n\n```\nopen"
+        for step in (1, 2, 5):
+            units = _MarkdownUnits()
+            for end in range(0, len(doc) + 1, step):
+                buffer = doc[:end]
+                split = units.split_at(buffer)
+                got = (buffer[:split], buffer[split + 1 :]) if split != -1 else ("", buffer)
+                assert got == extract_markdown_units(buffer), buffer
+
+
+class TestStreamWithSourcesAppendMode:
+    async def test_sends_each_rendered_unit_once(self) -> None:
+        fragments = [
+            frag
+            async for frag in stream_with_sources(
+                _tokens("one\ntw", "o\nthr", "ee"),
+                "ask.html",
+                response_block="answer",
+                chunk_renderer=lambda md: f"<p>{md.strip()}</p>",
+                append_mode=True,
+                in_progress_block="tail",
+                flush_interval_ms=0,
+            )
+        ]
+        deltas = [f for f in fragments if isinstance(f, SSEEvent)]
+        assert [(d.event, d.data) for d in deltas] == [
+            ("answer", "<p>one</p>"),
+            ("answer", "<p>two</p>"),
+        ]
+        tails = [
+            f.context["in_progress"]
+            for f in fragments
+            if isinstance(f, Fragment) and f.block_name == "tail"
+        ]
+        assert tails == ["tw", "thr", "three", ""]
+        final = [f for f in fragments if isinstance(f, Fragment) and f.block_name == "answer"]
+        assert [f.context["text"] for f in final] == ["one\ntwo\nthree"]
+        assert final[0].context["streaming"] is False
+
+    def test_requires_chunk_renderer(self) -> None:
+        with pytest.raises(ValueError, match="chunk_renderer"):
+            stream_with_sources(_tokens("x"), "ask.html", append_mode=True)
+
+
+class TestCoalescePrefetch:
+    async def test_provider_error_raised_after_received_tokens_flush(self) -> None:
+        async def failing() -> AsyncIterator[str]:
+            yield "a"
+            yield "b"
+            raise RuntimeError("provider dropped")
+
+        fragments = stream_to_fragments(failing(), "t.html", "b", flush_interval_ms=10_000)
+        assert (await anext(fragments)).context["text"] == "a"
+        assert (await anext(fragments)).context["text"] == "ab"
+        with pytest.raises(RuntimeError, match="provider dropped"):
+            await anext(fragments)
+
+    async def test_aclose_cancels_the_producer(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def endless() -> AsyncIterator[str]:
+            try:
+                yield "a"
+                await asyncio.Event().wait()
+                yield "never"
+            finally:
+                cancelled.set()
+
+        fragments = stream_to_fragments(endless(), "t.html", "b")
+        assert (await anext(fragments)).context["text"] == "a"
+        await fragments.aclose()
+        assert cancelled.is_set()
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    async def test_pause_flushes_held_batch_when_interval_expires(self) -> None:
+        resume = asyncio.Event()
+
+        async def pausing() -> AsyncIterator[str]:
+            yield "a"
+            yield "b"
+            await resume.wait()
+            yield "c"
+
+        fragments = stream_to_fragments(pausing(), "t.html", "b", flush_interval_ms=20)
+        assert (await anext(fragments)).context["text"] == "a"
+        # "b" is held below the token budget; the interval alone releases it
+        held = await asyncio.wait_for(anext(fragments), timeout=5)
+        assert held.context["text"] == "ab"
+        resume.set()
+        assert [f.context["text"] async for f in fragments] == ["abc"]
+
+    async def test_full_queue_applies_backpressure(self) -> None:
+        pulled = 0
+
+        async def counting() -> AsyncIterator[str]:
+            nonlocal pulled
+            for token in _WORDS * 5:
+                pulled += 1
+                yield token
+
+        fragments = stream_to_fragments(counting(), "t.html", "b")
+        await anext(fragments)
+        for _ in range(20):
+            await asyncio.sleep(0)
+        # One token rendered, a full queue, and one waiting to be put
+        assert pulled == _PREFETCH_TOKENS + 2
+        last = [f async for f in fragments][-1]
+        assert pulled == len(_WORDS) * 5
+        assert last.context["text"] == "".join(_WORDS * 5)
@@ -0,0 +1,125 @@
+"""Tests for incremental structured output parsing (chirp.ai._structured_stream)."""
+
+import json
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import Any
+
+import pytest
+
+from chirp.ai import LLM
+from chirp.ai._structured_stream import PartialJSON, partial_instance
+from chirp.ai.errors import StructuredOutputError
+
+
+def _snapshots(text: str, chunk_size: int = 1) -> list[object]:
+    """Feed *text* in chunks and return each distinct snapshot in order."""
+    parser = PartialJSON()
+    seen: list[object] = []
+    for i in range(0, len(text), chunk_size):
+        parser.feed(text[i : i + chunk_size])
+        snapshot = parser.snapshot()
+        if snapshot is not None and (not seen or snapshot != seen[-1]):
+            seen.append(snapshot)
+    return seen
+
+
+class TestPartialJSON:
+    def test_final_snapshot_matches_full_parse(self) -> None:
+        doc = '{"title": "Hi \\u00e9 \\"q\\"", "n": 12, "tags": ["a", "bc"], "sub": {"x": null}}'
+        for chunk_size in (1, 3, 7, len(doc)):
+            assert _snapshots(doc, chunk_size)[-1] == json.loads(doc)
+
+    def test_strings_only_grow(self) -> None:
+        titles = [s["title"] for s in _snapshots('{"title": "hello"}') if "title" in s]
+        assert titles == ["", "h", "he", "hel", "hell", "hello"]
+
+    def test_numbers_and_keys_appear_complete(self) -> None:
+        snapshots = _snapshots('{"count": 1234, "ok": true}')
+        assert {"count": 1} not in snapshots
+        assert snapshots == [{}, {"count": 1234}, {"count": 1234, "ok": True}]
+
+    def test_arrays_grow_at_tail(self) -> None:
+        snapshots = _snapshots('{"xs": [1, 22, 3]}')
+        assert [s["xs"] for s in snapshots if "xs" in s] == [[], [1], [1, 22], [1, 22, 3]]
+
+    def test_pending_escape_is_not_exposed(self) -> None:
+        parser = PartialJSON()
+        parser.feed('{"t": "a\\u00')
+        assert parser.snapshot() == {"t": "a"}
+        parser.feed('e9"}')
+        assert parser.snapshot() == {"t": "aé"}
+
+    def test_surrogate_pair_appears_whole(self) -> None:
+        doc = '{"t": "hi \\ud83d\\ude00 there"}'
+        texts = [s["t"] for s in _snapshots(doc) if "t" in s]
+        for text in texts:
+            text.encode("utf-8")  # no lone surrogate
+        assert all(b.startswith(a) for a, b in pairwise(texts))
+        assert texts[-1] == "hi \U0001f600 there"
+
+    def test_surrounding_text_ignored(self) -> None:
+        parser = PartialJSON()
+        parser.feed('Sure:\n```json\n{"a": 1}\n```\nDone {"b": 2}')
+        assert parser.done
+        assert parser.snapshot() == {"a": 1}
+
+    def test_no_snapshot_before_json_starts(self) -> None:
+        parser = PartialJSON()
+        parser.feed("Thinking...")
+        assert parser.snapshot() is None
+
+
+@dataclass(frozen=True, slots=True)
+class _Summary:
+    title: str
+    score: int
+    tags: list[str]
+    note: str = "n/a"
+
+
+class TestPartialInstance:
+    def test_missing_fields_get_empty_values(self) -> None:
+        summary = partial_instance(_Summary, {"title": "Hi"})
+        assert summary == _Summary(title="Hi", score=0, tags=[])
+
+    def test_unknown_keys_dropped(self) -> None:
+        summary = partial_instance(_Summary, {"title": "Hi", "bogus": 1, "note": "x"})
+        assert summary.note == "x"
+        assert not hasattr(summary, "bogus")
+
+
+def _llm_replying(text: str) -> LLM:
+    """An ``LLM`` whose provider streams *text* one character at a time."""
+
+    async def stream(config: Any, messages: Any, **kwargs: Any) -> AsyncIterator[str]:
+        for ch in text:
+            yield ch
+
+    llm = LLM("openai:gpt-4o", api_key="k")
+    llm._stream_fn = stream
+    return llm
+
+
+class TestStreamStructured:
+    async def test_instances_fill_in_then_final_parse(self) -> None:
+        llm = _llm_replying('{"title": "Hi", "score": 7, "tags": ["a", "b"]}')
+        results = [s async for s in llm.stream_structured(_Summary, prompt="p")]
+        assert results[0] == _Summary(title="", score=0, tags=[])
+        assert _Summary(title="H", score=0, tags=[]) in results
+        assert _Summary(title="Hi", score=7, tags=["a"]) in results
+        assert results[-1] == _Summary(title="Hi", score=7, tags=["a", "b"])
+        titles = [r.title for r in results]
+        assert all(b.startswith(a) for a, b in pairwise(titles))
+
+    async def test_text_after_json_is_ignored(self) -> None:
+        llm = _llm_replying('```json\n{"title": "Hi", "score": 1, "tags": []}\n```\nDone.')
+        results = [s async for s in llm.stream_structured(_Summary, prompt="p")]
+        assert results[-1] == _Summary(title="Hi", score=1, tags=[])
+
+    async def test_invalid_response_raises_after_partials(self) -> None:
+        partials = _llm_replying('{"title": "Hi"}').stream_structured(_Summary, prompt="p")
+        assert await anext(partials) == _Summary(title="", score=0, tags=[])
+        with pytest.raises(StructuredOutputError):
+            _ = [s async for s in partials]
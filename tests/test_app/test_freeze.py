@@ -18,6 +18,30 @@ class TestAppFreeze:
         assert app._frozen is True
         assert app._router is not None
 
+    def test_freeze_releases_setup_state(self) -> None:
+        app = App()
+
+        @app.route("/")
+        def index():
+            return "hello"
+
+        @app.template_filter()
+        def shout(value: str) -> str:
+            return value.upper()
+
+        async def passthrough(request, next):
+            return await next(request)
+
+        app.add_middleware(passthrough)
+        app._ensure_frozen()
+
+        assert app._pending_routes == []
+        assert app._middleware_list == []
+        assert app._template_filters == {}
+        assert app._router.match("GET", "/") is not None
+        assert passthrough in app._middleware
+        assert app._kida_env.filters["shout"] is shout
+
     def test_freeze_marks_contracts_ready(self) -> None:
         app = App()
 
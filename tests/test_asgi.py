@@ -36,15 +36,22 @@ class TestHTTPScope:
         assert parsed.server == ("localhost", 8000)
         assert parsed.client == ("127.0.0.1", 54321)
 
-    def test_from_scope_headers_become_tuple(self) -> None:
+    def test_from_scope_headers_not_copied(self) -> None:
         raw_headers = [(b"content-type", b"text/html"), (b"accept", b"*/*")]
         scope = _make_scope(headers=raw_headers)
         parsed = HTTPScope.from_scope(scope)
 
-        assert isinstance(parsed.headers, tuple)
+        assert parsed.headers is raw_headers
         assert len(parsed.headers) == 2
         assert parsed.headers[0] == (b"content-type", b"text/html")
 
+    def test_from_scope_missing_required_key(self) -> None:
+        scope = _make_scope()
+        del scope["method"]
+
+        with pytest.raises(KeyError):
+            HTTPScope.from_scope(scope)
+
     def test_from_scope_defaults_for_missing_keys(self) -> None:
         minimal: dict[str, object] = {
             "type": "http",
@@ -62,7 +69,7 @@ class TestHTTPScope:
         assert parsed.server is None
         assert parsed.client is None
 
-    def test_frozen(self) -> None:
+    def test_immutable(self) -> None:
         scope = _make_scope()
         parsed = HTTPScope.from_scope(scope)
 
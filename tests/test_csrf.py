@@ -3,7 +3,7 @@
 import pytest
 
 from chirp import App
-from chirp.middleware.csrf import CSRFConfig, CSRFMiddleware, get_csrf_token
+from chirp.middleware.csrf import CSRFConfig, CSRFMiddleware, csrf_field, get_csrf_token
 from chirp.middleware.sessions import SessionConfig, SessionMiddleware
 from chirp.testing import TestClient
 from tests.helpers.auth import extract_session_cookie
@@ -50,6 +50,11 @@ def _make_app() -> App:
         token = get_csrf_token()
         return f"token={token}"
 
+    @app.route("/field")
+    def field_page():
+        first = csrf_field()
+        return f"same={first is csrf_field()} {first}"
+
     @app.route("/submit", methods=["POST"])
     async def submit(request):
         form = await request.form()
@@ -85,6 +90,23 @@ class TestCSRFTokenGeneration:
             assert token1 == token2  # Same session → same token
 
 
+class TestCSRFField:
+    async def test_field_memoized_within_request(self) -> None:
+        app = _make_app()
+        async with TestClient(app) as client:
+            response = await client.get("/field")
+            assert response.text.startswith("same=True ")
+            assert 'name="_csrf_token"' in response.text
+
+    async def test_field_not_shared_across_sessions(self) -> None:
+        app = _make_app()
+        async with TestClient(app) as client:
+            r1 = await client.get("/field")
+            r2 = await client.get("/field")
+            # No session cookie sent — each request gets a fresh token
+            assert r1.text != r2.text
+
+
 class TestCSRFValidation:
     async def test_post_without_token_rejected(self) -> None:
         app = _make_app()
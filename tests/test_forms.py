@@ -1,6 +1,7 @@
 """Tests for form data parsing, binding, and multipart."""
 
 from dataclasses import dataclass
+from urllib.parse import parse_qs
 
 import pytest
 
@@ -94,6 +95,18 @@ class TestUploadFile:
         await f.save(dest)
         assert dest.read_bytes() == b"hello"
 
+    async def test_save_large_file(self, tmp_path) -> None:
+        content = b"x" * (256 * 1024)
+        f = UploadFile(
+            filename="big.bin",
+            content_type="application/octet-stream",
+            size=len(content),
+            _content=content,
+        )
+        dest = tmp_path / "big.bin"
+        await f.save(dest)
+        assert dest.read_bytes() == content
+
     def test_repr(self) -> None:
         f = UploadFile(filename="photo.jpg", content_type="image/jpeg", size=1024, _content=b"x")
         assert "photo.jpg" in repr(f)
@@ -126,6 +139,12 @@ class TestParseUrlEncoded:
         assert form["q"] == "hello world"
         assert form["path"] == "/foo"
 
+    async def test_matches_stdlib_parse_qs(self) -> None:
+        body = b"a=1&&b=&c&a=x%26y&caf%C3%A9=cr%C3%A8me+br%C3%BBl%C3%A9e&d=%zz"
+        form = await parse_form_data(body, "application/x-www-form-urlencoded")
+        expected = parse_qs(body.decode("utf-8"), keep_blank_values=True)
+        assert {k: form.get_list(k) for k in form} == expected
+
 
 class TestParseUnsupported:
     async def test_unsupported_content_type(self) -> None:
@@ -189,6 +208,41 @@ class TestRequestForm:
             assert response.text == "val=value"
 
 
+class TestRequestFormFields:
+    async def test_urlencoded_fields(self) -> None:
+        app = App()
+
+        @app.route("/submit", methods=["POST"])
+        async def submit(request: Request):
+            text, tag, missing = await request.form_fields("text", "tag", "missing")
+            return f"{text!r}|{tag!r}|{missing!r}"
+
+        async with TestClient(app) as client:
+            response = await client.post(
+                "/submit",
+                body=b"tag=+&text=++Buy+milk%21+&text=second",
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            assert response.text == "'Buy milk!'|''|None"
+
+    async def test_falls_back_to_parsed_form(self) -> None:
+        app = App()
+
+        @app.route("/submit", methods=["POST"])
+        async def submit(request: Request):
+            form = await request.form()
+            (name,) = await request.form_fields("name")
+            return f"{form['name']}|{name}"
+
+        async with TestClient(app) as client:
+            response = await client.post(
+                "/submit",
+                body=b"name=+alice+",
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            assert response.text == " alice |alice"
+
+
 # ---------------------------------------------------------------------------
 # form_from() — dataclass binding
 # ---------------------------------------------------------------------------
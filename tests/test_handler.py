@@ -59,6 +59,31 @@ async def test_compile_middleware_chain_single_middleware(mock_request: Request)
     assert x_custom == "added"
 
 
+@pytest.mark.asyncio
+async def test_compile_middleware_chain_runs_in_registration_order(
+    mock_request: Request,
+) -> None:
+    calls: list[str] = []
+
+    async def dispatch(req: Request) -> Response:
+        calls.append("dispatch")
+        return Response(body=b"inner", content_type="text/plain")
+
+    def tracing(name: str):
+        async def mw(req: Request, next) -> Response:
+            calls.append(f"{name}:before")
+            resp = await next(req)
+            calls.append(f"{name}:after")
+            return resp
+
+        return mw
+
+    chain = compile_middleware_chain((tracing("outer"), tracing("inner")), dispatch)
+    result = await chain(mock_request)
+    assert result.body == b"inner"
+    assert calls == ["outer:before", "inner:before", "dispatch", "inner:after", "outer:after"]
+
+
 @pytest.mark.asyncio
 async def test_create_request_handler_returns_callable(mock_request: Request) -> None:
     router = Router()
@@ -56,6 +56,11 @@ class TestHeaders:
         assert h.get("x-missing") is None
         assert h.get("x-missing", "fallback") == "fallback"
 
+    def test_first_value_wins_for_duplicates(self) -> None:
+        h = _h(("Accept", "text/html"), ("accept", "*/*"))
+        assert h["accept"] == "text/html"
+        assert h.get("ACCEPT") == "text/html"
+
     def test_get_list(self) -> None:
         h = _h(("Set-Cookie", "a=1"), ("Set-Cookie", "b=2"), ("Accept", "*/*"))
         assert h.get_list("Set-Cookie") == ["a=1", "b=2"]
@@ -74,7 +79,13 @@ class TestHeaders:
 
     def test_satisfies_multivalue_mapping(self) -> None:
         h = _h(("A", "1"))
-        assert isinstance(h, MultiValueMapping)
+        view: MultiValueMapping = h  # structural match, checked statically
+        assert view.get_list("a") == ["1"]
+        assert view.get("a") == "1"
+
+    def test_multivalue_mapping_is_not_runtime_checkable(self) -> None:
+        with pytest.raises(TypeError):
+            isinstance(_h(), MultiValueMapping)
 
     def test_repr(self) -> None:
         h = _h(("Accept", "*/*"))
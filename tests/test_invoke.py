@@ -0,0 +1,83 @@
+"""Tests for chirp._internal.invoke — uniform sync/async handler calls."""
+
+import asyncio
+import types
+
+from chirp._internal.invoke import _is_awaitable, invoke
+
+
+def _sync_handler(name: str = "world") -> str:
+    return f"hello {name}"
+
+
+async def _async_handler(name: str = "world") -> str:
+    return f"hello {name}"
+
+
+async def _inner() -> str:
+    return "inner"
+
+
+def _returns_coroutine() -> object:
+    return _inner()
+
+
+@types.coroutine
+def _generator_coroutine():
+    yield
+    return "inner"
+
+
+def _returns_generator_coroutine() -> object:
+    return _generator_coroutine()
+
+
+def _plain_generator():
+    yield "chunk"
+
+
+class _CustomAwaitable:
+    def __await__(self):
+        return _inner().__await__()
+
+
+def test_is_awaitable_plain_values() -> None:
+    assert not _is_awaitable("ok")
+    assert not _is_awaitable(None)
+    assert not _is_awaitable({"a": 1})
+
+
+def test_is_awaitable_coroutine() -> None:
+    coro = _inner()
+    try:
+        assert _is_awaitable(coro)
+    finally:
+        coro.close()
+
+
+def test_is_awaitable_future_and_custom() -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        assert _is_awaitable(loop.create_future())
+    finally:
+        loop.close()
+    assert _is_awaitable(_CustomAwaitable())
+
+
+def test_is_awaitable_generator_coroutine() -> None:
+    assert _is_awaitable(_generator_coroutine())
+    assert not _is_awaitable(_plain_generator())
+
+
+async def test_invoke_sync_and_async() -> None:
+    assert await invoke(_sync_handler, name="a") == "hello a"
+    assert await invoke(_async_handler, name="b") == "hello b"
+    assert await invoke(_sync_handler, is_async=False, inline_sync=True) == "hello world"
+
+
+async def test_invoke_awaits_sync_handler_returning_awaitable() -> None:
+    assert await invoke(_returns_coroutine) == "inner"
+    assert await invoke(_returns_coroutine, inline_sync=True) == "inner"
+    assert await invoke(_CustomAwaitable, inline_sync=True) == "inner"
+    assert await invoke(_returns_generator_coroutine) == "inner"
+    assert await invoke(_returns_generator_coroutine, inline_sync=True) == "inner"
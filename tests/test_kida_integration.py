@@ -6,6 +6,9 @@ when routed through App -> handler -> negotiate -> kida.
 
 from pathlib import Path
 
+import pytest
+from kida.environment.exceptions import TemplateSyntaxError
+
 from chirp import App
 from chirp.config import AppConfig
 from chirp.http.request import Request
@@ -230,3 +233,47 @@ class TestMixedReturnTypes:
 
             frag_resp = await client.get("/fragment")
             assert_fragment_contains(frag_resp, '<div id="results">')
+
+
+class TestPrecompileTemplates:
+    """AppConfig.precompile_templates compiles the template tree at freeze."""
+
+    def _broken_dir(self, tmp_path: Path) -> Path:
+        (tmp_path / "ok.html").write_text("<p>{{ x }}</p>")
+        (tmp_path / "partials").mkdir()
+        (tmp_path / "partials" / "broken.html").write_text("{% if %}")
+        return tmp_path
+
+    def test_syntax_error_surfaces_at_freeze(self, tmp_path: Path) -> None:
+        app = App(
+            config=AppConfig(template_dir=self._broken_dir(tmp_path), precompile_templates=True)
+        )
+        with pytest.raises(TemplateSyntaxError):
+            app._ensure_frozen()
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        app = App(config=AppConfig(template_dir=self._broken_dir(tmp_path)))
+        app._ensure_frozen()
+
+    def test_skipped_in_debug(self, tmp_path: Path) -> None:
+        app = App(
+            config=AppConfig(
+                template_dir=self._broken_dir(tmp_path),
+                precompile_templates=True,
+                debug=True,
+                skip_contract_checks=True,
+            )
+        )
+        app._ensure_frozen()
+
+    async def test_precompiled_templates_render(self, tmp_path: Path) -> None:
+        (tmp_path / "page.html").write_text("<h1>{{ title }}</h1>")
+        app = App(config=AppConfig(template_dir=tmp_path, precompile_templates=True))
+
+        @app.route("/")
+        def index():
+            return Template("page.html", title="Home")
+
+        async with TestClient(app) as client:
+            response = await client.get("/")
+            assert "<h1>Home</h1>" in response.text
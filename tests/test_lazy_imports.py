@@ -30,6 +30,13 @@ def test_lazy_registry_no_extras() -> None:
     )
 
 
+def test_resolved_name_cached_on_module() -> None:
+    """A resolved name is stored on the module so __getattr__ runs once."""
+    value = chirp.__getattr__("Fragment")
+    assert chirp.__dict__["Fragment"] is value
+    assert chirp.Fragment is value
+
+
 def test_unknown_name_raises_attribute_error() -> None:
     """Accessing an unregistered name raises AttributeError."""
     with pytest.raises(AttributeError, match="no attribute"):
@@ -75,7 +75,9 @@ class TestQueryParams:
 
     def test_satisfies_multivalue_mapping(self) -> None:
         q = QueryParams(b"a=1")
-        assert isinstance(q, MultiValueMapping)
+        view: MultiValueMapping = q  # structural match, checked statically
+        assert view.get_list("a") == ["1"]
+        assert view.get("a") == "1"
 
     def test_repr(self) -> None:
         q = QueryParams(b"q=hello")
@@ -1,10 +1,13 @@
 """Tests for session middleware — signed cookie sessions."""
 
+from typing import Any
+
 import pytest
 
-from chirp import App
+from chirp import App, Response
 from chirp.errors import ConfigurationError
 from chirp.middleware.sessions import (
+    CookieSessionStore,
     SessionConfig,
     SessionMiddleware,
     get_session,
@@ -117,6 +120,108 @@ class TestSessionBasicOperations:
             assert r3.text == "visits=3"
 
 
+def _counter_app(**config: Any) -> App:
+    """Create a session app: ``/count`` counts visits, ``/remember`` and ``/forget``
+    set and delete a plain ``theme`` cookie."""
+    app = App()
+    app.add_middleware(SessionMiddleware(SessionConfig(secret_key="test-secret", **config)))
+
+    @app.route("/count")
+    def count():
+        session = get_session()
+        session["visits"] = session.get("visits", 0) + 1
+        return f"visits={session['visits']}"
+
+    @app.route("/remember")
+    def remember():
+        return Response("ok").with_cookie("theme", "dark")
+
+    @app.route("/forget")
+    def forget():
+        return Response("ok").without_cookie("theme")
+
+    return app
+
+
+class TestClientCookieJar:
+    async def test_persist_cookies_carries_session(self) -> None:
+        async with TestClient(_counter_app(), persist_cookies=True) as client:
+            assert (await client.get("/count")).text == "visits=1"
+            assert "chirp_session" in client.cookies
+            assert (await client.get("/count")).text == "visits=2"
+            assert (await client.get("/count")).text == "visits=3"
+
+    async def test_explicit_cookie_header_wins(self) -> None:
+        async with TestClient(_counter_app(), persist_cookies=True) as client:
+            await client.get("/count")
+            response = await client.get("/count", headers={"Cookie": "chirp_session=bogus"})
+            assert response.text == "visits=1"
+
+    async def test_max_age_zero_deletes_cookie(self) -> None:
+        async with TestClient(_counter_app(), persist_cookies=True) as client:
+            await client.get("/remember")
+            assert client.cookies["theme"].value == "dark"
+            await client.get("/forget")
+            assert "theme" not in client.cookies
+            assert "chirp_session" in client.cookies
+
+    async def test_cookies_not_persisted_by_default(self) -> None:
+        async with TestClient(_counter_app()) as client:
+            await client.get("/count")
+            assert (await client.get("/count")).text == "visits=1"
+            assert not client.cookies
+
+
+class TestCookieSessionCache:
+    async def test_cached_session_round_trips(self) -> None:
+        async with TestClient(_counter_app(cache_size=8), persist_cookies=True) as client:
+            assert (await client.get("/count")).text == "visits=1"
+            assert (await client.get("/count")).text == "visits=2"
+            assert (await client.get("/count")).text == "visits=3"
+
+    async def test_handler_mutation_does_not_leak_into_cache(self) -> None:
+        app = App()
+        app.add_middleware(SessionMiddleware(SessionConfig(secret_key="test-secret", cache_size=8)))
+
+        @app.route("/add")
+        def add():
+            session = get_session()
+            session.setdefault("items", []).append("x")
+            return f"items={len(session['items'])}"
+
+        async with TestClient(app) as client:
+            r1 = await client.get("/add")
+            cookie = extract_session_cookie(r1, "chirp_session")
+            headers = {"Cookie": f"chirp_session={cookie}"}
+            # Replaying the same cookie must see the same stored state each time.
+            assert (await client.get("/add", headers=headers)).text == "items=2"
+            assert (await client.get("/add", headers=headers)).text == "items=2"
+
+    async def test_cache_hit_matches_decoded_cookie(self) -> None:
+        app = App()
+        app.add_middleware(SessionMiddleware(SessionConfig(secret_key="test-secret", cache_size=8)))
+
+        @app.route("/set")
+        def set_session():
+            get_session()[5] = ("x",)
+            return "ok"
+
+        @app.route("/get")
+        def get_data():
+            return repr(get_session())
+
+        async with TestClient(app, persist_cookies=True) as client:
+            await client.get("/set")
+            # Served from the cache, but shaped exactly like a decoded cookie
+            assert (await client.get("/get")).text == "{'5': ['x']}"
+
+    def test_cache_is_bounded(self) -> None:
+        store = CookieSessionStore(SessionConfig(secret_key="test-secret", cache_size=2))
+        for i in range(5):
+            store._remember(f"cookie-{i}", 0.0, {"i": i})
+        assert list(store._cache) == ["cookie-3", "cookie-4"]
+
+
 class TestSessionSecurity:
     async def test_tampered_cookie_is_ignored(self) -> None:
         app = App()
@@ -11,6 +11,7 @@ from pathlib import Path
 import pytest
 
 from chirp import App
+from chirp.ai.streaming import stream_with_sources
 from chirp.config import AppConfig
 from chirp.realtime.events import EventStream, SSEEvent
 from chirp.templating.returns import Fragment
@@ -78,6 +79,27 @@ class TestBasicSSEStreaming:
         assert len(result.events) == 1
         assert result.events[0].data == "only-one"
 
+    async def test_bytes_events_sent_verbatim(self) -> None:
+        """Pre-framed bytes bypass formatting and the event type default."""
+        app = App()
+        frame = SSEEvent(data="line1\nline2", event="pre").encode().encode()
+
+        @app.route("/events")
+        def events():
+            async def gen():
+                yield frame
+                yield "after"
+
+            return EventStream(gen(), event_type="update")
+
+        async with TestClient(app) as client:
+            result = await client.sse("/events", max_events=2)
+
+        assert len(result.events) == 2
+        assert result.events[0].event == "pre"
+        assert result.events[0].data == "line1\nline2"
+        assert result.events[1].event == "update"
+
     async def test_default_event_type(self) -> None:
         """EventStream.event_type is applied to all string events."""
         app = App()
@@ -248,6 +270,57 @@ class TestFragmentSSE:
         assert "x" in evt.data
         assert "y" in evt.data
 
+    async def test_repeated_fragments_render_current_context(self) -> None:
+        """Later events reuse the resolved template but not the old context."""
+        app = _app()
+
+        @app.route("/events")
+        def events():
+            async def gen():
+                yield Fragment("search.html", "results_list", results=["first"])
+                yield Fragment("search.html", "results_list", results=["second"])
+
+            return EventStream(gen())
+
+        async with TestClient(app) as client:
+            result = await client.sse("/events", max_events=2)
+
+        assert len(result.events) == 2
+        assert "first" in result.events[0].data
+        assert "second" in result.events[1].data
+        assert "first" not in result.events[1].data
+
+    async def test_append_mode_deltas_skip_oob_wrapper(self) -> None:
+        """Append-mode deltas are raw HTML for the element's own beforeend swap."""
+        app = _app()
+
+        async def tokens():
+            yield "one\n"
+            yield "two"
+
+        @app.route("/events")
+        def events():
+            return EventStream(
+                stream_with_sources(
+                    tokens(),
+                    "ask.html",
+                    response_block="answer",
+                    chunk_renderer=lambda md: f"<p>{md}</p>",
+                    append_mode=True,
+                    flush_interval_ms=0,
+                )
+            )
+
+        async with TestClient(app) as client:
+            result = await client.sse("/events", max_events=2)
+
+        delta, final = result.events
+        assert delta.event == "answer"
+        assert delta.data == "<p>one</p>"
+        assert final.event == "answer"
+        assert final.data.startswith('<div id="answer" hx-swap-oob="true">')
+        assert "one\ntwo" in final.data
+
 
 # ---------------------------------------------------------------------------
 # Disconnect handling
@@ -486,7 +559,7 @@ class TestSSEPerEventErrorBoundary:
         def events():
             async def gen():
                 yield "before"
-                # Fragment with nonexistent template → render_fragment raises
+                # Fragment with nonexistent template → template lookup raises
                 yield Fragment("nonexistent.html", "missing", target="broken")
                 yield "after"
 
@@ -1,11 +1,16 @@
 """Tests for chirp.tools.handler — MCP JSON-RPC protocol handler."""
 
 import json
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum, StrEnum
 
 import pytest
 
 from chirp.http.request import Request
 from chirp.http.response import Response
+from chirp.tools import handler
 from chirp.tools.events import ToolEventBus
 from chirp.tools.handler import handle_mcp_request
 from chirp.tools.registry import ToolRegistry, compile_tools
@@ -114,6 +119,35 @@ class TestMCPHandler:
         assert "query" in schema["properties"]
         assert schema["properties"]["query"] == {"type": "string"}
 
+    @pytest.mark.asyncio
+    async def test_tools_list_echoes_string_id(self) -> None:
+        registry = self._make_registry()
+        request = _make_request(
+            body={"jsonrpc": "2.0", "method": "tools/list", "id": "req-7", "params": {}},
+        )
+        response = await handle_mcp_request(request, registry)
+        status, body = _parse_response(response)
+        assert status == 200
+        assert body["jsonrpc"] == "2.0"
+        assert body["id"] == "req-7"
+        assert body["result"] == {"tools": registry.list_tools()}
+
+    @pytest.mark.asyncio
+    async def test_tools_list_bytes_match_other_responses(self) -> None:
+        def describe() -> str:
+            return "ok"
+
+        registry = compile_tools([("describe", "Décrit l'état — ✓", describe)], ToolEventBus())
+        request = _make_request(
+            body={"jsonrpc": "2.0", "method": "tools/list", "id": 4, "params": {}},
+        )
+        response = await handle_mcp_request(request, registry)
+        expected = handler._dumps(
+            {"jsonrpc": "2.0", "result": {"tools": registry.list_tools()}, "id": 4}
+        )
+        assert response.body_bytes == expected
+        assert "Décrit l'état — ✓".encode() in expected
+
     @pytest.mark.asyncio
     async def test_tools_call(self) -> None:
         registry = self._make_registry()
@@ -246,3 +280,83 @@ class TestMCPHandler:
         )
         response = await handle_mcp_request(request, registry)
         assert response.status == 204
+
+    @pytest.mark.asyncio
+    async def test_tools_call_encodes_wide_ints_and_int_keys(self) -> None:
+        """Results stdlib json accepts encode the same with or without orjson."""
+
+        def big(n: int) -> dict:
+            return {"value": 2**n, 7: "int key"}
+
+        registry = compile_tools([("big", "Large numbers", big)], ToolEventBus())
+        request = _make_request(
+            body={
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "id": 9,
+                "params": {"name": "big", "arguments": {"n": 70}},
+            }
+        )
+        response = await handle_mcp_request(request, registry)
+        status, body = _parse_response(response)
+        assert status == 200
+        result = json.loads(body["result"]["content"][0]["text"])
+        assert result == {"value": 2**70, "7": "int key"}
+
+
+class _Color(Enum):
+    RED = 1
+
+
+class _Size(StrEnum):
+    SMALL = "s"
+
+
+@dataclass(frozen=True, slots=True)
+class _Point:
+    x: int
+    y: float
+
+
+_ENCODER_VALUES = {
+    "datetime": datetime(2024, 1, 2, 3, 4, 5),
+    "date": date(2024, 1, 2),
+    "dataclass": _Point(1, 2.5),
+    "enum": _Color.RED,
+    "str_enum": _Size.SMALL,
+    "uuid": uuid.UUID(int=1),
+    "nan": float("nan"),
+    "infinity": float("-inf"),
+    "wide_int": 2**70,
+    "non_ascii": "café → ✓",
+    "nested": {"when": [datetime(2024, 1, 2)], 3: (_Color.RED, 1.5)},
+}
+
+
+class TestJSONEncoders:
+    """Tool results encode the same with or without the orjson extra."""
+
+    @pytest.mark.parametrize("value", _ENCODER_VALUES.values(), ids=_ENCODER_VALUES.keys())
+    def test_orjson_matches_stdlib(self, value: object, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("orjson")
+        assert handler._HAS_ORJSON
+        with_orjson = handler._dumps({"value": value, "list": [value]})
+        monkeypatch.setattr(handler, "_HAS_ORJSON", False)
+        assert handler._dumps({"value": value, "list": [value]}) == with_orjson
+
+    def test_stdlib_fallback_writes_valid_json(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(handler, "_HAS_ORJSON", False)
+        encoded = handler._dumps(
+            {
+                "nan": float("nan"),
+                "when": datetime(2024, 1, 2),
+                "color": _Color.RED,
+                "p": _Point(1, 2),
+            }
+        )
+        assert json.loads(encoded) == {
+            "nan": None,
+            "when": "2024-01-02 00:00:00",
+            "color": 1,
+            "p": "_Point(x=1, y=2)",
+        }
@@ -1,5 +1,6 @@
 """Tests for chirp.tools.registry — ToolDef, ToolRegistry, compile_tools."""
 
+import json
 from typing import Any
 
 import pytest
@@ -67,6 +68,15 @@ class TestToolRegistry:
             assert "inputSchema" in tool
             assert tool["inputSchema"]["type"] == "object"
 
+    def test_tools_list_json_matches_list_tools(self) -> None:
+        registry = self._make_registry()
+        assert json.loads(registry.tools_list_json) == {"tools": registry.list_tools()}
+
+    def test_list_tools_returns_fresh_list(self) -> None:
+        registry = self._make_registry()
+        registry.list_tools().clear()
+        assert len(registry.list_tools()) == 2
+
     def test_contains(self) -> None:
         registry = self._make_registry()
         assert "search" in registry